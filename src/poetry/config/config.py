@@ -147,6 +147,10 @@ _default_config: Config | None = None
 class Config:
     default_config: ClassVar[dict[str, Any]] = {
         "cache-dir": str(DEFAULT_CACHE_DIR),
+        "cache": {
+            "max-size": None,
+            "release-backend": "file",
+        },
         "data-dir": str(data_dir()),
         "virtualenvs": {
             "create": True,
@@ -174,6 +178,14 @@ class Config:
         "python": {"installation-dir": os.path.join("{data-dir}", "python")},
         "solver": {
             "lazy-wheel": True,
+            "dependency-cache-size": 128,
+            "prefetch-workers": 4,
+            "page-prefetch-workers": 8,
+            "parallel-sources": False,
+            "incremental-lock": False,
+            "conflict-cache": False,
+            "max-workers": 1,
+            "heuristic": "default",
         },
         "system-git-client": False,
         "keyring": {
@@ -387,6 +399,9 @@ class Config:
             "installer.re-resolve",
             "installer.parallel",
             "solver.lazy-wheel",
+            "solver.incremental-lock",
+            "solver.conflict-cache",
+            "solver.parallel-sources",
             "system-git-client",
             "keyring.enabled",
         }:
@@ -396,8 +411,13 @@ class Config:
             return lambda val: str(Path(val))
 
         if name in {
+            "cache.max-size",
             "installer.max-workers",
             "requests.max-retries",
+            "solver.dependency-cache-size",
+            "solver.prefetch-workers",
+            "solver.page-prefetch-workers",
+            "solver.max-workers",
         }:
             return int_normalizer
 
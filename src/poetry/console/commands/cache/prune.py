@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import ClassVar
+
+from cleo.helpers import option
+
+from poetry.config.config import Config
+from poetry.console.commands.command import Command
+
+
+if TYPE_CHECKING:
+    from cleo.io.inputs.option import Option
+
+
+class CachePruneCommand(Command):
+    name = "cache prune"
+    description = (
+        "Removes the least recently used entries of Poetry's caches"
+        " until they do not exceed a maximum size."
+    )
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "max-size",
+            None,
+            "The maximum size of the caches in MiB"
+            " (defaults to the <comment>cache.max-size</> setting).",
+            flag=False,
+        )
+    ]
+
+    def handle(self) -> int:
+        from poetry.mixology.incompatibility_cache import IncompatibilityCache
+        from poetry.utils.cache import CACHE_BACKENDS
+        from poetry.utils.cache import ArtifactCache
+        from poetry.utils.cache import prune
+
+        config = Config.create()
+        max_size = self.option("max-size") or config.get("cache.max-size")
+        if max_size is None:
+            self.line_error(
+                "<error>No maximum size given. Set <c1>cache.max-size</c1>"
+                " or use the <c1>--max-size</c1> option.</>"
+            )
+            return 1
+
+        try:
+            max_size = int(max_size)
+        except ValueError:
+            max_size = 0
+        if max_size <= 0:
+            self.line_error(
+                "<error>The maximum size must be a positive number of MiB.</>"
+            )
+            return 1
+
+        entries = ArtifactCache(cache_dir=config.artifacts_cache_directory).entries()
+        entries += IncompatibilityCache.entries(config)
+        if config.repository_cache_directory.exists():
+            backend = CACHE_BACKENDS[config.get("cache.release-backend")]
+            for cache_dir in sorted(config.repository_cache_directory.iterdir()):
+                # Directories starting with "_" (e.g. "_solver") are not caches
+                # of repositories and are not stored with the release backend.
+                if cache_dir.is_dir() and not cache_dir.name.startswith("_"):
+                    entries += backend(cache_dir).entries()
+
+        size = sum(entry.size for entry in entries)
+        removed = prune(entries, max_size * 2**20)
+        removed_size = sum(entry.size for entry in removed)
+        size -= removed_size
+
+        self.line(
+            f"Removed <info>{len(removed)}</> cache entries"
+            f" (<info>{removed_size / 2**20:.1f} MiB</>)."
+            f" The caches use <info>{size / 2**20:.1f} MiB</> now."
+        )
+        if size > max_size * 2**20:
+            self.line_error(
+                "<warning>The caches still exceed the maximum size because"
+                " the remaining entries have been used recently.</>"
+            )
+
+        return 0
@@ -74,8 +74,13 @@ To remove a repository (repo is a short alias for repositories):
 
     @property
     def unique_config_values(self) -> dict[str, tuple[Any, Any]]:
+        from poetry.mixology.heuristics import HEURISTICS
+        from poetry.utils.cache import CACHE_BACKENDS
+
         unique_config_values = {
             "cache-dir": (str, lambda val: str(Path(val))),
+            "cache.max-size": (lambda val: int(val) > 0, int_normalizer),
+            "cache.release-backend": (lambda val: val in CACHE_BACKENDS, str),
             "virtualenvs.create": (boolean_validator, boolean_normalizer),
             "virtualenvs.in-project": (boolean_validator, boolean_normalizer),
             "virtualenvs.options.always-copy": (boolean_validator, boolean_normalizer),
@@ -101,6 +106,20 @@ To remove a repository (repo is a short alias for repositories):
                 PackageFilterPolicy.normalize,
             ),
             "solver.lazy-wheel": (boolean_validator, boolean_normalizer),
+            "solver.incremental-lock": (boolean_validator, boolean_normalizer),
+            "solver.conflict-cache": (boolean_validator, boolean_normalizer),
+            "solver.parallel-sources": (boolean_validator, boolean_normalizer),
+            "solver.dependency-cache-size": (
+                lambda val: int(val) >= 0,
+                int_normalizer,
+            ),
+            "solver.prefetch-workers": (lambda val: int(val) >= 0, int_normalizer),
+            "solver.page-prefetch-workers": (
+                lambda val: int(val) >= 0,
+                int_normalizer,
+            ),
+            "solver.max-workers": (lambda val: int(val) > 0, int_normalizer),
+            "solver.heuristic": (lambda val: val in HEURISTICS, str),
             "keyring.enabled": (boolean_validator, boolean_normalizer),
         }
 
@@ -16,6 +16,8 @@ if TYPE_CHECKING:
     from cleo.io.inputs.option import Option
     from cleo.ui.table import Rows
 
+    from poetry.utils.profiler import Profiler
+
 
 class DebugResolveCommand(InitCommand):
     name = "debug resolve"
@@ -35,6 +37,28 @@ class DebugResolveCommand(InitCommand):
         option("python", None, "Python version(s) to use for resolution.", flag=False),
         option("tree", None, "Display the dependency tree."),
         option("install", None, "Show what would be installed for the current system."),
+        option(
+            "heuristic",
+            None,
+            "The heuristic used to choose the next package to resolve"
+            " (default, activity, recent-conflicts)."
+            " Defaults to the <comment>solver.heuristic</> setting.",
+            flag=False,
+        ),
+        option(
+            "profile",
+            None,
+            "Write a profile of the resolution (phase timings, decisions, backtracks,"
+            " network and cache hits) to the given file.",
+            flag=False,
+        ),
+        option(
+            "profile-format",
+            None,
+            "The format of the profile (json, speedscope).",
+            flag=False,
+            default="json",
+        ),
     ]
 
     loggers: ClassVar[list[str]] = [
@@ -43,14 +67,34 @@ class DebugResolveCommand(InitCommand):
     ]
 
     def handle(self) -> int:
+        from contextlib import nullcontext
+
         from cleo.io.null_io import NullIO
         from poetry.core.packages.project_package import ProjectPackage
 
         from poetry.factory import Factory
+        from poetry.mixology.heuristics import HEURISTICS
         from poetry.puzzle.solver import Solver
         from poetry.repositories.repository import Repository
         from poetry.repositories.repository_pool import RepositoryPool
         from poetry.utils.env import EnvManager
+        from poetry.utils.profiler import Profiler
+
+        profile_format = self.option("profile-format")
+        if profile_format not in ("json", "speedscope"):
+            self.line_error(
+                f"<error>Invalid profile format: {profile_format}."
+                " Use json or speedscope.</error>"
+            )
+            return 1
+
+        heuristic = self.option("heuristic")
+        if heuristic is not None and heuristic not in HEURISTICS:
+            self.line_error(
+                f"<error>Invalid heuristic: {heuristic}."
+                f" Use one of {', '.join(HEURISTICS)}.</error>"
+            )
+            return 1
 
         packages = self.argument("package")
 
@@ -89,9 +133,14 @@ class DebugResolveCommand(InitCommand):
 
         pool = self.poetry.pool
 
-        solver = Solver(package, pool, [], [], self.io)
+        solver = Solver(package, pool, [], [], self.io, heuristic=heuristic)
 
-        ops = solver.solve().calculate_operations()
+        profiler = Profiler()
+        with profiler.activate() if self.option("profile") else nullcontext():
+            ops = solver.solve().calculate_operations()
+
+        if self.option("profile"):
+            self._write_profile(profiler, profile_format)
 
         self.line("")
         self.line("Resolution results:")
@@ -126,7 +175,7 @@ class DebugResolveCommand(InitCommand):
 
             pool.add_repository(locked_repository)
 
-            solver = Solver(package, pool, [], [], NullIO())
+            solver = Solver(package, pool, [], [], NullIO(), heuristic=heuristic)
             with solver.use_environment(env):
                 ops = solver.solve().calculate_operations()
 
@@ -149,3 +198,27 @@ class DebugResolveCommand(InitCommand):
         table.render()
 
         return 0
+
+    def _write_profile(self, profiler: Profiler, profile_format: str) -> None:
+        import json
+
+        from pathlib import Path
+
+        summary = profiler.to_json()
+        if profile_format == "speedscope":
+            data = profiler.to_speedscope(
+                f"poetry debug resolve {self.poetry.package.name}"
+            )
+        else:
+            data = summary
+
+        path = Path(self.option("profile"))
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+        self.line("")
+        self.line(f"Resolution took <b>{summary['duration']:.3f}</b> seconds:")
+        for name, phase in summary["phases"].items():
+            self.line(f"  - {name}: {phase['self']:.3f}s ({phase['calls']} calls)")
+        for name, value in summary["counts"].items():
+            self.line(f"  - {name}: {value}")
+        self.line(f"Profile written to <c1>{path}</c1>")
@@ -16,6 +16,8 @@ from poetry.console.commands.group_command import GroupCommand
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from cleo.io.inputs.argument import Argument
     from cleo.io.inputs.option import Option
     from cleo.io.io import IO
@@ -293,6 +295,13 @@ lists all packages available."""
         installed_repo = InstalledRepository.load(self.env)
         requires = root.all_requires
 
+        if show_latest:
+            self._prefetch_pages(
+                locked
+                for locked in locked_packages
+                if locked in required_locked_packages or show_all
+            )
+
         # Computing widths
         for locked in locked_packages:
             if locked not in required_locked_packages and not show_all:
@@ -631,6 +640,23 @@ lists all packages available."""
             io.output.formatter.set_style(color, style)
             io.error_output.formatter.set_style(color, style)
 
+    def _prefetch_pages(self, packages: Iterable[Package]) -> None:
+        """
+        Fetches the pages of the given packages concurrently so that
+        their latest versions are found without a request for each package.
+        """
+        from poetry.repositories.page_prefetcher import PagePrefetcher
+
+        workers = self.poetry.config.get("solver.page-prefetch-workers")
+        if workers <= 0:
+            return
+
+        prefetcher = PagePrefetcher(self.poetry.pool, workers)
+        for package in packages:
+            if not package.is_direct_origin():
+                prefetcher.prefetch(package.name)
+        prefetcher.shutdown(cancel_pending=False)
+
     def find_latest_package(
         self, package: Package, root: ProjectPackage
     ) -> Package | None:
@@ -26,9 +26,9 @@ from poetry.installation.wheel_installer import WheelInstaller
 from poetry.puzzle.exceptions import SolverProblemError
 from poetry.utils._compat import decode
 from poetry.utils.authenticator import Authenticator
+from poetry.utils.cache import STORE_HASH_NAME
 from poetry.utils.env import EnvCommandError
 from poetry.utils.helpers import Downloader
-from poetry.utils.helpers import get_file_hash
 from poetry.utils.helpers import get_highest_priority_hash_type
 from poetry.utils.helpers import pluralize
 from poetry.utils.helpers import remove_directory
@@ -777,11 +777,9 @@ class Executor:
             archive_hash = self._validate_archive_hash(archive, package)
             self._hashes[package.name] = archive_hash
 
-    @staticmethod
-    def _validate_archive_hash(archive: Path, package: Package) -> str:
+    def _validate_archive_hash(self, archive: Path, package: Package) -> str:
         known_hashes = {f["hash"] for f in package.files if f["file"] == archive.name}
-        hash_types = {t.split(":")[0] for t in known_hashes}
-        hash_type = get_highest_priority_hash_type(hash_types, archive.name)
+        hash_type = self._get_hash_type(archive.name, package)
 
         if hash_type is None:
             raise RuntimeError(
@@ -789,7 +787,8 @@ class Executor:
                 f" {archive.name} found (known hashes: {known_hashes!s})"
             )
 
-        archive_hash = f"{hash_type}:{get_file_hash(archive, hash_type)}"
+        file_hash = self._artifact_cache.get_file_hash(archive, hash_type)
+        archive_hash = f"{hash_type}:{file_hash}"
 
         if archive_hash not in known_hashes:
             raise RuntimeError(
@@ -799,14 +798,32 @@ class Executor:
 
         return archive_hash
 
+    @staticmethod
+    def _get_hash_type(archive_name: str, package: Package) -> str | None:
+        hash_types = {
+            f["hash"].split(":")[0] for f in package.files if f["file"] == archive_name
+        }
+        return get_highest_priority_hash_type(hash_types, archive_name)
+
     def _download_archive(
         self,
         operation: Install | Update,
         url: str,
         dest: Path,
-    ) -> None:
+    ) -> dict[str, str]:
+        # Compute the hashes that are needed by the artifact cache and
+        # to validate the archive (see _validate_archive_hash()) while
+        # downloading so that the archive does not need to be read again.
+        hash_names = {STORE_HASH_NAME}
+        if hash_type := self._get_hash_type(dest.name, operation.package):
+            hash_names.add(hash_type)
+
         downloader = Downloader(
-            url, dest, self._authenticator, max_retries=self._max_retries
+            url,
+            dest,
+            self._authenticator,
+            max_retries=self._max_retries,
+            hash_names=hash_names,
         )
         wheel_size = downloader.total_size
 
@@ -840,6 +857,8 @@ class Executor:
             with self._lock:
                 progress.finish()
 
+        return downloader.hashes
+
     def _should_write_operation(self, operation: Operation) -> bool:
         return (
             not operation.skipped or self._dry_run or self._verbose or not self._enabled
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import TYPE_CHECKING
 from typing import cast
 
@@ -15,6 +16,7 @@ from poetry.repositories.lockfile_repository import LockfileRepository
 
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
     from collections.abc import Iterable
 
     from cleo.io.io import IO
@@ -172,7 +174,7 @@ class Installer:
         return self
 
     def _do_refresh(self) -> int:
-        from poetry.puzzle.solver import Solver
+        from poetry.puzzle.exceptions import SolverProblemError
 
         # Checking extras
         for extra in self._extras:
@@ -180,6 +182,43 @@ class Installer:
                 raise ValueError(f"Extra [{extra}] is not specified.")
 
         locked_repository = self._locker.locked_repository()
+
+        # Always re-solve directory dependencies, otherwise we can't determine
+        # if anything has changed (and the lock file contains an invalid version).
+        use_latest = [
+            p.name for p in locked_repository.packages if p.source_type == "directory"
+        ]
+
+        solved_packages = None
+        if self._config.get("solver.incremental-lock"):
+            pinned = self._get_unaffected_locked_packages(locked_repository, use_latest)
+            if pinned:
+                try:
+                    solved_packages = self._solve_refresh(
+                        locked_repository, use_latest, pinned
+                    )
+                except SolverProblemError:
+                    if self._io.is_verbose():
+                        self._io.write_line(
+                            "<info>Incremental resolution failed,"
+                            " resolving all dependencies again</>"
+                        )
+
+        if solved_packages is None:
+            solved_packages = self._solve_refresh(locked_repository, use_latest)
+
+        self._write_lock_file(solved_packages, force=True)
+
+        return 0
+
+    def _solve_refresh(
+        self,
+        locked_repository: LockfileRepository,
+        use_latest: Collection[NormalizedName],
+        pinned: Collection[NormalizedName] | None = None,
+    ) -> dict[Package, TransitivePackageInfo]:
+        from poetry.puzzle.solver import Solver
+
         solver = Solver(
             self._package,
             self._pool,
@@ -188,20 +227,60 @@ class Installer:
             self._io,
         )
 
-        # Always re-solve directory dependencies, otherwise we can't determine
-        # if anything has changed (and the lock file contains an invalid version).
-        use_latest = [
-            p.name for p in locked_repository.packages if p.source_type == "directory"
-        ]
-
         with solver.provider.use_source_root(
             source_root=self._env.path.joinpath("src")
         ):
-            solved_packages = solver.solve(use_latest=use_latest).get_solved_packages()
+            return solver.solve(
+                use_latest=use_latest, pinned=pinned
+            ).get_solved_packages()
 
-        self._write_lock_file(solved_packages, force=True)
-
-        return 0
+    def _get_unaffected_locked_packages(
+        self,
+        locked_repository: LockfileRepository,
+        use_latest: Collection[NormalizedName],
+    ) -> set[NormalizedName]:
+        """
+        Returns the names of the locked packages that are not affected by the
+        changes of the dependencies of the root package since the lock file
+        has been written. A locked package is affected if it is a dependency
+        of the root package that is not satisfied by the lock file anymore,
+        if it is always re-solved or if it is required by an affected package.
+        """
+        metadata = self._locker.lock_data.get("metadata", {})
+        if metadata.get("python-versions") != self._package.python_versions:
+            # The python constraint is part of every dependency of the root package.
+            return set()
+
+        locked: dict[NormalizedName, list[Package]] = defaultdict(list)
+        for package in locked_repository.packages:
+            locked[package.name].append(package)
+
+        affected = set(use_latest)
+        for dependency in self._package.all_requires:
+            if not any(
+                package.satisfies(dependency)
+                and (
+                    not dependency.source_name
+                    or package.source_reference == dependency.source_name
+                )
+                for package in locked.get(dependency.name, [])
+            ):
+                affected.add(dependency.name)
+
+        stack = list(affected)
+        while stack:
+            for package in locked.get(stack.pop(), []):
+                for requirement in package.requires:
+                    if requirement.name not in affected:
+                        affected.add(requirement.name)
+                        stack.append(requirement.name)
+
+        return {
+            name
+            for name, packages in locked.items()
+            if name not in affected
+            and not any(package.is_direct_origin() for package in packages)
+        }
 
     def _do_install(self) -> int:
         from poetry.puzzle.solver import Solver
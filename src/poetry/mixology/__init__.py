@@ -8,11 +8,14 @@ from poetry.mixology.version_solver import VersionSolver
 if TYPE_CHECKING:
     from poetry.core.packages.project_package import ProjectPackage
 
+    from poetry.mixology.heuristics import Heuristic
     from poetry.mixology.result import SolverResult
     from poetry.puzzle.provider import Provider
 
 
-def resolve_version(root: ProjectPackage, provider: Provider) -> SolverResult:
-    solver = VersionSolver(root, provider)
+def resolve_version(
+    root: ProjectPackage, provider: Provider, heuristic: Heuristic | None = None
+) -> SolverResult:
+    solver = VersionSolver(root, provider, heuristic)
 
     return solver.solve()
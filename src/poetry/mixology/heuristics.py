@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
+
+
+if TYPE_CHECKING:
+    from poetry.core.packages.dependency import Dependency
+
+    from poetry.mixology.incompatibility import Incompatibility
+    from poetry.mixology.version_solver import CompKey
+
+
+class Heuristic:
+    """
+    Decides which of the unsatisfied dependencies is resolved next.
+
+    The solver chooses the dependency with the lowest key. The default
+    heuristic only uses the static priority of a dependency
+    (see VersionSolver._get_comp_key()). Other heuristics additionally
+    learn from the conflicts encountered while solving.
+    """
+
+    name: ClassVar[str] = "default"
+    description: ClassVar[str] = (
+        "Direct origin, locked and latest packages first,"
+        " then packages with the most constrained dependencies."
+    )
+
+    def key(self, dependency: Dependency, comp_key: CompKey) -> tuple[Any, ...]:
+        return comp_key
+
+    def on_conflict(self, incompatibility: Incompatibility) -> None:
+        """
+        Called for the conflicting incompatibility and for each incompatibility
+        derived from it while resolving a conflict.
+        """
+
+    def on_backtrack(self) -> None:
+        """
+        Called after backtracking to resolve a conflict.
+        """
+
+
+class ConflictActivityHeuristic(Heuristic):
+    """
+    Prefers the packages that have been involved in the most conflicts,
+    where recent conflicts count more than older ones,
+    like the VSIDS heuristic of SAT solvers.
+    """
+
+    name = "activity"
+    description = "Packages involved in the most (recent) conflicts first."
+
+    # The activity of all packages decays by this factor with each conflict.
+    decay = 0.95
+
+    def __init__(self) -> None:
+        self._activity: defaultdict[str, float] = defaultdict(float)
+        self._increment = 1.0
+
+    def key(self, dependency: Dependency, comp_key: CompKey) -> tuple[Any, ...]:
+        preference, *others = comp_key
+        return preference, -self._activity[dependency.complete_name], *others
+
+    def on_conflict(self, incompatibility: Incompatibility) -> None:
+        for term in incompatibility.terms:
+            self._activity[term.dependency.complete_name] += self._increment
+
+    def on_backtrack(self) -> None:
+        # Instead of decaying all activities,
+        # the activity that is added from now on is increased.
+        self._increment /= self.decay
+        if self._increment > 1e100:
+            for name in self._activity:
+                self._activity[name] /= self._increment
+            self._increment = 1.0
+
+
+class RecentConflictsHeuristic(Heuristic):
+    """
+    Prefers the packages that have been involved in the most recent conflict.
+    """
+
+    name = "recent-conflicts"
+    description = "Packages involved in the most recent conflict first."
+
+    def __init__(self) -> None:
+        self._last_conflicts: dict[str, int] = {}
+        self._conflicts = 1
+
+    def key(self, dependency: Dependency, comp_key: CompKey) -> tuple[Any, ...]:
+        preference, *others = comp_key
+        last_conflict = self._last_conflicts.get(dependency.complete_name, 0)
+        return preference, -last_conflict, *others
+
+    def on_conflict(self, incompatibility: Incompatibility) -> None:
+        for term in incompatibility.terms:
+            self._last_conflicts[term.dependency.complete_name] = self._conflicts
+
+    def on_backtrack(self) -> None:
+        self._conflicts += 1
+
+
+HEURISTICS: dict[str, type[Heuristic]] = {
+    heuristic.name: heuristic
+    for heuristic in (Heuristic, ConflictActivityHeuristic, RecentConflictsHeuristic)
+}
+
+
+def get_heuristic(name: str) -> Heuristic:
+    try:
+        return HEURISTICS[name]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown heuristic: {name}. Use one of {', '.join(HEURISTICS)}."
+        ) from None
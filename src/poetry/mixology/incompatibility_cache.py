@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from poetry.core.constraints.version import parse_constraint
+from poetry.core.packages.dependency import Dependency
+
+from poetry.config.config import Config
+from poetry.mixology.incompatibility import Incompatibility
+from poetry.mixology.incompatibility_cause import ConflictCauseError
+from poetry.mixology.incompatibility_cause import DependencyCauseError
+from poetry.mixology.incompatibility_cause import NoVersionsCauseError
+from poetry.mixology.incompatibility_cause import PlatformCauseError
+from poetry.mixology.incompatibility_cause import PythonCauseError
+from poetry.mixology.incompatibility_cause import RootCauseError
+from poetry.mixology.term import Term
+from poetry.utils.cache import FileCache
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from poetry.core.packages.project_package import ProjectPackage
+
+    from poetry.mixology.incompatibility_cause import IncompatibilityCauseError
+    from poetry.puzzle.provider import Provider
+    from poetry.utils.cache import CacheEntry
+
+
+logger = logging.getLogger(__name__)
+
+
+class IncompatibilityCache:
+    """
+    A persistent cache of the incompatibilities that have been derived
+    by conflict resolution in previous runs of the version solver.
+
+    The cache is kept per root package (its dependencies and python constraint)
+    and set of repositories. Every learned incompatibility is stored together
+    with the index state of the packages whose available versions it relies on,
+    i.e. the versions found when it has been derived. It is only reused
+    as long as the repositories still provide exactly the same versions.
+    The metadata of a specific release is assumed to be immutable,
+    which is the same assumption the release cache of the repositories makes.
+    """
+
+    VERSION = "1"
+    MAX_ENTRIES = 1000
+    # The maximum number of nodes in the derivation graph of an incompatibility
+    # (counted as a tree) so that an incompatibility is stored.
+    MAX_DERIVATION_SIZE = 500
+
+    def __init__(self, root: ProjectPackage, provider: Provider) -> None:
+        self._root = root
+        self._provider = provider
+
+        config = Config.create()
+        self._enabled: bool = config.get("solver.conflict-cache")
+        self._cache = self._get_file_cache(config)
+
+        self._entries: dict[str, list[dict[str, Any]]] | None = None
+        self._seeded: set[str] = set()
+        self._reused: set[str] = set()
+        self._fingerprints: dict[str, str | None] = {}
+
+    @staticmethod
+    def _get_file_cache(config: Config) -> FileCache[dict[str, Any]]:
+        return FileCache(path=config.repository_cache_directory / "_solver")
+
+    @classmethod
+    def entries(cls, config: Config) -> list[CacheEntry]:
+        """
+        Returns the entries of the cache (see prune()).
+        """
+        return cls._get_file_cache(config).entries()
+
+    @property
+    def reused(self) -> int:
+        return len(self._reused)
+
+    def is_enabled(self) -> bool:
+        # Overrides change the dependencies of packages, and with an environment
+        # or pinned packages, only a subset of the available versions is visible,
+        # so that incompatibilities derived this way are not generally valid.
+        return self._enabled and self._provider.is_plain_resolution()
+
+    def load(self, name: str) -> list[Incompatibility]:
+        """
+        Returns the learned incompatibilities concerning the package name,
+        which are still valid and have not been returned before.
+        """
+        if not self.is_enabled() or name in self._seeded:
+            return []
+
+        self._seeded.add(name)
+
+        incompatibilities = []
+        for entry in self._get_entries().get(name, []):
+            if entry["id"] in self._reused or not self._is_valid(entry):
+                continue
+
+            try:
+                incompatibility = _load_incompatibility(entry["incompatibility"])
+            except (KeyError, TypeError, ValueError):
+                continue
+
+            self._reused.add(entry["id"])
+            incompatibilities.append(incompatibility)
+
+        return incompatibilities
+
+    def save(self, incompatibilities: Iterable[Incompatibility]) -> None:
+        """
+        Stores the given incompatibilities if they have been learned
+        by conflict resolution and can be reused in later runs.
+        """
+        if not self.is_enabled():
+            return
+
+        entries: dict[str, dict[str, Any]] = {}
+        for incompatibility in incompatibilities:
+            if (
+                not isinstance(incompatibility.cause, ConflictCauseError)
+                or incompatibility.is_failure()
+                or _derivation_size(incompatibility, {}) > self.MAX_DERIVATION_SIZE
+            ):
+                continue
+
+            data = _dump_incompatibility(incompatibility)
+            if data is None:
+                continue
+
+            index = {}
+            for external in incompatibility.external_incompatibilities:
+                if isinstance(external.cause, NoVersionsCauseError):
+                    key = _index_key(external.terms[0].dependency)
+                    index[key] = self._fingerprint(key)
+
+            if None in index.values():
+                continue
+
+            entry_id = hashlib.sha256(
+                json.dumps(data, sort_keys=True).encode()
+            ).hexdigest()
+            entries[entry_id] = {
+                "id": entry_id,
+                "index": index,
+                "incompatibility": data,
+            }
+
+        if not entries:
+            return
+
+        stored = self._cache.get(self._key) or {}
+        kept = [
+            entry
+            for entry in stored.get("incompatibilities", [])
+            if entry["id"] not in entries
+            and all(
+                self._fingerprints.get(key, fingerprint) == fingerprint
+                for key, fingerprint in entry["index"].items()
+            )
+        ]
+        new_entries = [*kept, *entries.values()][-self.MAX_ENTRIES :]
+
+        try:
+            self._cache.put(self._key, {"incompatibilities": new_entries})
+        except OSError as e:
+            logger.debug("Failed to store learned incompatibilities: %s", e)
+
+    @functools.cached_property
+    def _key(self) -> str:
+        pool = self._provider.pool
+        state = {
+            "version": self.VERSION,
+            "root": sorted(
+                f"{dependency.to_pep_508()} ; {','.join(sorted(dependency.groups))}"
+                for dependency in self._root.all_requires
+            ),
+            "python": self._root.python_versions,
+            "repositories": [
+                [
+                    repository.name,
+                    getattr(repository, "url", None),
+                    pool.get_priority(repository.name).name,
+                    str(getattr(repository, "CACHE_VERSION", "")),
+                ]
+                for repository in pool.all_repositories
+            ],
+            "unsafe": sorted(self._provider.UNSAFE_PACKAGES),
+        }
+
+        return hashlib.sha256(json.dumps(state, sort_keys=True).encode()).hexdigest()
+
+    def _get_entries(self) -> dict[str, list[dict[str, Any]]]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                stored = self._cache.get(self._key) or {}
+            except (OSError, ValueError) as e:
+                logger.debug("Failed to read learned incompatibilities: %s", e)
+                stored = {}
+
+            for entry in stored.get("incompatibilities", []):
+                for term in entry["incompatibility"]["terms"]:
+                    self._entries.setdefault(term["name"], []).append(entry)
+
+        return self._entries
+
+    def _is_valid(self, entry: dict[str, Any]) -> bool:
+        return all(
+            self._fingerprint(key) == fingerprint
+            for key, fingerprint in entry["index"].items()
+        )
+
+    def _fingerprint(self, key: str) -> str | None:
+        """
+        Returns a digest of the versions the repositories provide for a package
+        (optionally restricted to an explicit source).
+        """
+        if key not in self._fingerprints:
+            name, _, source_name = key.partition("@")
+            dependency = Dependency(name, "*", allows_prereleases=True)
+            dependency.source_name = source_name or None
+            try:
+                packages = self._provider.pool.find_packages(dependency)
+            except Exception as e:
+                logger.debug("Failed to determine the versions of %s: %s", key, e)
+                self._fingerprints[key] = None
+            else:
+                versions = sorted(
+                    {
+                        f"{package.version.text}@{package.source_reference or ''}"
+                        for package in packages
+                    }
+                )
+                self._fingerprints[key] = hashlib.sha256(
+                    json.dumps(versions).encode()
+                ).hexdigest()
+
+        return self._fingerprints[key]
+
+
+def _derivation_size(
+    incompatibility: Incompatibility, sizes: dict[Incompatibility, int]
+) -> int:
+    size = sizes.get(incompatibility)
+    if size is None:
+        size = 1
+        cause = incompatibility.cause
+        if isinstance(cause, ConflictCauseError):
+            size += _derivation_size(cause.conflict, sizes)
+            size += _derivation_size(cause.other, sizes)
+        sizes[incompatibility] = size
+
+    return size
+
+
+def _index_key(dependency: Dependency) -> str:
+    if dependency.source_name:
+        return f"{dependency.name}@{dependency.source_name}"
+
+    return dependency.name
+
+
+def _dump_incompatibility(incompatibility: Incompatibility) -> dict[str, Any] | None:
+    terms = []
+    for term in incompatibility.terms:
+        dependency = term.dependency
+        if dependency.is_direct_origin():
+            return None
+
+        constraint = str(dependency.constraint)
+        try:
+            if parse_constraint(constraint) != dependency.constraint:
+                return None
+        except ValueError:
+            return None
+
+        terms.append(
+            {
+                "name": dependency.name,
+                "pretty-name": dependency.pretty_name,
+                "constraint": constraint,
+                "features": sorted(dependency.features),
+                "source": dependency.source_name,
+                "positive": term.is_positive(),
+                "root": dependency.is_root,
+            }
+        )
+
+    cause = _dump_cause(incompatibility.cause)
+    if cause is None:
+        return None
+
+    return {"terms": terms, "cause": cause}
+
+
+def _dump_cause(cause: IncompatibilityCauseError) -> dict[str, Any] | None:
+    if isinstance(cause, ConflictCauseError):
+        conflict = _dump_incompatibility(cause.conflict)
+        other = _dump_incompatibility(cause.other)
+        if conflict is None or other is None:
+            return None
+
+        return {"type": "conflict", "conflict": conflict, "other": other}
+
+    if isinstance(cause, NoVersionsCauseError):
+        return {"type": "no-versions"}
+
+    if isinstance(cause, DependencyCauseError):
+        return {"type": "dependency"}
+
+    if isinstance(cause, PythonCauseError):
+        return {
+            "type": "python",
+            "python-version": cause.python_version,
+            "root-python-version": cause.root_python_version,
+        }
+
+    if isinstance(cause, PlatformCauseError):
+        return {"type": "platform", "platform": cause.platform}
+
+    if isinstance(cause, RootCauseError):
+        return {"type": "root"}
+
+    return None
+
+
+def _load_incompatibility(data: dict[str, Any]) -> Incompatibility:
+    terms = []
+    for term_data in data["terms"]:
+        dependency = Dependency(
+            term_data["pretty-name"],
+            term_data["constraint"],
+            extras=term_data["features"],
+        )
+        dependency.source_name = term_data["source"]
+        dependency.is_root = term_data["root"]
+        terms.append(Term(dependency, term_data["positive"]))
+
+    return Incompatibility(terms, _load_cause(data["cause"]))
+
+
+def _load_cause(data: dict[str, Any]) -> IncompatibilityCauseError:
+    cause_type = data["type"]
+    if cause_type == "conflict":
+        return ConflictCauseError(
+            _load_incompatibility(data["conflict"]),
+            _load_incompatibility(data["other"]),
+        )
+
+    if cause_type == "no-versions":
+        return NoVersionsCauseError()
+
+    if cause_type == "dependency":
+        return DependencyCauseError()
+
+    if cause_type == "python":
+        return PythonCauseError(data["python-version"], data["root-python-version"])
+
+    if cause_type == "platform":
+        return PlatformCauseError(data["platform"])
+
+    if cause_type == "root":
+        return RootCauseError()
+
+    raise ValueError(f"Unknown incompatibility cause: {cause_type}")
@@ -29,6 +29,17 @@ class PartialSolution:
         # assigned.
         self._assignments: list[Assignment] = []
 
+        # The assignments for each package, in the order they were assigned.
+        #
+        # This is derived from self._assignments.
+        self._assignments_by_package: dict[str, list[Assignment]] = {}
+
+        # The running intersections of the assignments for each package, i.e.
+        # the n-th entry is the intersection of the first n + 1 entries of
+        # self._assignments_by_package for the same package. It is extended
+        # lazily by satisfier() and trimmed when backtracking.
+        self._intersections_by_package: dict[str, list[Term]] = {}
+
         # The decisions made for each package.
         self._decisions: dict[str, Package] = {}
 
@@ -46,6 +57,12 @@ class PartialSolution:
         # This is derived from self._assignments.
         self._negative: dict[str, Term] = {}
 
+        # A counter for each package that is incremented whenever an assignment
+        # for that package is added or removed. Since the relation of a term to
+        # this solution only depends on the assignments for the term's package,
+        # it cannot have changed as long as the counter stays the same.
+        self._generations: dict[str, int] = {}
+
         # The number of distinct solutions that have been attempted so far.
         self._attempted_solutions = 1
 
@@ -72,6 +89,12 @@ class PartialSolution:
             if term.dependency.complete_name not in self._decisions
         ]
 
+    def generation(self, package: str) -> int:
+        """
+        Returns the current generation of the assignments for package.
+        """
+        return self._generations.get(package, 0)
+
     def decide(self, package: Package) -> None:
         """
         Adds an assignment of package as a decision
@@ -111,7 +134,10 @@ class PartialSolution:
         """
         Adds an Assignment to _assignments and _positive or _negative.
         """
+        name = assignment.dependency.complete_name
         self._assignments.append(assignment)
+        self._assignments_by_package.setdefault(name, []).append(assignment)
+        self._generations[name] = self._generations.get(name, 0) + 1
         self._register(assignment)
 
     def backtrack(self, decision_level: int) -> None:
@@ -124,21 +150,37 @@ class PartialSolution:
         packages = set()
         while self._assignments[-1].decision_level > decision_level:
             removed = self._assignments.pop(-1)
-            packages.add(removed.dependency.complete_name)
+            name = removed.dependency.complete_name
+            packages.add(name)
+            self._assignments_by_package[name].pop()
             if removed.is_decision():
-                del self._decisions[removed.dependency.complete_name]
+                del self._decisions[name]
 
         # Re-compute _positive and _negative for the packages that were removed.
         for package in packages:
+            self._generations[package] += 1
+
             if package in self._positive:
                 del self._positive[package]
 
             if package in self._negative:
                 del self._negative[package]
 
-        for assignment in self._assignments:
-            if assignment.dependency.complete_name in packages:
-                self._register(assignment)
+            intersections = self._intersections_by_package.get(package)
+            if intersections is not None:
+                del intersections[len(self._assignments_by_package[package]) :]
+
+        # Register the remaining assignments in their original order so that
+        # the order of _positive and _negative is the same as before.
+        for assignment in sorted(
+            (
+                assignment
+                for package in packages
+                for assignment in self._assignments_by_package[package]
+            ),
+            key=lambda assignment: assignment.index,
+        ):
+            self._register(assignment)
 
     def _register(self, assignment: Assignment) -> None:
         """
@@ -172,12 +214,42 @@ class PartialSolution:
         Returns the first Assignment in this solution such that the sublist of
         assignments up to and including that entry collectively satisfies term.
         """
-        assigned_term: Term | None = None
+        name = term.dependency.complete_name
+        assignments = self._assignments_by_package.get(name, [])
 
-        for assignment in self._assignments:
-            if assignment.dependency.complete_name != term.dependency.complete_name:
-                continue
+        for assignment in assignments:
+            if (
+                not assignment.dependency.is_root
+                and not assignment.dependency.is_same_package_as(term.dependency)
+            ):
+                # Some assignments have to be skipped for this term,
+                # so the running intersections cannot be used.
+                return self._satisfier_slow(term, assignments)
+
+        intersections = self._intersections_by_package.setdefault(name, [])
+        for i, assignment in enumerate(assignments):
+            if i < len(intersections):
+                assigned_term = intersections[i]
+            else:
+                if i == 0:
+                    assigned_term = assignment
+                else:
+                    intersection = intersections[-1].intersect(assignment)
+                    assert intersection is not None
+                    assigned_term = intersection
+
+                intersections.append(assigned_term)
+
+            # As soon as we have enough assignments to satisfy term, return them.
+            if assigned_term.satisfies(term):
+                return assignment
+
+        raise RuntimeError(f"[BUG] {term} is not satisfied.")
+
+    def _satisfier_slow(self, term: Term, assignments: list[Assignment]) -> Assignment:
+        assigned_term: Term | None = None
 
+        for assignment in assignments:
             if (
                 not assignment.dependency.is_root
                 and not assignment.dependency.is_same_package_as(term.dependency)
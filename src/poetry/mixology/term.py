@@ -5,6 +5,7 @@ import functools
 from typing import TYPE_CHECKING
 
 from poetry.mixology.set_relation import SetRelation
+from poetry.utils import algebra
 
 
 if TYPE_CHECKING:
@@ -133,17 +134,25 @@ class Term:
                 negative = other if self.is_positive() else self
 
                 return self._non_empty_term(
-                    positive.constraint.difference(negative.constraint), True, other
+                    algebra.constraint_difference(
+                        positive.constraint, negative.constraint
+                    ),
+                    True,
+                    other,
                 )
             elif self.is_positive():
                 # foo ^1.0.0 ∩ foo >=1.5.0 <3.0.0 → foo ^1.5.0
                 return self._non_empty_term(
-                    self.constraint.intersect(other.constraint), True, other
+                    algebra.constraint_intersect(self.constraint, other.constraint),
+                    True,
+                    other,
                 )
             else:
                 # not foo ^1.0.0 ∩ not foo >=1.5.0 <3.0.0 → not foo >=1.0.0 <3.0.0
                 return self._non_empty_term(
-                    self.constraint.union(other.constraint), False, other
+                    algebra.constraint_union(self.constraint, other.constraint),
+                    False,
+                    other,
                 )
         elif self.is_positive() != other.is_positive():
             return self if self.is_positive() else other
@@ -185,8 +194,8 @@ class Term:
         )
         new_dep = dependency.with_constraint(constraint)
         if is_positive and other.is_positive():
-            new_dep.transitive_marker = self.dependency.transitive_marker.union(
-                other.dependency.transitive_marker
+            new_dep.transitive_marker = algebra.marker_union(
+                self.dependency.transitive_marker, other.dependency.transitive_marker
             )
         return Term(new_dep, is_positive)
 
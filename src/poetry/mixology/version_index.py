@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import copy
+
+from bisect import bisect_left
+from bisect import bisect_right
+from typing import TYPE_CHECKING
+
+from poetry.core.constraints.version import VersionRangeConstraint
+from poetry.core.constraints.version import VersionUnion
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from poetry.core.constraints.version import VersionConstraint
+
+    from poetry.packages import DependencyPackage
+
+
+class VersionIndex:
+    """
+    The candidates for a package sorted by version, so that the candidates
+    allowed by a version range can be found by bisecting its bounds
+    instead of checking every version.
+
+    The candidates keep the order they have been given in,
+    i.e. the order of preference of the provider.
+    """
+
+    def __init__(self, packages: list[DependencyPackage]) -> None:
+        self.packages = packages
+
+        # The positions of the packages in ascending order of their versions
+        self._order = sorted(
+            range(len(packages)), key=lambda i: packages[i].package.version
+        )
+        self._versions = [packages[i].package.version for i in self._order]
+        # Upper bounds ignore local version labels,
+        # e.g. "<=1.0" allows "1.0+local".
+        self._public_versions = [
+            version.without_local() if version.is_local() else version
+            for version in self._versions
+        ]
+
+    def __len__(self) -> int:
+        return len(self.packages)
+
+    def filter(self, constraint: VersionConstraint) -> VersionIndex:
+        """
+        Returns the index of the candidates allowed by the given constraint.
+        """
+        start, end = self._bounds(constraint)
+        versions = self._versions
+
+        selected: Sequence[int]
+        if isinstance(constraint, VersionRangeConstraint):
+            # The versions allowed by a range are contiguous. Only versions
+            # next to its bounds may not be allowed, e.g. "2.0.post1" by ">2.0"
+            # or "2.0rc1" by "<2.0".
+            while start < end and not constraint.allows(versions[start]):
+                start += 1
+            while start < end and not constraint.allows(versions[end - 1]):
+                end -= 1
+            selected = range(start, end)
+        else:
+            # Unions of ranges (and the empty constraint) are checked
+            # version by version between their outermost bounds.
+            selected = [i for i in range(start, end) if constraint.allows(versions[i])]
+
+        order = [self._order[i] for i in selected]
+        positions = sorted(order)
+        new_positions = {position: i for i, position in enumerate(positions)}
+
+        index = copy.copy(self)
+        index.packages = [self.packages[position] for position in positions]
+        index._order = [new_positions[position] for position in order]
+        index._versions = [versions[i] for i in selected]
+        index._public_versions = [self._public_versions[i] for i in selected]
+
+        return index
+
+    def _bounds(self, constraint: VersionConstraint) -> tuple[int, int]:
+        ranges: list[VersionRangeConstraint]
+        if isinstance(constraint, VersionRangeConstraint):
+            ranges = [constraint]
+        elif isinstance(constraint, VersionUnion):
+            ranges = constraint.ranges
+        else:
+            return 0, len(self._versions)
+
+        start = len(self._versions)
+        end = 0
+        for range_ in ranges:
+            if range_.allowed_min is None:
+                start = 0
+            else:
+                start = min(start, bisect_left(self._versions, range_.allowed_min))
+
+            if range_.allowed_max is None:
+                end = len(self._versions)
+            else:
+                end = max(end, bisect_right(self._public_versions, range_.allowed_max))
+
+        return start, max(start, end)
@@ -10,8 +10,11 @@ from typing import Optional
 
 from poetry.core.packages.dependency import Dependency
 
+from poetry.config.config import Config
 from poetry.mixology.failure import SolveFailureError
+from poetry.mixology.heuristics import get_heuristic
 from poetry.mixology.incompatibility import Incompatibility
+from poetry.mixology.incompatibility_cache import IncompatibilityCache
 from poetry.mixology.incompatibility_cause import ConflictCauseError
 from poetry.mixology.incompatibility_cause import NoVersionsCauseError
 from poetry.mixology.incompatibility_cause import RootCauseError
@@ -19,12 +22,15 @@ from poetry.mixology.partial_solution import PartialSolution
 from poetry.mixology.result import SolverResult
 from poetry.mixology.set_relation import SetRelation
 from poetry.mixology.term import Term
+from poetry.mixology.version_index import VersionIndex
 from poetry.packages import PackageCollection
+from poetry.utils import profiler
 
 
 if TYPE_CHECKING:
     from poetry.core.packages.project_package import ProjectPackage
 
+    from poetry.mixology.heuristics import Heuristic
     from poetry.packages import DependencyPackage
     from poetry.puzzle.provider import Provider
 
@@ -62,7 +68,7 @@ class DependencyCache:
     again.
     """
 
-    def __init__(self, provider: Provider) -> None:
+    def __init__(self, provider: Provider, maxsize: int | None = None) -> None:
         self._provider = provider
 
         # self._cache maps a package name to a stack of cached package lists,
@@ -74,27 +80,49 @@ class DependencyCache:
         # In order to maintain the integrity of the cache, `clear_level()`
         # needs to be called in descending order as decision levels are
         # backtracked so that the correct items can be popped from the stack.
-        self._cache: dict[DependencyCacheKey, list[list[DependencyPackage]]] = (
+        #
+        # The package lists are kept in version indexes so that they can be
+        # filtered by the range of a dependency without checking every version.
+        self._cache: dict[DependencyCacheKey, list[VersionIndex]] = (
             collections.defaultdict(list)
         )
         self._cached_dependencies_by_level: dict[int, list[DependencyCacheKey]] = (
             collections.defaultdict(list)
         )
 
-        self._search_for_cached = functools.lru_cache(maxsize=128)(self._search_for)
+        # self._search_for_cache is a LRU cache of the results of _search_for()
+        # with the decision level at which they were computed. Like self._cache,
+        # it is versioned by decision level: when backtracking, only the results
+        # computed at the rolled back levels are invalidated.
+        if maxsize is None:
+            maxsize = Config.create().get("solver.dependency-cache-size")
+        self._maxsize = maxsize
+        self._search_for_cache: collections.OrderedDict[
+            tuple[Dependency, DependencyCacheKey], VersionIndex
+        ] = collections.OrderedDict()
+        self._searched_dependencies_by_level: dict[
+            int, list[tuple[Dependency, DependencyCacheKey]]
+        ] = collections.defaultdict(list)
+
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
 
     def _search_for(
         self,
         dependency: Dependency,
         key: DependencyCacheKey,
-    ) -> list[DependencyPackage]:
+    ) -> VersionIndex:
         cache_entries = self._cache[key]
         if cache_entries:
-            packages = [
-                p
-                for p in cache_entries[-1]
-                if dependency.constraint.allows(p.package.version)
-            ]
+            packages = cache_entries[-1].filter(dependency.constraint)
         else:
             packages = None
 
@@ -106,7 +134,30 @@ class DependencyCache:
         # nothing, we need to call provider.search_for() again as it may return
         # additional results this time.
         if not packages:
-            packages = self._provider.search_for(dependency)
+            packages = VersionIndex(self._provider.search_for(dependency))
+
+        return packages
+
+    def _search_for_cached(
+        self,
+        dependency: Dependency,
+        key: DependencyCacheKey,
+        decision_level: int,
+    ) -> VersionIndex:
+        cache_key = (dependency, key)
+        packages = self._search_for_cache.get(cache_key)
+        if packages is not None:
+            self._search_for_cache.move_to_end(cache_key)
+            self._hits += 1
+            return packages
+
+        self._misses += 1
+        packages = self._search_for(dependency, key)
+        if self._maxsize > 0:
+            self._search_for_cache[cache_key] = packages
+            self._searched_dependencies_by_level[decision_level].append(cache_key)
+            if len(self._search_for_cache) > self._maxsize:
+                self._search_for_cache.popitem(last=False)
 
         return packages
 
@@ -125,13 +176,16 @@ class DependencyCache:
 
         # We could always use dependency.without_features() here,
         # but for performance reasons we only do it if necessary.
-        packages = self._search_for_cached(
-            dependency.without_features() if dependency.features else dependency, key
+        index = self._search_for_cached(
+            dependency.without_features() if dependency.features else dependency,
+            key,
+            decision_level,
         )
-        if not self._cache[key] or self._cache[key][-1] is not packages:
-            self._cache[key].append(packages)
+        if not self._cache[key] or self._cache[key][-1] is not index:
+            self._cache[key].append(index)
             self._cached_dependencies_by_level[decision_level].append(key)
 
+        packages = index.packages
         if dependency.features and packages:
             # Use the cached dependency so that a possible explicit source is set.
             return PackageCollection(
@@ -141,8 +195,10 @@ class DependencyCache:
         return packages
 
     def clear_level(self, level: int) -> None:
+        for cache_key in self._searched_dependencies_by_level.pop(level, []):
+            self._search_for_cache.pop(cache_key, None)
+
         if level in self._cached_dependencies_by_level:
-            self._search_for_cached.cache_clear()
             for key in self._cached_dependencies_by_level.pop(level):
                 self._cache[key].pop()
 
@@ -156,15 +212,31 @@ class VersionSolver:
     on how this solver works.
     """
 
-    def __init__(self, root: ProjectPackage, provider: Provider) -> None:
+    def __init__(
+        self,
+        root: ProjectPackage,
+        provider: Provider,
+        heuristic: Heuristic | None = None,
+    ) -> None:
         self._root = root
         self._provider = provider
+        if heuristic is None:
+            heuristic = get_heuristic(Config.create().get("solver.heuristic"))
+        self._heuristic = heuristic
         self._dependency_cache = DependencyCache(provider)
+        self._incompatibility_cache = IncompatibilityCache(root, provider)
         self._incompatibilities: dict[str, list[Incompatibility]] = {}
         self._contradicted_incompatibilities: set[Incompatibility] = set()
         self._contradicted_incompatibilities_by_level: dict[
             int, set[Incompatibility]
         ] = collections.defaultdict(set)
+        # Two watched terms for each incompatibility that was found to be
+        # inconclusive, i.e. two terms that were not satisfied by _solution,
+        # together with the generations of their packages at that time.
+        # As long as the assignments for both packages do not change, the
+        # incompatibility stays inconclusive and does not have to be examined
+        # again (similar to the two-watched-literal scheme of SAT solvers).
+        self._watched_terms: dict[Incompatibility, tuple[str, int, str, int]] = {}
         self._solution = PartialSolution()
         self._get_comp_key_cached = functools.cache(self._get_comp_key)
 
@@ -188,8 +260,10 @@ class VersionSolver:
         try:
             next: str | None = self._root.name
             while next is not None:
-                self._propagate(next)
-                next = self._choose_package_version()
+                with profiler.profile("propagate"):
+                    self._propagate(next)
+                with profiler.profile("choose version"):
+                    next = self._choose_package_version()
 
             return self._result()
         except Exception:
@@ -197,8 +271,22 @@ class VersionSolver:
         finally:
             self._log(
                 f"Version solving took {time.time() - start:.3f} seconds.\n"
-                f"Tried {self._solution.attempted_solutions} solutions."
+                f"Tried {self._solution.attempted_solutions} solutions.\n"
+                f"Dependency cache: {self._dependency_cache.hits} hits,"
+                f" {self._dependency_cache.misses} misses."
             )
+            if self._incompatibility_cache.is_enabled():
+                self._log(
+                    "Reused"
+                    f" {self._incompatibility_cache.reused} learned incompatibilities."
+                )
+                self._incompatibility_cache.save(
+                    {
+                        incompatibility: None
+                        for incompatibilities in self._incompatibilities.values()
+                        for incompatibility in incompatibilities
+                    }
+                )
 
     def _propagate(self, package: str) -> None:
         """
@@ -214,7 +302,10 @@ class VersionSolver:
             # we can derive stronger assignments sooner and more eagerly find
             # conflicts.
             for incompatibility in reversed(self._incompatibilities[package]):
-                if incompatibility in self._contradicted_incompatibilities:
+                if (
+                    incompatibility in self._contradicted_incompatibilities
+                    or self._is_inconclusive(incompatibility)
+                ):
                     continue
 
                 result = self._propagate_incompatibility(incompatibility)
@@ -227,7 +318,8 @@ class VersionSolver:
                     # It also backjumps to a point in the solution
                     # where that incompatibility will allow us to derive new assignments
                     # that avoid the conflict.
-                    root_cause = self._resolve_conflict(incompatibility)
+                    with profiler.profile("conflict resolution"):
+                        root_cause = self._resolve_conflict(incompatibility)
 
                     # Back jumping erases all the assignments we did at the previous
                     # decision level, so we clear [changed] and refill it with the
@@ -244,6 +336,22 @@ class VersionSolver:
                     assert isinstance(result, str)
                     changed.add(result)
 
+    def _is_inconclusive(self, incompatibility: Incompatibility) -> bool:
+        """
+        Returns whether incompatibility is known to be inconclusive
+        because the relations of its watched terms cannot have changed
+        since it was last examined.
+        """
+        watched = self._watched_terms.get(incompatibility)
+        if watched is None:
+            return False
+
+        name1, generation1, name2, generation2 = watched
+        return (
+            self._solution.generation(name1) == generation1
+            and self._solution.generation(name2) == generation2
+        )
+
     def _propagate_incompatibility(
         self, incompatibility: Incompatibility
     ) -> str | object | None:
@@ -276,8 +384,17 @@ class VersionSolver:
                 return None
             elif relation == SetRelation.OVERLAPPING:
                 # If more than one term is inconclusive, we can't deduce anything about
-                # incompatibility.
+                # incompatibility. Watch both terms so that incompatibility is only
+                # examined again after the assignments for one of them changed.
                 if unsatisfied is not None:
+                    name1 = unsatisfied.dependency.complete_name
+                    name2 = term.dependency.complete_name
+                    self._watched_terms[incompatibility] = (
+                        name1,
+                        self._solution.generation(name1),
+                        name2,
+                        self._solution.generation(name2),
+                    )
                     return None
 
                 # If exactly one term in incompatibility is inconclusive, then it's
@@ -321,6 +438,8 @@ class VersionSolver:
 
         new_incompatibility = False
         while not incompatibility.is_failure():
+            self._heuristic.on_conflict(incompatibility)
+
             # The term in incompatibility.terms that was most recently satisfied by
             # _solution.
             most_recent_term = None
@@ -397,6 +516,8 @@ class VersionSolver:
                     self._dependency_cache.clear_level(level)
 
                 self._solution.backtrack(previous_satisfier_level)
+                self._heuristic.on_backtrack()
+                profiler.count("backtracks")
                 if new_incompatibility:
                     self._add_incompatibility(incompatibility)
 
@@ -559,7 +680,12 @@ class VersionSolver:
         """
         Chooses the next package to resolve.
         """
-        return min(unsatisfied, key=self._get_comp_key_cached)
+        return min(
+            unsatisfied,
+            key=lambda dependency: self._heuristic.key(
+                dependency, self._get_comp_key_cached(dependency)
+            ),
+        )
 
     def _choose_package_version(self) -> str | None:
         """
@@ -596,7 +722,8 @@ class VersionSolver:
         else:
             package = locked
 
-        package = self._provider.complete_package(package)
+        with profiler.profile("complete package", package.package.complete_name):
+            package = self._provider.complete_package(package)
 
         conflict = False
         for incompatibility in self._provider.incompatibilities_for(package):
@@ -615,6 +742,7 @@ class VersionSolver:
 
         if not conflict:
             self._solution.decide(package.package)
+            profiler.count("decisions")
             self._log(
                 f"selecting {package.package.complete_name}"
                 f" ({package.package.full_pretty_version})"
@@ -638,9 +766,11 @@ class VersionSolver:
     def _add_incompatibility(self, incompatibility: Incompatibility) -> None:
         self._log(f"fact: {incompatibility}")
 
+        seed = []
         for term in incompatibility.terms:
             if term.dependency.complete_name not in self._incompatibilities:
                 self._incompatibilities[term.dependency.complete_name] = []
+                seed.append(term.dependency.name)
 
             if (
                 incompatibility
@@ -652,5 +782,11 @@ class VersionSolver:
                 incompatibility
             )
 
+        # Add the incompatibilities learned in previous runs as soon as
+        # a package is encountered for the first time.
+        for name in seed:
+            for learned in self._incompatibility_cache.load(name):
+                self._add_incompatibility(learned)
+
     def _log(self, text: str) -> None:
         self._provider.debug(text, self._solution.attempted_solutions)
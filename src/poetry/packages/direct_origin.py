@@ -12,7 +12,6 @@ from poetry.inspection.info import PackageInfo
 from poetry.inspection.info import PackageInfoError
 from poetry.utils.authenticator import get_default_authenticator
 from poetry.utils.helpers import download_file
-from poetry.utils.helpers import get_file_hash
 from poetry.vcs.git import Git
 
 
@@ -79,9 +78,13 @@ class DirectOrigin:
     def get_package_from_directory(cls, directory: Path) -> Package:
         return PackageInfo.from_directory(path=directory).to_package(root_dir=directory)
 
-    def _download_file(self, url: str, dest: Path) -> None:
-        download_file(
-            url, dest, session=self._authenticator, max_retries=self._max_retries
+    def _download_file(self, url: str, dest: Path) -> dict[str, str]:
+        return download_file(
+            url,
+            dest,
+            session=self._authenticator,
+            max_retries=self._max_retries,
+            hash_names=["sha256"],
         )
 
     def get_package_from_url(self, url: str) -> Package:
@@ -91,9 +94,8 @@ class DirectOrigin:
         )
 
         package = self.get_package_from_file(artifact)
-        package.files = [
-            {"file": link.filename, "hash": "sha256:" + get_file_hash(artifact)}
-        ]
+        file_hash = self._artifact_cache.get_file_hash(artifact)
+        package.files = [{"file": link.filename, "hash": "sha256:" + file_hash}]
 
         package._source_type = "url"
         package._source_url = url
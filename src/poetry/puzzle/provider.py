@@ -4,10 +4,13 @@ import functools
 import itertools
 import logging
 import re
+import threading
 import time
 
 from collections import defaultdict
 from contextlib import contextmanager
+from operator import attrgetter
+from operator import methodcaller
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import ClassVar
@@ -22,6 +25,7 @@ from poetry.core.version.markers import AnyMarker
 from poetry.core.version.markers import parse_marker
 from poetry.core.version.markers import union as marker_union
 
+from poetry.config.config import Config
 from poetry.mixology.incompatibility import Incompatibility
 from poetry.mixology.incompatibility_cause import DependencyCauseError
 from poetry.mixology.incompatibility_cause import PythonCauseError
@@ -31,6 +35,8 @@ from poetry.packages.direct_origin import DirectOrigin
 from poetry.packages.package_collection import PackageCollection
 from poetry.puzzle.exceptions import OverrideNeededError
 from poetry.repositories.repository_pool import Priority
+from poetry.utils import algebra
+from poetry.utils import profiler
 from poetry.utils.helpers import get_file_hash
 
 
@@ -39,6 +45,7 @@ if TYPE_CHECKING:
     from collections.abc import Collection
     from collections.abc import Iterable
     from collections.abc import Iterator
+    from concurrent.futures import ThreadPoolExecutor
     from pathlib import Path
 
     from cleo.io.io import IO
@@ -53,6 +60,7 @@ if TYPE_CHECKING:
     from poetry.core.version.markers import BaseMarker
 
     from poetry.repositories import RepositoryPool
+    from poetry.repositories.page_prefetcher import PagePrefetcher
     from poetry.utils.env import Env
 
 
@@ -96,6 +104,27 @@ class Indicator(ProgressIndicator):
 
         _set_context(None)
 
+    @contextmanager
+    def suspend(self) -> Iterator[None]:
+        """
+        Stops the thread of auto() until the context is left,
+        so that no thread is active, e.g. while forking processes.
+        """
+        if self._auto_running is None or self._auto_running.is_set():
+            yield
+            return
+
+        assert self._auto_thread is not None
+        self._auto_running.set()
+        self._auto_thread.join()
+
+        try:
+            yield
+        finally:
+            self._auto_running = threading.Event()
+            self._auto_thread = threading.Thread(target=self._spin)
+            self._auto_thread.start()
+
     def _formatter_context(self) -> str:
         if Indicator.CONTEXT is None:
             return " "
@@ -135,6 +164,7 @@ class Provider:
         self._direct_origin_packages: dict[str, Package] = {}
         self._locked: dict[NormalizedName, list[DependencyPackage]] = defaultdict(list)
         self._use_latest: Collection[NormalizedName] = []
+        self._pinned: Collection[NormalizedName] = []
         self._active_root_extras = (
             frozenset(active_root_extras) if active_root_extras is not None else None
         )
@@ -150,7 +180,21 @@ class Provider:
                 reverse=True,
             )
 
-        self.get_package_from_pool = functools.cache(self._pool.package)
+        # The metadata of likely candidates is fetched in the background
+        # while solving (see prefetch()).
+        config = Config.create()
+        self._prefetch_workers: int = config.get("solver.prefetch-workers")
+        self._prefetch_executor: ThreadPoolExecutor | None = None
+        # The pages of all packages that are known to be required
+        # are fetched in the background, too (see prefetch_pages()).
+        self._page_prefetch_workers: int = config.get("solver.page-prefetch-workers")
+        self._page_prefetcher: PagePrefetcher | None = None
+        self._prefetching_active = False
+        self._prefetch_lock = threading.Lock()
+        self._prefetched_dependencies: set[Dependency] = set()
+        self._prefetching: dict[tuple[str, Version, str | None], threading.Event] = {}
+
+        self.get_package_from_pool = functools.cache(self._get_package_from_pool)
 
     @property
     def pool(self) -> RepositoryPool:
@@ -160,6 +204,10 @@ class Provider:
     def use_latest(self) -> Collection[NormalizedName]:
         return self._use_latest
 
+    @property
+    def pinned(self) -> Collection[NormalizedName]:
+        return self._pinned
+
     @functools.cached_property
     def _overrides_marker_intersection(self) -> BaseMarker:
         overrides_marker_intersection: BaseMarker = AnyMarker()
@@ -179,6 +227,14 @@ class Provider:
     def is_debugging(self) -> bool:
         return self._is_debugging
 
+    def is_plain_resolution(self) -> bool:
+        """
+        Whether all available versions of all packages are considered
+        with their original dependencies, i.e. there are no overrides,
+        no environment and no pinned packages.
+        """
+        return not self._overrides and self._env is None and not self._pinned
+
     def set_overrides(self, overrides: dict[Package, dict[str, Dependency]]) -> None:
         self._overrides = overrides
         self.__dict__.pop("_python_constraint", None)
@@ -224,6 +280,289 @@ class Provider:
         finally:
             self._use_latest = []
 
+    @contextmanager
+    def use_pinned_for(self, names: Collection[NormalizedName]) -> Iterator[Provider]:
+        """
+        Pins the given packages to their locked versions. Only the locked versions
+        are considered for pinned packages and their dependencies are taken
+        from the lock file instead of being fetched from the repositories.
+        """
+        self._pinned = names
+
+        try:
+            yield self
+        finally:
+            self._pinned = []
+
+    @contextmanager
+    def use_prefetching(self) -> Iterator[Provider]:
+        """
+        Enables fetching the metadata of likely candidates in the background
+        with a thread pool of at most "solver.prefetch-workers" threads
+        and the pages of required packages with at most
+        "solver.page-prefetch-workers" threads.
+        """
+        if self._prefetching_active or (
+            self._prefetch_workers <= 0 and self._page_prefetch_workers <= 0
+        ):
+            yield self
+            return
+
+        self._start_prefetching()
+
+        try:
+            yield self
+        finally:
+            self._stop_prefetching()
+
+    @contextmanager
+    def suspend_prefetching(self) -> Iterator[Provider]:
+        """
+        Waits for running background fetches to finish and does not start
+        new ones until the context is left, so that no background thread
+        is active, e.g. while forking processes.
+        """
+        if not self._prefetching_active:
+            yield self
+            return
+
+        self._stop_prefetching()
+
+        try:
+            yield self
+        finally:
+            self._start_prefetching()
+
+    def _start_prefetching(self) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        from poetry.repositories.page_prefetcher import PagePrefetcher
+
+        self._prefetching_active = True
+        if self._prefetch_workers > 0:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=self._prefetch_workers,
+                thread_name_prefix="poetry-prefetch",
+            )
+            self._prefetch_locked()
+
+        if self._page_prefetch_workers > 0:
+            self._page_prefetcher = PagePrefetcher(
+                self._pool, self._page_prefetch_workers
+            )
+            # The requirements of the root package
+            # and the packages of the lock file are known up front.
+            self.prefetch_pages(self._package.all_requires)
+            self.prefetch_pages(
+                locked.package.to_dependency()
+                for locked_packages in self._locked.values()
+                for locked in locked_packages
+            )
+
+    def _stop_prefetching(self) -> None:
+        self._prefetching_active = False
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=True, cancel_futures=True)
+            self._prefetch_executor = None
+        if self._page_prefetcher is not None:
+            self._page_prefetcher.shutdown()
+            self._page_prefetcher = None
+        self._prefetched_dependencies.clear()
+        self._prefetching.clear()
+
+    def prefetch_pages(self, dependencies: Iterable[Dependency]) -> None:
+        """
+        Fetches the pages of the packages of the given dependencies
+        in the background, in the order of the dependencies.
+        """
+        if self._page_prefetcher is None:
+            return
+
+        for dependency in dependencies:
+            if (
+                dependency.is_direct_origin()
+                or dependency.name in self.UNSAFE_PACKAGES
+                or dependency.name in self._pinned
+            ):
+                continue
+
+            self._page_prefetcher.prefetch(
+                dependency.name,
+                dependency.source_name or self._explicit_sources.get(dependency.name),
+            )
+
+    def prefetch(self, dependencies: Iterable[Dependency]) -> None:
+        """
+        Fetches the metadata of the candidates that are most likely to be chosen
+        for the given dependencies in the background so that it is already
+        cached when it is required for version solving.
+        """
+        self.prefetch_pages(dependencies)
+
+        if self._prefetch_executor is None:
+            return
+
+        for dependency in dependencies:
+            if (
+                dependency.is_direct_origin()
+                or dependency.name in self.UNSAFE_PACKAGES
+                or dependency.name in self._pinned
+                or dependency in self._prefetched_dependencies
+            ):
+                continue
+
+            self._prefetched_dependencies.add(dependency)
+
+            locked = None
+            if dependency.name not in self._use_latest:
+                locked = next(
+                    (
+                        locked_package.package
+                        for locked_package in self._locked.get(dependency.name, [])
+                        if locked_package.package.satisfies(dependency)
+                    ),
+                    None,
+                )
+
+            self._prefetch_executor.submit(self._prefetch, dependency, locked)
+
+    def _prefetch_locked(self) -> None:
+        """
+        Fetches the metadata of the locked packages, which are likely to be chosen,
+        in one batch per repository (see HTTPRepository.prefetch_release_info()).
+        """
+        assert self._prefetch_executor is not None
+
+        source_names = {
+            dependency.name: dependency.source_name
+            for dependency in self._package.all_requires
+            if dependency.source_name
+        }
+        batches: dict[str, list[tuple[Package, threading.Event]]] = defaultdict(list)
+        for name, locked_packages in self._locked.items():
+            if (
+                name in self.UNSAFE_PACKAGES
+                or name in self._pinned
+                or name in self._use_latest
+            ):
+                continue
+
+            repository_name = source_names.get(name)
+            for locked in locked_packages:
+                package = locked.package
+                if package.is_direct_origin():
+                    continue
+
+                source = repository_name or self._get_locked_source(package)
+                if source is None:
+                    continue
+
+                key = (package.pretty_name, package.version, repository_name)
+                with self._prefetch_lock:
+                    if key in self._prefetching:
+                        continue
+                    event = self._prefetching[key] = threading.Event()
+
+                batches[source].append((package, event))
+
+        for source, packages in batches.items():
+            self._prefetch_executor.submit(self._prefetch_batch, packages, source)
+
+    def _get_locked_source(self, package: Package) -> str | None:
+        """
+        Returns the name of the repository a locked package has been resolved from
+        according to the lock file if it is in the pool.
+        """
+        if package.source_type == "legacy" and package.source_reference:
+            name = package.source_reference
+        elif package.source_type is None:
+            # Packages from PyPI do not have a source in the lock file.
+            name = "PyPI"
+        else:
+            return None
+
+        return name if self._pool.has_repository(name) else None
+
+    def _prefetch_batch(
+        self,
+        packages: list[tuple[Package, threading.Event]],
+        repository_name: str,
+    ) -> None:
+        from poetry.repositories.http_repository import HTTPRepository
+
+        events = {(package.name, package.version): event for package, event in packages}
+
+        def release_ready(name: NormalizedName, version: Version) -> None:
+            # Do not let the solver wait for the rest of the batch.
+            events[name, version].set()
+
+        try:
+            repository = self._pool.repository(repository_name)
+            if isinstance(repository, HTTPRepository):
+                repository.prefetch_release_info(events, callback=release_ready)
+
+        except Exception as e:
+            logger.debug(
+                "Failed to prefetch metadata of locked packages: %s",
+                e,
+            )
+        finally:
+            for event in events.values():
+                event.set()
+
+    def _prefetch(self, dependency: Dependency, locked: Package | None) -> None:
+        if locked is None:
+            if dependency.name in self._direct_origin_packages:
+                return
+            packages = self._find_packages(dependency)
+            if not packages:
+                return
+            package = packages[0]
+            repository_name = dependency.source_name
+        else:
+            package = locked
+            repository_name = dependency.source_name or self._explicit_sources.get(
+                dependency.name
+            )
+
+        if package.is_direct_origin():
+            return
+
+        key = (package.pretty_name, package.version, repository_name)
+        with self._prefetch_lock:
+            if key in self._prefetching:
+                return
+            event = self._prefetching[key] = threading.Event()
+
+        try:
+            self._pool.package(
+                package.pretty_name, package.version, repository_name=repository_name
+            )
+
+        except Exception as e:
+            logger.debug(
+                "Failed to prefetch metadata of %s (%s): %s",
+                package.pretty_name,
+                package.version,
+                e,
+            )
+        finally:
+            event.set()
+
+    def _get_package_from_pool(
+        self, name: str, version: Version, repository_name: str | None = None
+    ) -> Package:
+        with self._prefetch_lock:
+            event = self._prefetching.get((name, version, repository_name))
+
+        with profiler.profile("metadata fetch"):
+            # If the metadata is currently being fetched in the background,
+            # wait for it instead of fetching it a second time.
+            if event is not None:
+                event.wait()
+
+            return self._pool.package(name, version, repository_name=repository_name)
+
     @staticmethod
     def validate_package_for_dependency(
         dependency: Dependency, package: Package
@@ -297,18 +636,27 @@ class Provider:
             packages = [direct_origin_package]
             return PackageCollection(dependency, packages)
 
-        packages = self._pool.find_packages(dependency)
+        if dependency.name in self._pinned:
+            locked = self.get_locked(dependency)
+            packages = [locked.package] if locked is not None else []
+            return PackageCollection(dependency, packages)
 
-        packages.sort(
-            key=lambda p: (
-                not p.yanked,
-                not p.is_prerelease() and not dependency.allows_prereleases(),
-                p.version,
-            ),
-            reverse=True,
-        )
+        return PackageCollection(dependency, self._find_packages(dependency))
+
+    def _find_packages(self, dependency: Dependency) -> list[Package]:
+        with profiler.profile("metadata fetch"):
+            packages = self._pool.find_packages(dependency)
+
+        # Latest versions first, but stable versions before pre-releases
+        # (unless pre-releases are allowed) and yanked versions last.
+        # Sorting is stable, so sorting by one criterion after the other
+        # avoids comparing tuples, which compares versions twice.
+        packages.sort(key=attrgetter("version"), reverse=True)
+        if not dependency.allows_prereleases():
+            packages.sort(key=methodcaller("is_prerelease"))
+        packages.sort(key=attrgetter("yanked"))
 
-        return PackageCollection(dependency, packages)
+        return packages
 
     def _search_for_vcs(self, dependency: VCSDependency) -> Package:
         """
@@ -468,7 +816,7 @@ class Provider:
             package = dependency_package.package
             dependency = dependency_package.dependency
             requires = package.all_requires
-        elif package.is_direct_origin():
+        elif package.is_direct_origin() or package.name in self._pinned:
             requires = package.requires
         else:
             dependency_package = DependencyPackage(
@@ -630,7 +978,7 @@ class Provider:
                             )
                         )
                 if all(len(d) == 1 for d in duplicates_by_extras.values()) and all(
-                    d1[0].marker.intersect(d2[0].marker).is_empty()
+                    algebra.marker_intersect(d1[0].marker, d2[0].marker).is_empty()
                     for d1, d2 in itertools.combinations(
                         duplicates_by_extras.values(), 2
                     )
@@ -654,8 +1002,8 @@ class Provider:
             deps = [
                 dep
                 for dep in deps
-                if not self._overrides_marker_intersection.intersect(
-                    dep.marker
+                if not algebra.marker_intersect(
+                    self._overrides_marker_intersection, dep.marker
                 ).is_empty()
             ]
             if len(deps) < 2:
@@ -745,6 +1093,8 @@ class Provider:
                 if dep.source_name:
                     self._explicit_sources[dep.name] = dep.source_name
 
+        self.prefetch(clean_dependencies)
+
         return dependency_package
 
     def get_locked(self, dependency: Dependency) -> DependencyPackage | None:
@@ -915,7 +1265,7 @@ class Provider:
         return (
             not marker.is_empty()
             and self._python_constraint.allows_any(
-                get_python_constraint_from_marker(marker)
+                algebra.python_constraint_from_marker(marker)
             )
             and (active_extras is None or marker.validate({"extra": active_extras}))
             and (not self._env or marker.validate(self._env.marker_env))
@@ -950,14 +1300,16 @@ class Provider:
             # Further, we intersect the inverted markers at last because
             # they are more likely to overlap than the non-inverted ones.
             markers = (
-                dep.marker if use else dep.marker.invert()
+                dep.marker if use else algebra.marker_invert(dep.marker)
                 for use, dep in sorted(
                     zip(uses, dependencies), key=lambda ud: ud[0], reverse=True
                 )
             )
             used_marker_intersection: BaseMarker = AnyMarker()
             for m in markers:
-                used_marker_intersection = used_marker_intersection.intersect(m)
+                used_marker_intersection = algebra.marker_intersect(
+                    used_marker_intersection, m
+                )
             if not self._is_relevant_marker(used_marker_intersection, active_extras):
                 continue
 
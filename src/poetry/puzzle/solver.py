@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import functools
+import logging
+import multiprocessing
+import sys
 import time
 
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
@@ -13,13 +16,20 @@ from poetry.core.version.markers import MultiMarker
 from poetry.core.version.markers import SingleMarker
 from poetry.core.version.markers import parse_marker
 
+from poetry.config.config import Config
+from poetry.console.exceptions import ConsoleMessage
+from poetry.console.exceptions import PoetryRuntimeError
 from poetry.mixology import resolve_version
 from poetry.mixology.failure import SolveFailureError
+from poetry.mixology.heuristics import HEURISTICS
+from poetry.mixology.heuristics import get_heuristic
 from poetry.packages.transitive_package_info import TransitivePackageInfo
 from poetry.puzzle.exceptions import OverrideNeededError
 from poetry.puzzle.exceptions import SolverProblemError
 from poetry.puzzle.provider import Indicator
 from poetry.puzzle.provider import Provider
+from poetry.utils import algebra
+from poetry.utils import profiler
 
 
 if TYPE_CHECKING:
@@ -29,6 +39,7 @@ if TYPE_CHECKING:
 
     from cleo.io.io import IO
     from packaging.utils import NormalizedName
+    from poetry.core.constraints.version import Version
     from poetry.core.constraints.version import VersionConstraint
     from poetry.core.packages.dependency import Dependency
     from poetry.core.packages.package import Package
@@ -43,6 +54,13 @@ if TYPE_CHECKING:
     MarkerOriginDict = defaultdict[Package, defaultdict[Package, BaseMarker]]
 
 
+logger = logging.getLogger(__name__)
+
+# The solver of a forked process solving overrides, set by the initializer
+# of the process (see Solver._solve_overrides_in_processes()).
+_override_solver: Solver | None = None
+
+
 class Solver:
     def __init__(
         self,
@@ -52,6 +70,7 @@ class Solver:
         locked: list[Package],
         io: IO,
         active_root_extras: Collection[NormalizedName] | None = None,
+        heuristic: str | None = None,
     ) -> None:
         self._package = package
         self._pool = pool
@@ -67,6 +86,15 @@ class Solver:
             active_root_extras=active_root_extras,
         )
         self._overrides: list[dict[Package, dict[str, Dependency]]] = []
+        self._max_workers: int = Config.create().get("solver.max-workers")
+        self._indicator: Indicator | None = None
+        self._heuristic: str = heuristic or Config.create().get("solver.heuristic")
+        if self._heuristic not in HEURISTICS:
+            raise PoetryRuntimeError(
+                f"Invalid value for the <c1>solver.heuristic</> setting:"
+                f" {self._heuristic}",
+                [ConsoleMessage(f"Use one of {', '.join(HEURISTICS)}.")],
+            )
 
     @property
     def provider(self) -> Provider:
@@ -78,11 +106,18 @@ class Solver:
             yield
 
     def solve(
-        self, use_latest: Collection[NormalizedName] | None = None
+        self,
+        use_latest: Collection[NormalizedName] | None = None,
+        pinned: Collection[NormalizedName] | None = None,
     ) -> Transaction:
         from poetry.puzzle.transaction import Transaction
 
-        with self._progress(), self._provider.use_latest_for(use_latest or []):
+        with (
+            self._progress(),
+            self._provider.use_latest_for(use_latest or []),
+            self._provider.use_pinned_for(pinned or []),
+            self._provider.use_prefetching(),
+        ):
             start = time.time()
             packages = self._solve()
             # simplify markers by removing redundant information
@@ -105,6 +140,11 @@ class Solver:
                     f" {', '.join(f'({b})' for b in self._overrides)}"
                 )
 
+            if self._provider.is_debugging():
+                self._provider.debug(
+                    "Marker and constraint caches:\n" + algebra.format_cache_info()
+                )
+
         for p in packages:
             if p.yanked:
                 message = (
@@ -136,38 +176,153 @@ class Solver:
                 "<info>Resolving dependencies...</info>",
                 "<info>Resolving dependencies...</info>",
             ):
+                self._indicator = indicator
+                try:
+                    yield
+                finally:
+                    self._indicator = None
+
+    @contextmanager
+    def _suspend_threads(self) -> Iterator[None]:
+        """
+        Stops all background threads (progress indicator and prefetching)
+        until the context is left. A thread that holds a lock while the process
+        is forked would leave that lock held forever in the child process.
+        """
+        with self._provider.suspend_prefetching():
+            if self._indicator is None:
                 yield
+            else:
+                with self._indicator.suspend():
+                    yield
 
     def _solve_in_compatibility_mode(
         self,
         overrides: tuple[dict[Package, dict[str, Dependency]], ...],
     ) -> dict[Package, TransitivePackageInfo]:
+        results: list[dict[Package, TransitivePackageInfo] | None] = [None] * len(
+            overrides
+        )
+        workers = min(self._max_workers, len(overrides))
+        if (
+            workers > 1
+            # Debug output of concurrent processes would be interleaved
+            # and a profile cannot record what happens in other processes.
+            and not self._provider.is_debugging()
+            and profiler.get_profiler() is None
+            # Forking a process with running threads (e.g. of the prefetching)
+            # is only safe enough on Linux. On macOS, it can crash
+            # (which is why "fork" is not the default start method there).
+            and sys.platform == "linux"
+            # Results with directory dependencies cannot be transferred
+            # between processes.
+            and not any(
+                dependency.source_type == "directory"
+                for dependency in self._package.all_requires
+            )
+        ):
+            results = self._solve_overrides_in_processes(overrides, workers)
+
         override_packages: list[
             tuple[
                 dict[Package, dict[str, Dependency]],
                 dict[Package, TransitivePackageInfo],
             ]
         ] = []
-        for override in overrides:
-            self._provider.debug(
-                # ignore the warning as provider does not do interpolation
-                "<comment>Retrying dependency resolution "
-                f"with the following overrides ({override}).</comment>"
-            )
-            self._provider.set_overrides(override)
-            new_packages = self._solve()
+        for override, new_packages in zip(overrides, results):
+            if new_packages is None:
+                # Solve serially if the override has not been solved
+                # in a separate process, e.g. because solving failed.
+                new_packages = self._solve_with_overrides(override)
             override_packages.append((override, new_packages))
 
         return merge_override_packages(
             override_packages, self._package.python_constraint
         )
 
+    def _solve_with_overrides(
+        self, override: dict[Package, dict[str, Dependency]]
+    ) -> dict[Package, TransitivePackageInfo]:
+        self._provider.debug(
+            # ignore the warning as provider does not do interpolation
+            "<comment>Retrying dependency resolution "
+            f"with the following overrides ({override}).</comment>"
+        )
+        self._provider.set_overrides(override)
+
+        return self._solve()
+
+    def _solve_overrides_in_processes(
+        self,
+        overrides: tuple[dict[Package, dict[str, Dependency]], ...],
+        workers: int,
+    ) -> list[dict[Package, TransitivePackageInfo] | None]:
+        """
+        Solves the overrides concurrently in forked processes, which inherit
+        the state of the solver (including the warm in-memory caches).
+        The results are returned in the order of the overrides,
+        None for each override that could not be solved this way.
+        """
+        # When solving serially, each solve sees the direct origin packages
+        # found by the previous ones. Emulate this for the direct origin
+        # dependencies of the overrides, which are always resolved first.
+        direct_origin_packages = []
+        try:
+            for override in overrides:
+                direct_origin_packages.append(
+                    dict(self._provider._direct_origin_packages)
+                )
+                for dependencies in override.values():
+                    for dependency in dependencies.values():
+                        if dependency.is_direct_origin():
+                            self._provider.search_for(dependency)
+        except Exception as e:
+            logger.debug("Failed to resolve direct origin dependencies: %s", e)
+            return [None] * len(overrides)
+
+        results: list[dict[Package, TransitivePackageInfo] | None] = []
+        with self._suspend_threads():
+            try:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("fork"),
+                    initializer=_init_override_process,
+                    # With fork, the solver is not pickled but shared by reference.
+                    initargs=(self,),
+                ) as executor:
+                    futures = [
+                        executor.submit(_solve_override, override, packages)
+                        for override, packages in zip(overrides, direct_origin_packages)
+                    ]
+                    # Collect the results in the order of the overrides
+                    # (and not in the order of completion) to be deterministic.
+                    for future in futures:
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            logger.debug("Failed to solve overrides in process: %s", e)
+                            result = None
+
+                        if result is None:
+                            results.append(None)
+                        else:
+                            packages, solved_overrides = result
+                            self._overrides.extend(solved_overrides)
+                            results.append(packages)
+            except OSError as e:
+                logger.debug("Failed to start processes to solve overrides: %s", e)
+                results = [None] * len(overrides)
+
+        return results
+
     def _solve(self) -> dict[Package, TransitivePackageInfo]:
         if self._provider._overrides:
             self._overrides.append(self._provider._overrides)
 
         try:
-            result = resolve_version(self._package, self._provider)
+            result = resolve_version(
+                self._package, self._provider, get_heuristic(self._heuristic)
+            )
 
             packages = result.packages
         except OverrideNeededError as e:
@@ -186,33 +341,11 @@ class Solver:
         results = dict(aggregate_package_nodes(nodes) for nodes in combined_nodes)
         calculate_markers(results, markers)
 
-        # Merging feature packages with base packages
-        solved_packages = {}
-        for package in packages:
-            if package.features:
-                for _package in packages:
-                    if (
-                        not _package.features
-                        and _package.name == package.name
-                        and _package.version == package.version
-                    ):
-                        for dep in package.requires:
-                            # Prevent adding base package as a dependency to itself
-                            if _package.name == dep.name:
-                                continue
-
-                            # Avoid duplication.
-                            if any(
-                                _dep == dep and _dep.marker == dep.marker
-                                for _dep in _package.requires
-                            ):
-                                continue
-
-                            _package.add_dependency(dep)
-            else:
-                solved_packages[package] = results[package]
+        merge_feature_packages(packages)
 
-        return solved_packages
+        return {
+            package: results[package] for package in packages if not package.features
+        }
 
 
 DFSNodeID = tuple[str, frozenset[str], bool]
@@ -273,10 +406,11 @@ def dfs_visit(
     for out_neighbor in node.reachable():
         back_edges[out_neighbor.id].append(node)
         marker = markers[out_neighbor.package][node.package]
-        markers[out_neighbor.package][node.package] = marker.union(
+        markers[out_neighbor.package][node.package] = algebra.marker_union(
+            marker,
             out_neighbor.marker
             if node.package.is_root()
-            else out_neighbor.marker.without_extras()
+            else out_neighbor.marker.without_extras(),
         )
         dfs_visit(out_neighbor, back_edges, visited, sorted_nodes, markers)
     sorted_nodes.insert(0, node)
@@ -380,39 +514,163 @@ def aggregate_package_nodes(
 def calculate_markers(
     packages: dict[Package, TransitivePackageInfo], markers: MarkerOriginDict
 ) -> None:
-    # group packages by depth
-    packages_by_depth: dict[int, list[Package]] = defaultdict(list)
-    max_depth = -1
-    for package, info in packages.items():
-        max_depth = max(max_depth, info.depth)
-        packages_by_depth[info.depth].append(package)
-
-    # calculate markers from lowest to highest depth
-    # (start with depth 0 because the root package has depth -1)
-    has_incomplete_markers = True
-    while has_incomplete_markers:
-        has_incomplete_markers = False
-        for depth in range(max_depth + 1):
-            for package in packages_by_depth[depth]:
-                transitive_info = packages[package]
-                transitive_marker: dict[NormalizedName, BaseMarker] = {
-                    group: EmptyMarker() for group in transitive_info.groups
+    """
+    Calculates the transitive marker of each package per group, i.e. the union
+    of the intersections of the markers along all paths from the root package.
+
+    The strongly connected components of the dependency graph are processed
+    in topological order so that the markers of all parents outside
+    a component are complete when the component is processed.
+    Thus, each dependency is only processed once, except for dependencies
+    inside a cycle, which are processed until the markers of the cycle are stable.
+    """
+    for component in _strongly_connected_components(packages, markers):
+        if len(component) == 1 and component[0] not in markers[component[0]]:
+            package = component[0]
+            packages[package].markers = _transitive_markers(package, packages, markers)
+            continue
+
+        for package in component:
+            packages[package].markers = {
+                group: EmptyMarker() for group in packages[package].groups
+            }
+
+        # A path through a cycle cannot contribute more than the same path
+        # without the cycle. Therefore, after as many iterations as the cycle
+        # has packages, all relevant paths have been considered.
+        for _ in range(len(component)):
+            changed = False
+            for package in component:
+                transitive_marker = _transitive_markers(package, packages, markers)
+                if transitive_marker != packages[package].markers:
+                    packages[package].markers = transitive_marker
+                    changed = True
+            if not changed:
+                break
+
+
+def _transitive_markers(
+    package: Package,
+    packages: dict[Package, TransitivePackageInfo],
+    markers: MarkerOriginDict,
+) -> dict[NormalizedName, BaseMarker]:
+    transitive_info = packages[package]
+    transitive_marker: dict[NormalizedName, BaseMarker] = {
+        group: EmptyMarker() for group in transitive_info.groups
+    }
+    for parent, m in markers[package].items():
+        parent_info = packages[parent]
+        if parent_info.groups:
+            for group in parent_info.groups:
+                transitive_marker[group] = algebra.marker_union(
+                    transitive_marker[group],
+                    algebra.marker_intersect(parent_info.markers[group], m),
+                )
+        else:
+            for group in transitive_info.groups:
+                transitive_marker[group] = algebra.marker_union(
+                    transitive_marker[group], m
+                )
+
+    return transitive_marker
+
+
+def _strongly_connected_components(
+    packages: dict[Package, TransitivePackageInfo], markers: MarkerOriginDict
+) -> list[list[Package]]:
+    """
+    Returns the strongly connected components of the dependency graph
+    in topological order (parents before children) using Tarjan's algorithm.
+    """
+    children: dict[Package, list[Package]] = defaultdict(list)
+    for package in packages:
+        for parent in markers[package]:
+            children[parent].append(package)
+
+    index: dict[Package, int] = {}
+    low_link: dict[Package, int] = {}
+    stack: list[Package] = []
+    on_stack: set[Package] = set()
+    components: list[list[Package]] = []
+
+    for source in packages:
+        if source in index:
+            continue
+
+        index[source] = low_link[source] = len(index)
+        stack.append(source)
+        on_stack.add(source)
+        # The packages whose children are being visited and an iterator over
+        # the remaining children (instead of recursion to not hit the limit).
+        work = [(source, iter(children[source]))]
+        while work:
+            package, remaining_children = work[-1]
+            for child in remaining_children:
+                if child not in index:
+                    index[child] = low_link[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(children[child])))
+                    break
+                if child in on_stack:
+                    low_link[package] = min(low_link[package], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[package])
+                if low_link[package] == index[package]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        component.append(member)
+                        if member is package:
+                            break
+                    components.append(component)
+
+    # Tarjan's algorithm finds the components in reverse topological order.
+    components.reverse()
+    return components
+
+
+def merge_feature_packages(packages: list[Package]) -> None:
+    """
+    Adds the dependencies of feature packages (e.g. foo[extra])
+    to the corresponding base packages (foo).
+    """
+    base_packages: dict[tuple[NormalizedName, Version], list[Package]] = defaultdict(
+        list
+    )
+    for package in packages:
+        if not package.features:
+            base_packages[package.name, package.version].append(package)
+
+    # The dependencies (with their markers) of the base packages
+    # to avoid duplicates, only built for base packages with features.
+    base_requires: dict[Package, set[tuple[Dependency, BaseMarker]]] = {}
+    for package in packages:
+        if not package.features:
+            continue
+
+        for base_package in base_packages.get((package.name, package.version), []):
+            requires = base_requires.get(base_package)
+            if requires is None:
+                requires = base_requires[base_package] = {
+                    (dep, dep.marker) for dep in base_package.requires
                 }
-                for parent, m in markers[package].items():
-                    parent_info = packages[parent]
-                    if parent_info.groups:
-                        if parent_info.groups != set(parent_info.markers):
-                            # there is a cycle -> we need one more iteration
-                            has_incomplete_markers = True
-                            continue
-                        for group in parent_info.groups:
-                            transitive_marker[group] = transitive_marker[group].union(
-                                parent_info.markers[group].intersect(m)
-                            )
-                    else:
-                        for group in transitive_info.groups:
-                            transitive_marker[group] = transitive_marker[group].union(m)
-                transitive_info.markers = transitive_marker
+
+            for dep in package.requires:
+                # Prevent adding base package as a dependency to itself
+                if base_package.name == dep.name:
+                    continue
+
+                # Avoid duplication.
+                if (dep, dep.marker) in requires:
+                    continue
+
+                base_package.add_dependency(dep)
+                requires.add((dep, dep.marker))
 
 
 def merge_override_packages(
@@ -431,7 +689,9 @@ def merge_override_packages(
         override_marker: BaseMarker = AnyMarker()
         for deps in override.values():
             for dep in deps.values():
-                override_marker = override_marker.intersect(dep.marker.without_extras())
+                override_marker = algebra.marker_intersect(
+                    override_marker, dep.marker.without_extras()
+                )
         override_marker = simplify_marker(override_marker, python_constraint)
         for package, info in o_packages.items():
             for group, marker in info.markers.items():
@@ -462,20 +722,23 @@ def merge_override_packages(
             # we can use less expensive marker operations
             override_marker = EmptyMarker()
             for _, _, marker in package_duplicates:
-                override_marker = override_marker.union(marker)
+                override_marker = algebra.marker_union(override_marker, marker)
             package_info.markers = {
-                group: override_marker.intersect(marker)
+                group: algebra.marker_intersect(override_marker, marker)
                 for group, marker in package_info.markers.items()
             }
         else:
             # fallback / general algorithm with performance issues
             for group, marker in package_info.markers.items():
-                package_info.markers[group] = first_override_marker.intersect(marker)
+                package_info.markers[group] = algebra.marker_intersect(
+                    first_override_marker, marker
+                )
             for _, info, override_marker in remaining:
                 for group, marker in info.markers.items():
-                    package_info.markers[group] = package_info.markers.get(
-                        group, EmptyMarker()
-                    ).union(override_marker.intersect(marker))
+                    package_info.markers[group] = algebra.marker_union(
+                        package_info.markers.get(group, EmptyMarker()),
+                        algebra.marker_intersect(override_marker, marker),
+                    )
         for duplicate_package, _, _ in remaining:
             for dep in duplicate_package.requires:
                 if dep not in package.requires:
@@ -483,6 +746,7 @@ def merge_override_packages(
     return result
 
 
+@algebra.memoize_markers("marker without other marker")
 def remove_other_from_marker(marker: BaseMarker, other: BaseMarker) -> BaseMarker:
     if isinstance(other, SingleMarker):
         other_markers: set[BaseMarker] = {other}
@@ -495,7 +759,7 @@ def remove_other_from_marker(marker: BaseMarker, other: BaseMarker) -> BaseMarke
     return marker
 
 
-@functools.cache
+@algebra.memoize_markers("simplified markers")
 def simplify_marker(
     marker: BaseMarker, python_constraint: VersionConstraint
 ) -> BaseMarker:
@@ -505,3 +769,42 @@ def simplify_marker(
     Use cache because we call this function often for the same markers.
     """
     return marker.reduce_by_python_constraint(python_constraint)
+
+
+def _init_override_process(solver: Solver) -> None:
+    from poetry.repositories.http_repository import HTTPRepository
+
+    global _override_solver
+    _override_solver = solver
+
+    # Do not share connections with the parent process
+    # and do not fork again if further overrides are needed.
+    for repository in solver.provider.pool.all_repositories:
+        if isinstance(repository, HTTPRepository):
+            repository.session.reset_sessions()
+    solver._max_workers = 1
+
+
+def _solve_override(
+    override: dict[Package, dict[str, Dependency]],
+    direct_origin_packages: dict[str, Package],
+) -> (
+    tuple[
+        dict[Package, TransitivePackageInfo],
+        list[dict[Package, dict[str, Dependency]]],
+    ]
+    | None
+):
+    solver = _override_solver
+    assert solver is not None
+
+    solver._overrides = []
+    solver.provider._direct_origin_packages = direct_origin_packages
+    try:
+        packages = solver._solve_with_overrides(override)
+    except Exception:
+        # The override is solved again in the parent process
+        # so that errors are reported as usual.
+        return None
+
+    return packages, solver._overrides
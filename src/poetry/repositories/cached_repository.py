@@ -10,7 +10,8 @@ from poetry.core.constraints.version import parse_constraint
 
 from poetry.config.config import Config
 from poetry.repositories.repository import Repository
-from poetry.utils.cache import FileCache
+from poetry.utils import profiler
+from poetry.utils.cache import CACHE_BACKENDS
 
 
 if TYPE_CHECKING:
@@ -19,6 +20,7 @@ if TYPE_CHECKING:
     from poetry.core.packages.package import Package
 
     from poetry.inspection.info import PackageInfo
+    from poetry.utils.cache import FileCache
 
 
 class CachedRepository(Repository, ABC):
@@ -28,9 +30,12 @@ class CachedRepository(Repository, ABC):
         self, name: str, *, disable_cache: bool = False, config: Config | None = None
     ) -> None:
         super().__init__(name)
+        config = config or Config.create()
         self._disable_cache = disable_cache
-        self._cache_dir = (config or Config.create()).repository_cache_directory / name
-        self._release_cache: FileCache[dict[str, Any]] = FileCache(path=self._cache_dir)
+        self._cache_dir = config.repository_cache_directory / name
+        self._release_cache: FileCache[dict[str, Any]] = CACHE_BACKENDS[
+            config.get("cache.release-backend")
+        ](path=self._cache_dir)
 
     @abstractmethod
     def _get_release_info(
@@ -49,9 +54,13 @@ class CachedRepository(Repository, ABC):
         if self._disable_cache:
             return PackageInfo.load(self._get_release_info(name, version))
 
-        cached = self._release_cache.remember(
-            f"{name}:{version}", lambda: self._get_release_info(name, version)
-        )
+        cached = self._release_cache.get(f"{name}:{version}")
+        if cached is None:
+            profiler.count("release cache misses")
+            cached = self._get_release_info(name, version)
+            self._release_cache.put(f"{name}:{version}", cached)
+        else:
+            profiler.count("release cache hits")
 
         cache_version = cached.get("_cache_version", "0.0.0")
         if parse_constraint(cache_version) != self.CACHE_VERSION:
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
-import functools
 import hashlib
+import threading
 
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from contextlib import suppress
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import cast
 
 import requests
 import requests.adapters
@@ -26,7 +29,9 @@ from poetry.repositories.cached_repository import CachedRepository
 from poetry.repositories.exceptions import PackageNotFoundError
 from poetry.repositories.exceptions import RepositoryError
 from poetry.repositories.link_sources.html import HTMLPage
+from poetry.repositories.link_sources.json import SimpleJsonPage
 from poetry.utils.authenticator import Authenticator
+from poetry.utils.cache import FileCache
 from poetry.utils.constants import REQUESTS_TIMEOUT
 from poetry.utils.helpers import HTTPRangeRequestSupportedError
 from poetry.utils.helpers import download_file
@@ -35,16 +40,34 @@ from poetry.utils.patterns import wheel_file_re
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Collection
+    from collections.abc import Iterable
     from collections.abc import Iterator
 
     from packaging.utils import NormalizedName
+    from poetry.core.constraints.version import Version
     from poetry.core.packages.utils.link import Link
 
     from poetry.repositories.link_sources.base import LinkSource
     from poetry.utils.authenticator import RepositoryCertificateConfig
 
 
+PAGE_CHUNK_SIZE = 64 * 1024
+# like the retries of the authenticator when connecting
+PAGE_READ_RETRIES = 5
+
+SIMPLE_API_JSON = "application/vnd.pypi.simple.v1+json"
+# see https://peps.python.org/pep-0691/#version-format-selection
+SIMPLE_API_ACCEPT = (
+    f"{SIMPLE_API_JSON}, application/vnd.pypi.simple.v1+html;q=0.2, text/html;q=0.01"
+)
+
+
 class HTTPRepository(CachedRepository):
+    # How long it is remembered (in other runs) whether a domain supports range requests
+    RANGE_REQUESTS_CACHE_MINUTES = 7 * 24 * 60
+
     def __init__(
         self,
         name: str,
@@ -65,7 +88,10 @@ class HTTPRepository(CachedRepository):
             pool_size=pool_size,
         )
         self._authenticator.add_repository(name, url)
-        self.get_page = functools.lru_cache(maxsize=None)(self._get_page)
+        self._pool_size = pool_size
+        # The pages of packages, shared by all threads (see get_page())
+        self._pages: dict[str, Future[LinkSource]] = {}
+        self._pages_lock = threading.Lock()
 
         self._lazy_wheel = config.get("solver.lazy-wheel", True)
         self._max_retries = config.get("requests.max-retries", 0)
@@ -76,7 +102,167 @@ class HTTPRepository(CachedRepository):
         # - Domain not in dict: We don't know anything.
         # - True: The domain supports range requests for at least some files.
         # - False: The domain does not support range requests for the files we tried.
+        # The dict is filled from the cache (see _get_supports_range_requests())
+        # so that we do not have to find out again in each run.
         self._supports_range_requests: dict[str, bool] = {}
+        # The domains whose entry has been loaded from the cache
+        # but has not been confirmed by a request in this run yet.
+        self._unconfirmed_range_requests: set[str] = set()
+        self._range_requests_cache: FileCache[bool] = FileCache(
+            path=self._cache_dir / "_range-requests"
+        )
+        # Metadata files fetched in advance (see fetch_metadata()),
+        # which are consumed when the release info is retrieved.
+        self._metadata: dict[str, PackageInfo | None] = {}
+
+    def get_page(self, name: str) -> LinkSource:
+        """
+        Returns the page of a package, which is only fetched once.
+        If the page is being fetched by another thread (e.g. prefetched
+        in the background), waits for it instead of fetching it again.
+        """
+        with self._pages_lock:
+            page = self._pages.get(name)
+            fetch = page is None
+            if page is None:
+                page = self._pages[name] = Future()
+
+        if fetch:
+            try:
+                page.set_result(self._get_page(cast("NormalizedName", name)))
+            except BaseException as e:
+                # Like results, errors are passed to waiting threads,
+                # but they are not cached.
+                with self._pages_lock:
+                    del self._pages[name]
+                page.set_exception(e)
+                raise
+
+        return page.result()
+
+    def fetch_metadata(self, links: Iterable[Link]) -> None:
+        """
+        Fetches the metadata files (PEP 658) of the given links concurrently,
+        with at most as many requests at a time as there are pooled connections.
+
+        The metadata is verified against the hashes of the links and kept
+        until the release info of the links is retrieved so that it does
+        not have to be fetched one release after another.
+        """
+        metadata_urls = {
+            link.metadata_url: link
+            for link in links
+            if link.has_metadata
+            and link.metadata_url is not None
+            and link.metadata_url not in self._metadata
+        }
+        if not metadata_urls:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._pool_size, len(metadata_urls)),
+            thread_name_prefix="poetry-metadata",
+        ) as executor:
+            futures = {
+                url: executor.submit(self._fetch_metadata, link)
+                for url, link in metadata_urls.items()
+            }
+            for url, future in futures.items():
+                try:
+                    self._metadata[url] = future.result()
+                except Exception as e:
+                    # The metadata will be fetched again when it is required.
+                    self._log(
+                        f"Failed to prefetch metadata at {url}: {e}", level="debug"
+                    )
+
+    def prefetch_release_info(
+        self,
+        releases: Iterable[tuple[NormalizedName, Version]],
+        callback: Callable[[NormalizedName, Version], None] | None = None,
+    ) -> None:
+        """
+        Retrieves the release information of many releases concurrently
+        and stores it in the release cache.
+
+        The metadata files of all releases that are not cached yet
+        are fetched in one batch (see fetch_metadata()).
+        Errors are ignored because they will be raised again
+        when the release information is actually required.
+
+        If a callback is given, it is called for each release
+        as soon as its release information has been retrieved (or has failed),
+        without waiting for the other releases.
+        """
+        releases = list(dict.fromkeys(releases))
+        cached = (
+            {}
+            if self._disable_cache
+            else self._release_cache.get_many(
+                f"{name}:{version}" for name, version in releases
+            )
+        )
+        missing = []
+        for name, version in releases:
+            if f"{name}:{version}" not in cached:
+                missing.append((name, version))
+            elif callback is not None:
+                callback(name, version)
+        if not missing:
+            return
+
+        links: list[Link] = []
+        for name, version in missing:
+            try:
+                links.extend(self._get_metadata_links(name, version))
+            except (PackageNotFoundError, RepositoryError) as e:
+                self._log(
+                    f"Failed to find the links of {name} ({version}): {e}",
+                    level="debug",
+                )
+        self.fetch_metadata(links)
+
+        if self._disable_cache:
+            # There is no cache to fill.
+            if callback is not None:
+                for release in missing:
+                    callback(*release)
+            return
+
+        def get_release_info(release: tuple[NormalizedName, Version]) -> None:
+            try:
+                self.get_release_info(*release)
+            except Exception as e:
+                self._log(
+                    f"Failed to prefetch the release info of {release[0]}"
+                    f" ({release[1]}): {e}",
+                    level="debug",
+                )
+            finally:
+                if callback is not None:
+                    callback(*release)
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._pool_size, len(missing)),
+            thread_name_prefix="poetry-release-info",
+        ) as executor:
+            # consume the iterator to wait for all releases
+            list(executor.map(get_release_info, missing))
+
+    def _get_metadata_links(self, name: NormalizedName, version: Version) -> list[Link]:
+        """
+        Returns the links whose metadata is read
+        to retrieve the release information of a release.
+        """
+        page = self.get_page(name)
+        return [
+            link
+            for link in self._get_preferred_links(
+                list(page.links_for_version(name, version)),
+                ignore_yanked=not page.yanked(name, version),
+            )
+            if link.has_metadata
+        ]
 
     @property
     def session(self) -> Authenticator:
@@ -95,14 +281,20 @@ class HTTPRepository(CachedRepository):
         return self._authenticator.authenticated_url(url=self.url)
 
     def _download(
-        self, url: str, dest: Path, *, raise_accepts_ranges: bool = False
-    ) -> None:
+        self,
+        url: str,
+        dest: Path,
+        *,
+        raise_accepts_ranges: bool = False,
+        hash_names: Collection[str] = (),
+    ) -> dict[str, str]:
         return download_file(
             url,
             dest,
             session=self.session,
             raise_accepts_ranges=raise_accepts_ranges,
             max_retries=self._max_retries,
+            hash_names=hash_names,
         )
 
     @contextmanager
@@ -125,22 +317,27 @@ class HTTPRepository(CachedRepository):
         # If "lazy-wheel" is enabled and the domain supports range requests
         # or we don't know yet, we try range requests.
         raise_accepts_ranges = self._lazy_wheel
-        if self._lazy_wheel and self._supports_range_requests.get(netloc, True):
+        if self._lazy_wheel and self._get_supports_range_requests(netloc) is not False:
             try:
                 package_info = PackageInfo.from_metadata(
                     metadata_from_wheel_url(link.filename, link.url, self.session)
                 )
             except LazyWheelUnsupportedError as e:
                 # Do not set to False if we already know that the domain supports
-                # range requests for some URLs!
+                # range requests for some URLs! However, if we only know it from
+                # a previous run, it might not be true anymore.
                 self._log(
                     f"Disabling lazy wheel support for {netloc}: {e}",
                     level="debug",
                 )
                 raise_accepts_ranges = False
-                self._supports_range_requests.setdefault(netloc, False)
+                if (
+                    netloc not in self._supports_range_requests
+                    or netloc in self._unconfirmed_range_requests
+                ):
+                    self._set_supports_range_requests(netloc, False)
             else:
-                self._supports_range_requests[netloc] = True
+                self._set_supports_range_requests(netloc, True)
                 return package_info
 
         try:
@@ -157,9 +354,32 @@ class HTTPRepository(CachedRepository):
                 f"Abort downloading {link.url} because server supports range requests",
                 level="debug",
             )
-            self._supports_range_requests[netloc] = True
+            self._set_supports_range_requests(netloc, True)
             return self._get_info_from_wheel(link)
 
+    def _get_supports_range_requests(self, netloc: str) -> bool | None:
+        if netloc not in self._supports_range_requests and not self._disable_cache:
+            supported = self._range_requests_cache.get(netloc)
+            if supported is not None:
+                self._supports_range_requests[netloc] = supported
+                self._unconfirmed_range_requests.add(netloc)
+
+        return self._supports_range_requests.get(netloc)
+
+    def _set_supports_range_requests(self, netloc: str, supported: bool) -> None:
+        if (
+            self._supports_range_requests.get(netloc) is supported
+            and netloc not in self._unconfirmed_range_requests
+        ):
+            return
+
+        self._supports_range_requests[netloc] = supported
+        self._unconfirmed_range_requests.discard(netloc)
+        if not self._disable_cache:
+            self._range_requests_cache.put(
+                netloc, supported, minutes=self.RANGE_REQUESTS_CACHE_MINUTES
+            )
+
     def _get_info_from_sdist(self, link: Link) -> PackageInfo:
         from poetry.inspection.info import PackageInfo
 
@@ -167,6 +387,12 @@ class HTTPRepository(CachedRepository):
             return PackageInfo.from_sdist(filepath)
 
     def _get_info_from_metadata(self, link: Link) -> PackageInfo | None:
+        with suppress(KeyError):
+            return self._metadata.pop(cast("str", link.metadata_url))
+
+        return self._fetch_metadata(link)
+
+    def _fetch_metadata(self, link: Link) -> PackageInfo | None:
         if link.has_metadata:
             try:
                 assert link.metadata_url is not None
@@ -199,9 +425,14 @@ class HTTPRepository(CachedRepository):
 
         return None
 
-    def _get_info_from_links(
+    def _get_preferred_links(
         self, links: list[Link], *, ignore_yanked: bool
-    ) -> PackageInfo:
+    ) -> list[Link]:
+        """
+        Returns the links whose metadata is read to retrieve the release info,
+        which is either one link or a python2 and a python3 wheel whose
+        metadata has to be combined.
+        """
         # Sort links by distribution type
         wheels: list[Link] = []
         sdists: list[Link] = []
@@ -252,86 +483,87 @@ class HTTPRepository(CachedRepository):
                     platform_specific_wheels.append(wheel)
 
             if universal_wheel is not None:
-                return self._get_info_from_metadata(
-                    universal_wheel
-                ) or self._get_info_from_wheel(universal_wheel)
+                return [universal_wheel]
 
-            info = None
             if universal_python2_wheel and universal_python3_wheel:
-                info = self._get_info_from_metadata(
-                    universal_python2_wheel
-                ) or self._get_info_from_wheel(universal_python2_wheel)
-
-                py3_info = self._get_info_from_metadata(
-                    universal_python3_wheel
-                ) or self._get_info_from_wheel(universal_python3_wheel)
-
-                if info.requires_python or py3_info.requires_python:
-                    info.requires_python = str(
-                        parse_constraint(info.requires_python or "^2.7").union(
-                            parse_constraint(py3_info.requires_python or "^3")
-                        )
-                    )
-
-                if py3_info.requires_dist:
-                    if not info.requires_dist:
-                        info.requires_dist = py3_info.requires_dist
-
-                        return info
-
-                    py2_requires_dist = {
-                        Dependency.create_from_pep_508(r).to_pep_508()
-                        for r in info.requires_dist
-                    }
-                    py3_requires_dist = {
-                        Dependency.create_from_pep_508(r).to_pep_508()
-                        for r in py3_info.requires_dist
-                    }
-                    base_requires_dist = py2_requires_dist & py3_requires_dist
-                    py2_only_requires_dist = py2_requires_dist - py3_requires_dist
-                    py3_only_requires_dist = py3_requires_dist - py2_requires_dist
-
-                    # Normalizing requires_dist
-                    requires_dist = list(base_requires_dist)
-                    for requirement in py2_only_requires_dist:
-                        dep = Dependency.create_from_pep_508(requirement)
-                        dep.marker = dep.marker.intersect(
-                            parse_marker("python_version == '2.7'")
-                        )
-                        requires_dist.append(dep.to_pep_508())
-
-                    for requirement in py3_only_requires_dist:
-                        dep = Dependency.create_from_pep_508(requirement)
-                        dep.marker = dep.marker.intersect(
-                            parse_marker("python_version >= '3'")
-                        )
-                        requires_dist.append(dep.to_pep_508())
-
-                    info.requires_dist = sorted(set(requires_dist))
-
-            if info:
-                return info
+                return [universal_python2_wheel, universal_python3_wheel]
 
             # Prefer non platform specific wheels
             if universal_python3_wheel:
-                return self._get_info_from_metadata(
-                    universal_python3_wheel
-                ) or self._get_info_from_wheel(universal_python3_wheel)
+                return [universal_python3_wheel]
 
             if universal_python2_wheel:
-                return self._get_info_from_metadata(
-                    universal_python2_wheel
-                ) or self._get_info_from_wheel(universal_python2_wheel)
+                return [universal_python2_wheel]
 
             if platform_specific_wheels:
-                first_wheel = platform_specific_wheels[0]
-                return self._get_info_from_metadata(
-                    first_wheel
-                ) or self._get_info_from_wheel(first_wheel)
+                return [platform_specific_wheels[0]]
 
-        return self._get_info_from_metadata(sdists[0]) or self._get_info_from_sdist(
-            sdists[0]
-        )
+        return sdists[:1]
+
+    def _get_info_from_links(
+        self, links: list[Link], *, ignore_yanked: bool
+    ) -> PackageInfo:
+        preferred_links = self._get_preferred_links(links, ignore_yanked=ignore_yanked)
+        if len(preferred_links) == 2:
+            universal_python2_wheel, universal_python3_wheel = preferred_links
+            info = self._get_info_from_metadata(
+                universal_python2_wheel
+            ) or self._get_info_from_wheel(universal_python2_wheel)
+
+            py3_info = self._get_info_from_metadata(
+                universal_python3_wheel
+            ) or self._get_info_from_wheel(universal_python3_wheel)
+
+            if info.requires_python or py3_info.requires_python:
+                info.requires_python = str(
+                    parse_constraint(info.requires_python or "^2.7").union(
+                        parse_constraint(py3_info.requires_python or "^3")
+                    )
+                )
+
+            if py3_info.requires_dist:
+                if not info.requires_dist:
+                    info.requires_dist = py3_info.requires_dist
+
+                    return info
+
+                py2_requires_dist = {
+                    Dependency.create_from_pep_508(r).to_pep_508()
+                    for r in info.requires_dist
+                }
+                py3_requires_dist = {
+                    Dependency.create_from_pep_508(r).to_pep_508()
+                    for r in py3_info.requires_dist
+                }
+                base_requires_dist = py2_requires_dist & py3_requires_dist
+                py2_only_requires_dist = py2_requires_dist - py3_requires_dist
+                py3_only_requires_dist = py3_requires_dist - py2_requires_dist
+
+                # Normalizing requires_dist
+                requires_dist = list(base_requires_dist)
+                for requirement in py2_only_requires_dist:
+                    dep = Dependency.create_from_pep_508(requirement)
+                    dep.marker = dep.marker.intersect(
+                        parse_marker("python_version == '2.7'")
+                    )
+                    requires_dist.append(dep.to_pep_508())
+
+                for requirement in py3_only_requires_dist:
+                    dep = Dependency.create_from_pep_508(requirement)
+                    dep.marker = dep.marker.intersect(
+                        parse_marker("python_version >= '3'")
+                    )
+                    requires_dist.append(dep.to_pep_508())
+
+                info.requires_dist = sorted(set(requires_dist))
+
+            return info
+
+        link = preferred_links[0]
+        if link.is_wheel:
+            return self._get_info_from_metadata(link) or self._get_info_from_wheel(link)
+
+        return self._get_info_from_metadata(link) or self._get_info_from_sdist(link)
 
     def _links_to_data(self, links: list[Link], data: PackageInfo) -> dict[str, Any]:
         if not links:
@@ -373,49 +605,58 @@ class HTTPRepository(CachedRepository):
         return data.asdict()
 
     def calculate_sha256(self, link: Link) -> str | None:
-        with self._cached_or_downloaded_file(link) as filepath:
-            hash_name = get_highest_priority_hash_type(link.hashes, link.filename)
-            known_hash = None
+        hash_name = get_highest_priority_hash_type(link.hashes, link.filename)
+        hash_names = {"sha256"}
+        if hash_name:
+            # Handle ValueError here as well since under FIPS environments
+            # this is what is raised (e.g., for MD5)
             with suppress(ValueError, AttributeError):
-                # Handle ValueError here as well since under FIPS environments
-                # this is what is raised (e.g., for MD5)
-                known_hash = getattr(hashlib, hash_name)() if hash_name else None
-            required_hash = hashlib.sha256()
-
-            chunksize = 4096
-            with filepath.open("rb") as f:
-                while True:
-                    chunk = f.read(chunksize)
-                    if not chunk:
-                        break
-                    if known_hash:
-                        known_hash.update(chunk)
-                    required_hash.update(chunk)
-
-            if (
-                not hash_name
-                or not known_hash
-                or known_hash.hexdigest() == link.hashes[hash_name]
-            ):
-                return f"{required_hash.name}:{required_hash.hexdigest()}"
+                getattr(hashlib, hash_name)()
+                hash_names.add(hash_name)
+
+        self._log(f"Downloading: {link.url}", level="debug")
+        with temporary_directory() as temp_dir:
+            # The hashes are computed while downloading.
+            hashes = self._download(
+                link.url, Path(temp_dir) / link.filename, hash_names=hash_names
+            )
+
+        if (
+            not hash_name
+            or hash_name not in hashes
+            or hashes[hash_name] == link.hashes[hash_name]
+        ):
+            return f"sha256:{hashes['sha256']}"
         return None
 
-    def _get_response(self, endpoint: str) -> requests.Response | None:
+    def _get_response(
+        self,
+        endpoint: str,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+    ) -> requests.Response | None:
         url = self._url + endpoint
+        response: requests.Response = self.session.get(
+            url,
+            raise_for_status=False,
+            timeout=REQUESTS_TIMEOUT,
+            headers=headers,
+            stream=stream,
+        )
         try:
-            response: requests.Response = self.session.get(
-                url, raise_for_status=False, timeout=REQUESTS_TIMEOUT
-            )
             if response.status_code in (401, 403):
                 self._log(
                     f"Authorization error accessing {url}",
                     level="warning",
                 )
+                response.close()
                 return None
             if response.status_code == 404:
+                response.close()
                 return None
             response.raise_for_status()
         except requests.exceptions.HTTPError as e:
+            response.close()
             raise RepositoryError(e)
 
         if response.url != url:
@@ -426,7 +667,54 @@ class HTTPRepository(CachedRepository):
         return response
 
     def _get_page(self, name: NormalizedName) -> LinkSource:
-        response = self._get_response(f"/{name}/")
-        if not response:
-            raise PackageNotFoundError(f"Package [{name}] not found.")
+        # The body is streamed so that HTML pages can be parsed chunk by chunk
+        # while they are read instead of being loaded into memory at once.
+        # Since the body is read after the authenticator has returned the response,
+        # errors while reading it are not retried there but here.
+        attempt = 0
+        while True:
+            response = self._get_response(
+                f"/{name}/", headers={"Accept": SIMPLE_API_ACCEPT}, stream=True
+            )
+            if not response:
+                raise PackageNotFoundError(f"Package [{name}] not found.")
+
+            try:
+                with response:
+                    return self._read_page(name, response)
+            except (
+                requests.exceptions.ChunkedEncodingError,
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ) as e:
+                if attempt >= PAGE_READ_RETRIES:
+                    raise RepositoryError(
+                        f"Failed to read the page of package [{name}]: {e}"
+                    ) from e
+
+                attempt += 1
+                self._log(
+                    f"Retrying to read the page of package [{name}]: {e}",
+                    level="debug",
+                )
+
+    def _read_page(
+        self, name: NormalizedName, response: requests.Response
+    ) -> LinkSource:
+        # Prefer the JSON-based Simple API (PEP 691), which is cheaper to parse,
+        # and fall back to HTML if the index does not support it.
+        content_type = response.headers.get("Content-Type", "")
+        if content_type.partition(";")[0].strip().lower() == SIMPLE_API_JSON:
+            try:
+                return SimpleJsonPage(response.url, response.json())
+            except requests.exceptions.JSONDecodeError as e:
+                raise RepositoryError(
+                    f"Invalid JSON page for package [{name}]: {e}"
+                ) from e
+
+        if response.encoding:
+            return HTMLPage(
+                response.url,
+                response.iter_content(PAGE_CHUNK_SIZE, decode_unicode=True),
+            )
         return HTMLPage(response.url, response.text)
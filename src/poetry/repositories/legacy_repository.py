@@ -12,7 +12,6 @@ from poetry.core.packages.package import Package
 from poetry.inspection.info import PackageInfo
 from poetry.repositories.exceptions import PackageNotFoundError
 from poetry.repositories.http_repository import HTTPRepository
-from poetry.repositories.link_sources.html import HTMLPage
 from poetry.repositories.link_sources.html import SimpleRepositoryRootPage
 
 
@@ -130,11 +129,6 @@ class LegacyRepository(HTTPRepository):
             ),
         )
 
-    def _get_page(self, name: NormalizedName) -> HTMLPage:
-        if not (response := self._get_response(f"/{name}/")):
-            raise PackageNotFoundError(f"Package [{name}] not found.")
-        return HTMLPage(response.url, response.text)
-
     @cached_property
     def root_page(self) -> SimpleRepositoryRootPage:
         if not (response := self._get_response("/")):
@@ -2,13 +2,18 @@ from __future__ import annotations
 
 import logging
 import re
+import urllib.parse
 
+from collections.abc import Mapping
 from functools import cached_property
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import ClassVar
 
+from packaging.utils import canonicalize_name
 from poetry.core.constraints.version import Version
 from poetry.core.packages.package import Package
+from poetry.core.packages.utils.utils import splitext
 from poetry.core.version.exceptions import InvalidVersionError
 
 from poetry.utils.patterns import sdist_file_re
@@ -16,18 +21,46 @@ from poetry.utils.patterns import wheel_file_re
 
 
 if TYPE_CHECKING:
-    from collections import defaultdict
+    from collections.abc import Callable
     from collections.abc import Iterator
 
     from packaging.utils import NormalizedName
     from poetry.core.packages.utils.link import Link
 
-    LinkCache = defaultdict[NormalizedName, defaultdict[Version, list[Link]]]
+    LinkCache = Mapping[NormalizedName, Mapping[Version, list[Link]]]
 
 
 logger = logging.getLogger(__name__)
 
 
+class VersionLinks(Mapping[Version, list["Link"]]):
+    """
+    The links of the versions of a package. The links of a version are only
+    created from the files of the version when they are accessed.
+    """
+
+    def __init__(
+        self, files: dict[Version, list[Any]], create_link: Callable[[Any], Link]
+    ) -> None:
+        self._files = files
+        self._create_link = create_link
+        self._links: dict[Version, list[Link]] = {}
+
+    def __getitem__(self, version: Version) -> list[Link]:
+        links = self._links.get(version)
+        if links is None:
+            links = self._links[version] = [
+                self._create_link(file) for file in self._files[version]
+            ]
+        return links
+
+    def __iter__(self) -> Iterator[Version]:
+        return iter(self._files)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+
 class LinkSource:
     VERSION_REGEX = re.compile(r"(?i)([a-z0-9_\-.]+?)-(?=\d)([a-z0-9_.!+-]+)")
     CLEAN_REGEX = re.compile(r"[^a-z0-9$&+,/:;=?@.#%_\\|-]", re.I)
@@ -49,7 +82,7 @@ class LinkSource:
         return self._url
 
     def versions(self, name: NormalizedName) -> Iterator[Version]:
-        yield from self._link_cache[name]
+        yield from self._link_cache.get(name, ())
 
     @property
     def packages(self) -> Iterator[Package]:
@@ -67,39 +100,58 @@ class LinkSource:
 
     @classmethod
     def link_package_data(cls, link: Link) -> Package | None:
-        name: str | None = None
-        version_string: str | None = None
-        version: Version | None = None
-        m = wheel_file_re.match(link.filename) or sdist_file_re.match(link.filename)
+        name_and_version = cls._split_filename(link.filename)
+        if name_and_version is None:
+            return None
 
-        if m:
-            name = m.group("name")
-            version_string = m.group("ver")
-        else:
-            info, ext = link.splitext()
-            match = cls.VERSION_REGEX.match(info)
-            if match:
-                name = match.group(1)
-                version_string = match.group(2)
-
-        if version_string:
-            try:
-                version = Version.parse(version_string)
-            except InvalidVersionError:
-                logger.debug(
-                    "Skipping url (%s) due to invalid version (%s)", link.url, version
-                )
-                return None
+        name, version_string = name_and_version
+        version = cls._parse_version(version_string, link.url)
+        if version is None:
+            return None
 
-        pkg = None
-        if name and version:
-            pkg = Package(name, version, source_url=link.url)
-        return pkg
+        return Package(name, version, source_url=link.url)
+
+    @classmethod
+    def _split_filename(cls, filename: str) -> tuple[str, str] | None:
+        """
+        Returns the name and the version of a distribution from its filename.
+        """
+        m = wheel_file_re.match(filename) or sdist_file_re.match(filename)
+        if m:
+            return m.group("name"), m.group("ver")
+
+        info, _ = splitext(filename)
+        match = cls.VERSION_REGEX.match(info)
+        if match:
+            return match.group(1), match.group(2)
+
+        return None
+
+    @staticmethod
+    def _parse_version(version_string: str, url: str) -> Version | None:
+        try:
+            return Version.parse(version_string)
+        except InvalidVersionError:
+            logger.debug(
+                "Skipping url (%s) due to invalid version (%s)", url, version_string
+            )
+            return None
+
+    @staticmethod
+    def _filename(url: str) -> str:
+        """
+        Returns the filename of a (possibly relative) URL
+        like Link.filename does without parsing the URL.
+        """
+        path = url.partition("#")[0].partition("?")[0]
+        return urllib.parse.unquote(path.rstrip("/").rpartition("/")[2])
 
     def links_for_version(
         self, name: NormalizedName, version: Version
     ) -> Iterator[Link]:
-        yield from self._link_cache[name][version]
+        links = self._link_cache.get(name)
+        if links is not None and version in links:
+            yield from links[version]
 
     def clean_link(self, url: str) -> str:
         """Makes sure a link is fully encoded.  That is, if a ' ' shows up in
@@ -123,4 +175,54 @@ class LinkSource:
 
     @cached_property
     def _link_cache(self) -> LinkCache:
+        """
+        The links of the page by package name and version.
+
+        Names and versions are determined by scanning the filenames,
+        where each distinct version is only parsed once. The links of a version
+        are only created when the version is inspected, which makes a difference
+        for pages with thousands of files.
+        """
+        supported_formats = tuple(self.SUPPORTED_FORMATS)
+        names: dict[str, NormalizedName] = {}
+        versions: dict[str, Version | None] = {}
+        files: dict[NormalizedName, dict[Version, list[Any]]] = {}
+        for url, file in self._files():
+            filename = self._filename(url)
+            if not filename.endswith(supported_formats):
+                continue
+
+            name_and_version = self._split_filename(filename)
+            if name_and_version is None:
+                continue
+
+            name, version_string = name_and_version
+            if version_string in versions:
+                version = versions[version_string]
+            else:
+                version = versions[version_string] = self._parse_version(
+                    version_string, url
+                )
+            if version is None:
+                continue
+
+            canonical_name = names.get(name)
+            if canonical_name is None:
+                canonical_name = names[name] = canonicalize_name(name)
+
+            files.setdefault(canonical_name, {}).setdefault(version, []).append(file)
+
+        return {
+            name: VersionLinks(files_per_version, self._link)
+            for name, files_per_version in files.items()
+        }
+
+    def _files(self) -> Iterator[tuple[str, Any]]:
+        """
+        Yields the URLs of the files of the page (as they appear on the page)
+        with the data the links are created from.
+        """
+        raise NotImplementedError()
+
+    def _link(self, file: Any) -> Link:
         raise NotImplementedError()
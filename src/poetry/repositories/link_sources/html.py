@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import urllib.parse
 
-from collections import defaultdict
 from functools import cached_property
 from html import unescape
 from typing import TYPE_CHECKING
@@ -14,58 +13,54 @@ from poetry.repositories.parsers.html_page_parser import HTMLPageParser
 
 
 if TYPE_CHECKING:
-    from poetry.repositories.link_sources.base import LinkCache
+    from collections.abc import Iterable
+    from collections.abc import Iterator
 
 
 class HTMLPage(LinkSource):
-    def __init__(self, url: str, content: str) -> None:
+    def __init__(self, url: str, content: str | Iterable[str]) -> None:
+        """
+        The content can be given as a whole or in chunks,
+        which are parsed one after another as they are read.
+        """
         super().__init__(url=url)
 
         parser = HTMLPageParser()
-        parser.feed(content)
+        for chunk in [content] if isinstance(content, str) else content:
+            parser.feed(chunk)
+        parser.close()
         self._parsed = parser.anchors
         self._base_url: str | None = parser.base_url
 
-    @cached_property
-    def _link_cache(self) -> LinkCache:
-        links: LinkCache = defaultdict(lambda: defaultdict(list))
+    def _files(self) -> Iterator[tuple[str, dict[str, str | None]]]:
         for anchor in self._parsed:
             if href := anchor.get("href"):
-                url = self.clean_link(
-                    urllib.parse.urljoin(self._base_url or self._url, href)
-                )
-                pyrequire = anchor.get("data-requires-python")
-                pyrequire = unescape(pyrequire) if pyrequire else None
-                yanked_value = anchor.get("data-yanked")
-                yanked: str | bool
-                if yanked_value:
-                    yanked = unescape(yanked_value)
-                else:
-                    yanked = "data-yanked" in anchor
-
-                # see https://peps.python.org/pep-0714/#clients
-                # and https://peps.python.org/pep-0658/#specification
-                metadata: str | bool
-                for metadata_key in ("data-core-metadata", "data-dist-info-metadata"):
-                    metadata_value = anchor.get(metadata_key)
-                    if metadata_value:
-                        metadata = unescape(metadata_value)
-                    else:
-                        metadata = metadata_key in anchor
-                    if metadata:
-                        break
-                link = Link(
-                    url, requires_python=pyrequire, yanked=yanked, metadata=metadata
-                )
-
-                if link.ext not in self.SUPPORTED_FORMATS:
-                    continue
-
-                pkg = self.link_package_data(link)
-                if pkg:
-                    links[pkg.name][pkg.version].append(link)
-
-        return links
+                yield href, anchor
+
+    def _link(self, anchor: dict[str, str | None]) -> Link:
+        href = anchor["href"]
+        assert href is not None
+        url = self.clean_link(urllib.parse.urljoin(self._base_url or self._url, href))
+        pyrequire = anchor.get("data-requires-python")
+        pyrequire = unescape(pyrequire) if pyrequire else None
+        yanked_value = anchor.get("data-yanked")
+        yanked: str | bool = (
+            unescape(yanked_value) if yanked_value else "data-yanked" in anchor
+        )
+
+        # see https://peps.python.org/pep-0714/#clients
+        # and https://peps.python.org/pep-0658/#specification
+        metadata: str | bool
+        for metadata_key in ("data-core-metadata", "data-dist-info-metadata"):
+            metadata_value = anchor.get(metadata_key)
+            if metadata_value:
+                metadata = unescape(metadata_value)
+            else:
+                metadata = metadata_key in anchor
+            if metadata:
+                break
+
+        return Link(url, requires_python=pyrequire, yanked=yanked, metadata=metadata)
 
 
 class SimpleRepositoryRootPage:
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from functools import cached_property
+import re
+import urllib.parse
+
 from typing import TYPE_CHECKING
 from typing import Any
 
@@ -11,7 +12,10 @@ from poetry.repositories.link_sources.base import LinkSource
 
 
 if TYPE_CHECKING:
-    from poetry.repositories.link_sources.base import LinkCache
+    from collections.abc import Iterator
+
+
+ABSOLUTE_URL_REGEX = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:")
 
 
 class SimpleJsonPage(LinkSource):
@@ -21,35 +25,34 @@ class SimpleJsonPage(LinkSource):
         super().__init__(url=url)
         self.content = content
 
-    @cached_property
-    def _link_cache(self) -> LinkCache:
-        links: LinkCache = defaultdict(lambda: defaultdict(list))
+    def _files(self) -> Iterator[tuple[str, dict[str, Any]]]:
         for file in self.content["files"]:
-            url = file["url"]
-            requires_python = file.get("requires-python")
-            yanked = file.get("yanked", False)
-
-            # see https://peps.python.org/pep-0714/#clients
-            # and https://peps.python.org/pep-0691/#project-detail
-            metadata: dict[str, str] | bool = False
-            for metadata_key in ("core-metadata", "dist-info-metadata"):
-                if metadata_key in file:
-                    metadata_value = file[metadata_key]
-                    if metadata_value and isinstance(metadata_value, dict):
-                        metadata = metadata_value
-                    else:
-                        metadata = bool(metadata_value)
-                    break
-
-            link = Link(
-                url, requires_python=requires_python, yanked=yanked, metadata=metadata
-            )
-
-            if link.ext not in self.SUPPORTED_FORMATS:
-                continue
-
-            pkg = self.link_package_data(link)
-            if pkg:
-                links[pkg.name][pkg.version].append(link)
-
-        return links
+            yield file["url"], file
+
+    def _link(self, file: dict[str, Any]) -> Link:
+        url = file["url"]
+        # URLs may be relative to the page (like hrefs in HTML pages).
+        if not ABSOLUTE_URL_REGEX.match(url):
+            url = urllib.parse.urljoin(self._url, url)
+        requires_python = file.get("requires-python")
+        yanked = file.get("yanked", False)
+
+        # see https://peps.python.org/pep-0714/#clients
+        # and https://peps.python.org/pep-0691/#project-detail
+        metadata: dict[str, str] | bool = False
+        for metadata_key in ("core-metadata", "dist-info-metadata"):
+            if metadata_key in file:
+                metadata_value = file[metadata_key]
+                if metadata_value and isinstance(metadata_value, dict):
+                    metadata = metadata_value
+                else:
+                    metadata = bool(metadata_value)
+                break
+
+        return Link(
+            url,
+            requires_python=requires_python,
+            hashes=file.get("hashes"),
+            yanked=yanked,
+            metadata=metadata,
+        )
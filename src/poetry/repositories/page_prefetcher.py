@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import logging
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from packaging.utils import canonicalize_name
+
+from poetry.repositories.exceptions import PackageNotFoundError
+from poetry.repositories.http_repository import HTTPRepository
+from poetry.repositories.repository_pool import Priority
+
+
+if TYPE_CHECKING:
+    from packaging.utils import NormalizedName
+
+    from poetry.repositories.repository_pool import RepositoryPool
+
+
+logger = logging.getLogger(__name__)
+
+
+class PagePrefetcher:
+    """
+    Fetches the pages of packages from the repositories of a pool concurrently
+    in the background so that they are already cached when they are needed.
+
+    Pages are fetched in the order they have been requested. Like
+    RepositoryPool.find_packages(), a package is looked up in the repositories
+    in the order of their priority, and supplemental repositories are only
+    queried if no primary repository has the package.
+    """
+
+    def __init__(self, pool: RepositoryPool, max_workers: int) -> None:
+        self._pool = pool
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="poetry-page-prefetch"
+        )
+        self._requested: set[tuple[NormalizedName, str | None]] = set()
+
+    def prefetch(self, name: str, repository_name: str | None = None) -> None:
+        """
+        Fetches the page of a package in the background, either from the given
+        repository or from the repositories that would be searched for it.
+        """
+        key = (canonicalize_name(name), repository_name)
+        if key in self._requested:
+            return
+
+        self._requested.add(key)
+        self._executor.submit(self._prefetch, *key)
+
+    def shutdown(self, cancel_pending: bool = True) -> None:
+        """
+        Waits for running fetches to finish. Pending fetches are cancelled
+        unless `cancel_pending` is False.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=cancel_pending)
+
+    def _prefetch(self, name: NormalizedName, repository_name: str | None) -> None:
+        if repository_name:
+            repositories = [self._pool.repository(repository_name)]
+        else:
+            repositories = self._pool.repositories
+
+        found = False
+        for repository in repositories:
+            if (
+                found
+                and self._pool.get_priority(repository.name) is Priority.SUPPLEMENTAL
+            ):
+                break
+
+            if not isinstance(repository, HTTPRepository):
+                continue
+
+            try:
+                repository.get_page(name)
+            except PackageNotFoundError:
+                continue
+            except Exception as e:
+                logger.debug(
+                    "Failed to prefetch the page of %s from %s: %s",
+                    name,
+                    repository.name,
+                    e,
+                )
+                continue
+
+            found = True
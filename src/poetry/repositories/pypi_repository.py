@@ -203,6 +203,11 @@ class PyPiRepository(HTTPRepository):
 
         return data.asdict()
 
+    def _get_metadata_links(self, name: NormalizedName, version: Version) -> list[Link]:
+        # The metadata of releases is provided by the JSON API,
+        # metadata files are only read as fallback (see _get_release_info()).
+        return []
+
     def _get_page(self, name: NormalizedName) -> SimpleJsonPage:
         source = self._base_url + f"simple/{name}/"
         info = self.get_package_info(name)
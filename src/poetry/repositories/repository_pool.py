@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import enum
+import os
+import threading
+import weakref
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import TYPE_CHECKING
@@ -49,9 +53,13 @@ class RepositoryPool(AbstractRepository):
         for repository in repositories:
             self.add_repository(repository)
 
-        self._artifact_cache = ArtifactCache(
-            cache_dir=(config or Config.create()).artifacts_cache_directory
-        )
+        config = config or Config.create()
+        self._artifact_cache = ArtifactCache(cache_dir=config.artifacts_cache_directory)
+        self._parallel = config.get("solver.parallel-sources", False)
+        # The executor for concurrent lookups with the process it belongs to
+        # and its number of workers (see _get_executor()).
+        self._executor: tuple[int, int, ThreadPoolExecutor] | None = None
+        self._executor_lock = threading.Lock()
 
     @staticmethod
     def from_packages(packages: list[Package], config: Config | None) -> RepositoryPool:
@@ -169,13 +177,70 @@ class RepositoryPool(AbstractRepository):
         if repository_name:
             return self.repository(repository_name).find_packages(dependency)
 
+        repositories = self.repositories
+        if self._parallel and len(repositories) > 1:
+            return self._find_packages_concurrently(dependency, repositories)
+
         packages: list[Package] = []
-        for repo in self.repositories:
+        for repo in repositories:
             if packages and self.get_priority(repo.name) is Priority.SUPPLEMENTAL:
                 break
             packages += repo.find_packages(dependency)
         return packages
 
+    def _find_packages_concurrently(
+        self, dependency: Dependency, repositories: list[Repository]
+    ) -> list[Package]:
+        """
+        Queries the primary repositories at the same time and, only if they
+        do not provide any packages, the supplemental repositories at the same
+        time. The results (and errors) are the same as if the repositories were
+        queried one after another, no matter which repository answers first.
+        """
+        executor = self._get_executor()
+        packages: list[Package] = []
+        for priority in (Priority.PRIMARY, Priority.SUPPLEMENTAL):
+            futures = [
+                executor.submit(repo.find_packages, dependency)
+                for repo in repositories
+                if self.get_priority(repo.name) is priority
+            ]
+            for future in futures:
+                if packages and priority is Priority.SUPPLEMENTAL:
+                    break
+                packages += future.result()
+
+            if packages:
+                break
+
+        return packages
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Returns the executor that is shared by all concurrent lookups
+        and is shut down with the pool.
+        """
+        pid = os.getpid()
+        workers = len(self._repositories)
+        with self._executor_lock:
+            # A forked process (see Solver) cannot use the threads
+            # of the executor of its parent process.
+            if (
+                self._executor is None
+                or self._executor[0] != pid
+                or self._executor[1] < workers
+            ):
+                if self._executor is not None and self._executor[0] == pid:
+                    self._executor[2].shutdown(wait=False)
+
+                executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="poetry-pool"
+                )
+                weakref.finalize(self, executor.shutdown, wait=False)
+                self._executor = (pid, workers, executor)
+
+            return self._executor[2]
+
     def search(self, query: str | list[str]) -> list[Package]:
         results: list[Package] = []
         for repo in self.repositories:
@@ -0,0 +1,184 @@
+"""
+Memoized operations on markers and version constraints.
+
+Markers and constraints are immutable, but operations on them are expensive
+and the same combinations are computed many times while solving and when
+calculating the markers of the solved packages. The results are kept in
+bounded LRU caches.
+
+Markers are compared by value (equal markers have the same string
+representation). Version constraints are compared by identity because
+equal constraints may be written differently (e.g. ">=1.0" and ">=1.0.0")
+and the way they are written is shown to the user. Resulting markers
+are interned, so that equal results of different operations are the same
+object, which makes comparing them in later lookups cheaper.
+"""
+
+from __future__ import annotations
+
+import functools
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+from poetry.core.packages.utils.utils import get_python_constraint_from_marker
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Hashable
+
+    from poetry.core.constraints.version import VersionConstraint
+    from poetry.core.version.markers import BaseMarker
+
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+MAXSIZE = 4096
+
+_caches: dict[str, LRUCache[Any, Any]] = {}
+
+
+class LRUCache(Generic[K, V]):
+    def __init__(self, name: str, maxsize: int = MAXSIZE) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: dict[K, V] = {}
+
+        _caches[name] = self
+
+    def get(self, key: K, compute: Callable[[], V]) -> V:
+        try:
+            # Reinsert the value to mark it as most recently used.
+            value = self._data.pop(key)
+        except KeyError:
+            self.misses += 1
+            value = compute()
+            if len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+        else:
+            self.hits += 1
+
+        self._data[key] = value
+        return value
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_interned_markers: LRUCache[BaseMarker, BaseMarker] = LRUCache("interned markers")
+
+
+def _intern(marker: BaseMarker) -> BaseMarker:
+    return _interned_markers.get(marker, lambda: marker)
+
+
+def memoize_markers(name: str) -> Callable[[Callable[..., V]], Callable[..., V]]:
+    """
+    Memoizes a function whose arguments are markers or other values
+    that are only equal if they are written the same way.
+    """
+
+    def decorator(func: Callable[..., V]) -> Callable[..., V]:
+        cache: LRUCache[tuple[Hashable, ...], V] = LRUCache(name)
+
+        @functools.wraps(func)
+        def wrapper(*args: Hashable) -> V:
+            return cache.get(args, lambda: func(*args))
+
+        return wrapper
+
+    return decorator
+
+
+@memoize_markers("marker union")
+def marker_union(marker: BaseMarker, other: BaseMarker) -> BaseMarker:
+    return _intern(marker.union(other))
+
+
+@memoize_markers("marker intersection")
+def marker_intersect(marker: BaseMarker, other: BaseMarker) -> BaseMarker:
+    return _intern(marker.intersect(other))
+
+
+@memoize_markers("marker inversion")
+def marker_invert(marker: BaseMarker) -> BaseMarker:
+    return _intern(marker.invert())
+
+
+@memoize_markers("python constraint from marker")
+def python_constraint_from_marker(marker: BaseMarker) -> VersionConstraint:
+    return get_python_constraint_from_marker(marker)
+
+
+_constraint_operations: LRUCache[
+    tuple[str, int, int],
+    tuple[VersionConstraint, VersionConstraint, VersionConstraint],
+] = LRUCache("constraint operations")
+
+
+def _constraint_operation(
+    operation: str, constraint: VersionConstraint, other: VersionConstraint
+) -> VersionConstraint:
+    # The cached entry keeps references to the operands so that their ids
+    # cannot be reused by other objects as long as the entry is cached.
+    _, _, result = _constraint_operations.get(
+        (operation, id(constraint), id(other)),
+        lambda: (constraint, other, getattr(constraint, operation)(other)),
+    )
+
+    return result
+
+
+def constraint_intersect(
+    constraint: VersionConstraint, other: VersionConstraint
+) -> VersionConstraint:
+    return _constraint_operation("intersect", constraint, other)
+
+
+def constraint_union(
+    constraint: VersionConstraint, other: VersionConstraint
+) -> VersionConstraint:
+    return _constraint_operation("union", constraint, other)
+
+
+def constraint_difference(
+    constraint: VersionConstraint, other: VersionConstraint
+) -> VersionConstraint:
+    return _constraint_operation("difference", constraint, other)
+
+
+def cache_info() -> dict[str, tuple[int, int, int]]:
+    """
+    Returns the hits, misses and current size of every cache.
+    """
+    return {
+        name: (cache.hits, cache.misses, len(cache)) for name, cache in _caches.items()
+    }
+
+
+def format_cache_info() -> str:
+    lines = []
+    for name, (hits, misses, size) in cache_info().items():
+        if hits + misses:
+            lines.append(
+                f"{name}: {hits} hits, {misses} misses"
+                f" ({hits / (hits + misses):.0%} hit rate, {size} cached)"
+            )
+
+    return "\n".join(lines)
+
+
+def clear() -> None:
+    for cache in _caches.values():
+        cache.clear()
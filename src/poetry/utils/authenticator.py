@@ -25,6 +25,7 @@ from poetry.config.config import Config
 from poetry.console.exceptions import ConsoleMessage
 from poetry.console.exceptions import PoetryRuntimeError
 from poetry.exceptions import PoetryError
+from poetry.utils import profiler
 from poetry.utils.constants import REQUESTS_TIMEOUT
 from poetry.utils.constants import RETRY_AFTER_HEADER
 from poetry.utils.constants import STATUS_FORCELIST
@@ -164,6 +165,13 @@ class Authenticator:
             if session is not None:
                 session.close()
 
+    def reset_sessions(self) -> None:
+        """
+        Discards all sessions without closing them, e.g. in a forked process,
+        so that connections are not shared with the parent process.
+        """
+        self._sessions_for_netloc.clear()
+
     def __del__(self) -> None:
         self.close()
 
@@ -230,6 +238,11 @@ class Authenticator:
             is_last_attempt = attempt >= 5
             try:
                 resp = session.send(prepared_request, **send_kwargs)
+                profiler.count(
+                    "http cache hits"
+                    if getattr(resp, "from_cache", False)
+                    else "network requests"
+                )
             except (requests.exceptions.ConnectionError, OSError) as e:
                 if is_last_attempt:
                     parsed_url = urllib.parse.urlsplit(url)
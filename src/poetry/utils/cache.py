@@ -4,11 +4,15 @@ import dataclasses
 import hashlib
 import json
 import logging
+import os
 import shutil
 import threading
 import time
 
 from collections import defaultdict
+from contextlib import suppress
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
@@ -16,15 +20,25 @@ from typing import Generic
 from typing import TypeVar
 from typing import overload
 
+from packaging.tags import Tag
+from requests.utils import atomic_open
+
 from poetry.utils._compat import decode
 from poetry.utils._compat import encode
+from poetry.utils.helpers import get_file_hash
 from poetry.utils.helpers import get_highest_priority_hash_type
 from poetry.utils.wheel import InvalidWheelNameError
 from poetry.utils.wheel import Wheel
 
 
 if TYPE_CHECKING:
+    import sqlite3
+
     from collections.abc import Callable
+    from collections.abc import Container
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from collections.abc import Mapping
 
     from poetry.core.packages.utils.link import Link
 
@@ -33,6 +47,15 @@ if TYPE_CHECKING:
 
 # Used by FileCache for items that do not expire.
 MAX_DATE = 9999999999
+# Entries that have been used more recently (in seconds) are not pruned
+# because they might be in use by a running process (see prune()).
+RECENTLY_USED = 60 * 60
+# The types of archives that are looked up in the ArtifactCache.
+ARCHIVE_TYPES = ("whl", "tar.gz", "tar.bz2", "bz2", "zip")
+# The hash by which archives are stored in the content store of the ArtifactCache.
+STORE_HASH_NAME = "sha256"
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 2
 T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
@@ -71,6 +94,59 @@ class CacheItem(Generic[T]):
         return self.expires is not None and time.time() >= self.expires
 
 
+@dataclasses.dataclass(frozen=True)
+class CacheEntry:
+    """
+    An entry of a cache that can be evicted to reduce the size of the cache.
+    """
+
+    accessed: float
+    size: int
+    remove: Callable[[], None] = dataclasses.field(compare=False, repr=False)
+
+
+def prune(
+    entries: Iterable[CacheEntry], max_size: int, keep_recent: float = RECENTLY_USED
+) -> list[CacheEntry]:
+    """
+    Removes the least recently used entries until their total size
+    does not exceed the given size (in bytes).
+
+    Entries that have been used in the last `keep_recent` seconds are kept
+    even if the size is exceeded. Returns the removed entries.
+    """
+    entries = sorted(entries, key=attrgetter("accessed"))
+    size = sum(entry.size for entry in entries)
+    keep_after = time.time() - keep_recent
+
+    removed = []
+    for entry in entries:
+        if size <= max_size or entry.accessed > keep_after:
+            break
+
+        entry.remove()
+        size -= entry.size
+        removed.append(entry)
+
+    return removed
+
+
+def _walk_files(directory: Path) -> Iterator[tuple[Path, os.stat_result]]:
+    for root, _, files in os.walk(directory):
+        for name in files:
+            path = Path(root, name)
+            with suppress(OSError):
+                yield path, path.stat()
+
+
+def _file_entries(directory: Path, exclude: Container[str] = ()) -> list[CacheEntry]:
+    return [
+        CacheEntry(stat.st_mtime, stat.st_size, partial(path.unlink, missing_ok=True))
+        for path, stat in _walk_files(directory)
+        if path.name not in exclude
+    ]
+
+
 @dataclasses.dataclass(frozen=True)
 class FileCache(Generic[T]):
     """
@@ -92,6 +168,21 @@ class FileCache(Generic[T]):
     def get(self, key: str) -> T | None:
         return self._get_payload(key)
 
+    def get_many(self, keys: Iterable[str]) -> dict[str, T]:
+        """
+        Get the items of many keys from the cache.
+
+        :param keys: The cache keys
+        :returns: The values of the keys that exist in the cache
+        """
+        values = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                values[key] = value
+
+        return values
+
     def has(self, key: str) -> bool:
         """
         Determine if a file exists and has not expired in the cache.
@@ -113,7 +204,8 @@ class FileCache(Generic[T]):
         )
         path = self._path(key)
         path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("wb") as f:
+        # Write atomically so that concurrent readers never see partial data.
+        with atomic_open(path) as f:
             f.write(self._serialize(payload))
 
     def forget(self, key: str) -> None:
@@ -132,6 +224,13 @@ class FileCache(Generic[T]):
         """
         shutil.rmtree(self.path)
 
+    def entries(self) -> list[CacheEntry]:
+        """
+        Returns the entries of the cache (see prune()),
+        which are all files in its path.
+        """
+        return _file_entries(self.path)
+
     def remember(
         self, key: str, callback: T | Callable[[], T], minutes: int | None = None
     ) -> T:
@@ -168,11 +267,18 @@ class FileCache(Generic[T]):
             self.forget(key)
             return None
         else:
+            # The modification time is the access time for pruning the cache.
+            with suppress(OSError):
+                os.utime(path)
             return payload.data
 
+    def _hash(self, key: str) -> str:
+        hash_type, _ = _HASHES[self.hash_type]
+        return hash_type(encode(key)).hexdigest()
+
     def _path(self, key: str) -> Path:
-        hash_type, parts_count = _HASHES[self.hash_type]
-        h = hash_type(encode(key)).hexdigest()
+        _, parts_count = _HASHES[self.hash_type]
+        h = self._hash(key)
         parts = [h[i : i + 2] for i in range(0, len(h), 2)][:parts_count]
         return Path(self.path, *parts, h)
 
@@ -188,12 +294,285 @@ class FileCache(Generic[T]):
         return CacheItem(data, expires)
 
 
+@dataclasses.dataclass(frozen=True)
+class SQLiteCache(FileCache[T]):
+    """
+    FileCache that stores all items in a single SQLite database in its path
+    instead of one file per item, which is much faster to read from a cold disk.
+
+    Items of a FileCache that already exist in the path are moved to the database
+    when it is first opened. Concurrent processes (and threads) are safe
+    because each thread uses its own connection and SQLite locks the database.
+    """
+
+    DATABASE = "cache.sqlite3"
+    # The maximum number of keys that are read by one query in get_many()
+    MAX_VARIABLES = 500
+    # The access time of items is only updated if it is older (in seconds)
+    # so that reading items does not require writing the database each time.
+    ACCESS_RESOLUTION = 60 * 60
+
+    _connections: threading.local = dataclasses.field(
+        default_factory=threading.local, init=False, repr=False, compare=False
+    )
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, T]:
+        hashes = {self._hash(key): key for key in keys}
+        rows: list[tuple[str, int, str, int]] = []
+        chunks = list(hashes)
+        for i in range(0, len(chunks), self.MAX_VARIABLES):
+            chunk = chunks[i : i + self.MAX_VARIABLES]
+            rows += self._connection.execute(
+                "SELECT key, expires, data, accessed FROM cache"
+                f" WHERE key IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+
+        values = {}
+        accessed = []
+        for h, expires, data, last_accessed in rows:
+            value = self._load(hashes[h], expires, data)
+            if value is not None:
+                values[hashes[h]] = value
+                if self._is_stale(last_accessed):
+                    accessed.append(h)
+
+        self._update_access_time(accessed)
+
+        return values
+
+    def put(self, key: str, value: Any, minutes: int | None = None) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO cache (key, expires, data, accessed)"
+            " VALUES (?, ?, ?, ?)",
+            (
+                self._hash(key),
+                _expiration(minutes) if minutes is not None else MAX_DATE,
+                json.dumps(value),
+                round(time.time()),
+            ),
+        )
+
+    def forget(self, key: str) -> None:
+        self._forget_hash(self._hash(key))
+
+    def flush(self) -> None:
+        pid, connection = getattr(self._connections, "connection", (None, None))
+        if connection is not None and pid == os.getpid():
+            connection.close()
+            del self._connections.connection
+
+        super().flush()
+
+    def entries(self) -> list[CacheEntry]:
+        """
+        Returns the items in the database and all other files in the path
+        as entries of the cache (see prune()).
+        """
+        entries = [
+            CacheEntry(accessed, size, partial(self._forget_hash, h))
+            for h, accessed, size in self._connection.execute(
+                "SELECT key, accessed, length(key) + length(data) FROM cache"
+            )
+        ]
+        entries += _file_entries(
+            self.path,
+            exclude={self.DATABASE, f"{self.DATABASE}-wal", f"{self.DATABASE}-shm"},
+        )
+
+        return entries
+
+    def _forget_hash(self, h: str) -> None:
+        self._connection.execute("DELETE FROM cache WHERE key = ?", (h,))
+
+    def _get_payload(self, key: str) -> T | None:
+        h = self._hash(key)
+        row = self._connection.execute(
+            "SELECT expires, data, accessed FROM cache WHERE key = ?", (h,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        expires, data, accessed = row
+        value = self._load(key, expires, data)
+        if value is not None and self._is_stale(accessed):
+            self._update_access_time([h])
+
+        return value
+
+    def _load(self, key: str, expires: int, data: str) -> T | None:
+        try:
+            payload: CacheItem[T] = CacheItem(json.loads(data), expires)
+        except ValueError:
+            self.forget(key)
+            logger.warning("Corrupt cache entry was detected and cleaned up.")
+            return None
+
+        if payload.expired:
+            self.forget(key)
+            return None
+
+        return payload.data
+
+    def _is_stale(self, accessed: int) -> bool:
+        return time.time() - accessed > self.ACCESS_RESOLUTION
+
+    def _update_access_time(self, hashes: list[str]) -> None:
+        now = round(time.time())
+        for i in range(0, len(hashes), self.MAX_VARIABLES):
+            chunk = hashes[i : i + self.MAX_VARIABLES]
+            self._connection.execute(
+                "UPDATE cache SET accessed = ?"
+                f" WHERE key IN ({', '.join('?' * len(chunk))})",
+                [now, *chunk],
+            )
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        pid, connection = getattr(self._connections, "connection", (None, None))
+        if connection is None or pid != os.getpid():
+            if connection is not None:
+                # A connection must not be used by a forked process
+                # (e.g. by the solver). It must not be closed either
+                # because that might checkpoint or remove the WAL files
+                # that are still in use by the parent process.
+                _inherited_connections.append(connection)
+            connection = self._connect()
+            self._connections.connection = (os.getpid(), connection)
+
+        return connection
+
+    def _connect(self) -> sqlite3.Connection:
+        import sqlite3
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        # Each statement is committed on its own (autocommit), and writers
+        # of other processes are waited for instead of failing immediately.
+        connection = sqlite3.connect(
+            self.path / self.DATABASE,
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        # Return the space of removed items (see prune()) to the file system.
+        connection.execute("PRAGMA auto_vacuum = FULL")
+        self._enable_wal(connection)
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS cache"
+            " (key TEXT PRIMARY KEY, expires INTEGER NOT NULL, data TEXT NOT NULL,"
+            " accessed INTEGER NOT NULL)"
+            " WITHOUT ROWID"
+        )
+        self._migrate(connection)
+
+        return connection
+
+    @staticmethod
+    def _enable_wal(connection: sqlite3.Connection) -> None:
+        import sqlite3
+
+        # The journal mode is persistent, so it only has to be changed
+        # if the database has just been created. Changing it fails
+        # immediately instead of waiting if another connection does the same.
+        for attempt in range(10):
+            try:
+                (journal_mode,) = connection.execute("PRAGMA journal_mode").fetchone()
+                if journal_mode != "wal":
+                    connection.execute("PRAGMA journal_mode = WAL")
+                return
+            except sqlite3.OperationalError:
+                if attempt == 9:
+                    raise
+                time.sleep(0.1)
+
+    def _migrate(self, connection: sqlite3.Connection) -> None:
+        """
+        Moves the items of a FileCache in the path into the database.
+        The file names are the hashes of the keys, which are used as keys
+        in the database, too, so that the original keys are not required.
+        """
+        _, parts_count = _HASHES[self.hash_type]
+        directories = [
+            path
+            for path in self.path.iterdir()
+            if path.is_dir() and len(path.name) == 2 and _is_hex(path.name)
+        ]
+        if not directories:
+            return
+
+        rows = []
+        for directory in directories:
+            for path in directory.glob("/".join(["*"] * parts_count)):
+                if not path.is_file() or not _is_hex(path.name):
+                    continue
+
+                with suppress(OSError, ValueError):
+                    # Corrupt items are not migrated.
+                    payload = self._deserialize(path.read_bytes())
+                    rows.append(
+                        (
+                            path.name,
+                            payload.expires,
+                            json.dumps(payload.data),
+                            round(path.stat().st_mtime),
+                        )
+                    )
+
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            # Items that have been written to the database in the meantime
+            # (e.g. by another process) are newer than the files.
+            connection.executemany(
+                "INSERT OR IGNORE INTO cache (key, expires, data, accessed)"
+                " VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+        for directory in directories:
+            shutil.rmtree(directory, ignore_errors=True)
+
+        logger.debug("Moved %d items from %s to the database.", len(rows), self.path)
+
+
+# Connections that have been inherited by forked processes (see SQLiteCache).
+_inherited_connections: list[sqlite3.Connection] = []
+
+
+def _has_coarse_timestamps(mtime_ns: int, ctime_ns: int) -> bool:
+    """
+    Returns whether the timestamps of a file only have a resolution of seconds
+    (e.g. on FAT or some network file systems), so that modifications
+    within the same second cannot be detected.
+    """
+    return mtime_ns % 1_000_000_000 == 0 and ctime_ns % 1_000_000_000 == 0
+
+
+def _is_hex(value: str) -> bool:
+    try:
+        int(value, 16)
+    except ValueError:
+        return False
+
+    return True
+
+
+# The backends of the release cache of repositories (see "cache.release-backend")
+CACHE_BACKENDS: dict[str, type[FileCache[Any]]] = {
+    "file": FileCache,
+    "sqlite": SQLiteCache,
+}
+
+
 class ArtifactCache:
     def __init__(self, *, cache_dir: Path) -> None:
         self._cache_dir = cache_dir
         self._archive_locks: defaultdict[Path, threading.Lock] = defaultdict(
             threading.Lock
         )
+        # The manifests of the directories that have been looked up
+        # with the modification time of the directory they belong to.
+        self._manifests: dict[Path, tuple[int, dict[str, dict[str, Any]]]] = {}
 
     def get_cache_directory_for_link(self, link: Link) -> Path:
         key_parts = {"url": link.url_without_fragment}
@@ -232,7 +611,7 @@ class ArtifactCache:
         *,
         strict: bool,
         env: Env | None = ...,
-        download_func: Callable[[str, Path], None],
+        download_func: Callable[[str, Path], Mapping[str, str] | None],
     ) -> Path: ...
 
     @overload
@@ -251,7 +630,7 @@ class ArtifactCache:
         *,
         strict: bool,
         env: Env | None = None,
-        download_func: Callable[[str, Path], None] | None = None,
+        download_func: Callable[[str, Path], Mapping[str, str] | None] | None = None,
     ) -> Path | None:
         cache_dir = self.get_cache_directory_for_link(link)
 
@@ -267,11 +646,22 @@ class ArtifactCache:
                 if not cached_archive.exists():
                     cache_dir.mkdir(parents=True, exist_ok=True)
                     try:
-                        download_func(link.url, cached_archive)
+                        # The download function may return the hashes
+                        # it has computed while downloading.
+                        hashes = dict(download_func(link.url, cached_archive) or {})
                     except BaseException:
                         cached_archive.unlink(missing_ok=True)
                         raise
 
+                    if STORE_HASH_NAME not in hashes:
+                        hashes[STORE_HASH_NAME] = get_file_hash(
+                            cached_archive, STORE_HASH_NAME
+                        )
+                    self._record_hashes(cached_archive, hashes)
+
+        if cached_archive is not None:
+            self._touch(cache_dir)
+
         return cached_archive
 
     def get_cached_archive_for_git(
@@ -279,7 +669,177 @@ class ArtifactCache:
     ) -> Path | None:
         cache_dir = self.get_cache_directory_for_git(url, reference, subdirectory)
 
-        return self._get_cached_archive(cache_dir, strict=False, env=env)
+        cached_archive = self._get_cached_archive(cache_dir, strict=False, env=env)
+        if cached_archive is not None:
+            self._touch(cache_dir)
+
+        return cached_archive
+
+    def get_file_hash(self, archive: Path, hash_name: str = "sha256") -> str:
+        """
+        Returns the hash of an archive.
+
+        The hashes of cached archives are recorded in the manifest
+        of their directory so that they are only computed once.
+        """
+        cache_dir = archive.parent
+        if not cache_dir.is_relative_to(self._cache_dir):
+            return get_file_hash(archive, hash_name)
+
+        entry = self._get_manifest_entry_for(archive)
+        if entry is None:
+            return get_file_hash(archive, hash_name)
+
+        if hash_name in entry["hashes"] and not _has_coarse_timestamps(
+            entry["mtime"], entry["ctime"]
+        ):
+            return str(entry["hashes"][hash_name])
+
+        file_hash = get_file_hash(archive, hash_name)
+        self._record_hashes(archive, {hash_name: file_hash})
+
+        return file_hash
+
+    def _record_hashes(self, archive: Path, hashes: Mapping[str, str]) -> None:
+        """
+        Records the hashes of a cached archive in the manifest of its directory.
+
+        Archives whose sha256 hash is known are added to the content store
+        (see _add_to_store()).
+        """
+        if STORE_HASH_NAME in hashes:
+            self._add_to_store(archive, hashes[STORE_HASH_NAME])
+
+        # The archive might have been replaced by the stored one.
+        entry = self._get_manifest_entry_for(archive)
+        if entry is not None:
+            entry["hashes"].update(hashes)
+            self._write_manifest(archive.parent)
+
+    def _get_manifest_entry_for(self, archive: Path) -> dict[str, Any] | None:
+        manifest = self._get_manifest(archive.parent)
+        entry = manifest.get(archive.name)
+        if entry is None:
+            return None
+
+        stat = archive.stat()
+        if not self._is_unchanged(entry, stat):
+            # The archive has been replaced without modifying its directory.
+            entry = manifest[archive.name] = self._get_manifest_entry(archive, stat)
+
+        return entry
+
+    def _add_to_store(self, archive: Path, file_hash: str) -> None:
+        """
+        Adds an archive to the content store, in which archives are stored
+        by their hash, so that identical archives from different sources
+        (e.g. mirrors of PyPI) are only stored once.
+
+        The archives in the directories of links are hard links
+        to the stored archives. If hard links are not supported,
+        the archives are stored in the directories of links only.
+        """
+        stored_archive = self._get_store_path(file_hash)
+        try:
+            stored_archive.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(archive, stored_archive)
+                return
+            except FileExistsError:
+                pass
+
+            if archive.samefile(stored_archive):
+                return
+
+            if get_file_hash(stored_archive, STORE_HASH_NAME) != file_hash:
+                # The stored archive is corrupt or has been tampered with,
+                # so replace it by the downloaded one (and not vice versa).
+                logger.debug("The stored archive %s is corrupt.", stored_archive)
+                self._replace_by_link(stored_archive, archive)
+                return
+
+            # Replace the archive by a hard link to the identical stored one.
+            self._replace_by_link(archive, stored_archive)
+        except OSError as e:
+            logger.debug("Failed to add %s to the content store: %s", archive, e)
+
+    @staticmethod
+    def _replace_by_link(path: Path, target: Path) -> None:
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.unlink(missing_ok=True)
+        os.link(target, tmp_path)
+        os.replace(tmp_path, path)
+
+    def _get_store_path(self, file_hash: str) -> Path:
+        return self._cache_dir.joinpath(
+            STORE_HASH_NAME, file_hash[:2], file_hash[2:4], file_hash
+        )
+
+    def entries(self) -> list[CacheEntry]:
+        """
+        Returns the directories of links and git references
+        as entries of the cache (see prune()).
+
+        Stored archives that are not used by any directory anymore
+        are entries, too.
+        """
+        entries = [
+            CacheEntry(
+                stat.st_mtime, stat.st_size, partial(path.unlink, missing_ok=True)
+            )
+            for path, stat in _walk_files(self._cache_dir / STORE_HASH_NAME)
+            if stat.st_nlink == 1
+        ]
+        for cache_dir in self._cache_dir.glob("*/*/*/*"):
+            if not cache_dir.is_dir():
+                continue
+
+            with suppress(OSError):
+                # The modification time of the manifest of a directory
+                # is its access time (see _touch()).
+                accessed = cache_dir.stat().st_mtime
+                # Stored archives are shared by the directories
+                # of all links they have been downloaded from.
+                size = sum(
+                    stat.st_size // max(stat.st_nlink - 1, 1)
+                    for _, stat in _walk_files(cache_dir)
+                )
+                manifest_path = self._get_manifest_path(cache_dir)
+                with suppress(FileNotFoundError):
+                    stat = manifest_path.stat()
+                    accessed = max(accessed, stat.st_mtime)
+                    size += stat.st_size
+                entries.append(
+                    CacheEntry(accessed, size, partial(self._remove, cache_dir))
+                )
+
+        return entries
+
+    def _remove(self, cache_dir: Path) -> None:
+        stored_archives = [
+            self._get_store_path(entry["hashes"][STORE_HASH_NAME])
+            for entry in self._get_manifest(cache_dir).values()
+            if STORE_HASH_NAME in entry["hashes"]
+        ]
+
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        self._get_manifest_path(cache_dir).unlink(missing_ok=True)
+        self._manifests.pop(cache_dir, None)
+
+        # Remove the stored archives that are not used anymore.
+        for stored_archive in stored_archives:
+            with suppress(OSError):
+                if stored_archive.stat().st_nlink == 1:
+                    stored_archive.unlink()
+
+    def _touch(self, cache_dir: Path) -> None:
+        # Remember when the archives of the directory have been used
+        # so that the least recently used archives can be pruned.
+        # The manifest is touched instead of the directory itself
+        # because the manifest is only valid as long as the modification
+        # time of the directory does not change.
+        with suppress(OSError):
+            os.utime(self._get_manifest_path(cache_dir))
 
     def _get_cached_archive(
         self,
@@ -294,17 +854,18 @@ class ArtifactCache:
         # implication "strict -> filename must not be None"
         assert not strict or filename is not None
 
-        archives = self._get_cached_archives(cache_dir)
-        if not archives:
+        manifest = self._get_manifest(cache_dir)
+        if not manifest:
             return None
 
-        candidates: list[tuple[float | None, Path]] = []
+        candidates: list[tuple[float, Path]] = []
 
-        for archive in archives:
+        for name, entry in manifest.items():
+            archive = cache_dir / name
             if strict:
                 # in strict mode return the original cached archive instead of the
                 # prioritized archive type.
-                if filename == archive.name:
+                if filename == name:
                     return archive
                 continue
 
@@ -314,27 +875,131 @@ class ArtifactCache:
                 candidates.append((float("inf"), archive))
                 continue
 
-            try:
-                wheel = Wheel(archive.name)
-            except InvalidWheelNameError:
+            if entry["tags"] is None:
+                # not a valid wheel filename
                 continue
 
-            if not wheel.is_supported_by_environment(env):
-                continue
-
-            candidates.append(
-                (wheel.get_minimum_supported_index(env.supported_tags), archive),
-            )
+            tags = [Tag(*tag) for tag in entry["tags"]]
+            indexes = [
+                env.supported_tags.index(tag)
+                for tag in tags
+                if tag in env.supported_tags
+            ]
+            if indexes:
+                candidates.append((min(indexes), archive))
 
         if not candidates:
             return None
 
         return min(candidates)[1]
 
+    def _get_manifest(self, cache_dir: Path) -> dict[str, dict[str, Any]]:
+        """
+        Returns the archives of a directory with their tags and hashes.
+
+        The manifest is kept next to the directory and is only rebuilt
+        if the directory has been modified, so that looking up an archive
+        does not require to list the directory and to parse the names
+        of its wheels.
+        """
+        try:
+            stat = cache_dir.stat()
+        except OSError:
+            return {}
+
+        mtime = stat.st_mtime_ns
+        # With coarse timestamps, archives that are added right after
+        # the manifest has been built would not be detected.
+        coarse = _has_coarse_timestamps(mtime, stat.st_ctime_ns)
+
+        manifest = self._manifests.get(cache_dir)
+        if manifest is not None and manifest[0] == mtime and not coarse:
+            return manifest[1]
+
+        manifest = self._read_manifest(cache_dir)
+        if manifest is None or manifest[0] != mtime or coarse:
+            previous = manifest[1] if manifest is not None else {}
+            manifest = (mtime, self._build_manifest(cache_dir, previous))
+            self._manifests[cache_dir] = manifest
+            self._write_manifest(cache_dir)
+        else:
+            self._manifests[cache_dir] = manifest
+
+        return manifest[1]
+
+    def _build_manifest(
+        self, cache_dir: Path, previous: dict[str, dict[str, Any]]
+    ) -> dict[str, dict[str, Any]]:
+        manifest = {}
+        for archive in self._get_cached_archives(cache_dir):
+            try:
+                stat = archive.stat()
+            except OSError:
+                continue
+
+            entry = previous.get(archive.name)
+            if entry is None or not self._is_unchanged(entry, stat):
+                entry = self._get_manifest_entry(archive, stat)
+            manifest[archive.name] = entry
+
+        return manifest
+
+    @staticmethod
+    def _get_manifest_entry(archive: Path, stat: os.stat_result) -> dict[str, Any]:
+        tags = None
+        if archive.suffix == ".whl":
+            with suppress(InvalidWheelNameError):
+                tags = sorted(
+                    [tag.interpreter, tag.abi, tag.platform]
+                    for tag in Wheel(archive.name).tags
+                )
+
+        return {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "ctime": stat.st_ctime_ns,
+            "inode": stat.st_ino,
+            "tags": tags,
+            "hashes": {},
+        }
+
+    @staticmethod
+    def _is_unchanged(entry: dict[str, Any], stat: os.stat_result) -> bool:
+        return (entry["size"], entry["mtime"], entry["ctime"], entry["inode"]) == (
+            stat.st_size,
+            stat.st_mtime_ns,
+            stat.st_ctime_ns,
+            stat.st_ino,
+        )
+
+    @staticmethod
+    def _get_manifest_path(cache_dir: Path) -> Path:
+        # The manifest is not stored in the directory itself
+        # so that writing it does not modify the directory.
+        return cache_dir.with_name(f"{cache_dir.name}{MANIFEST_SUFFIX}")
+
+    def _read_manifest(
+        self, cache_dir: Path
+    ) -> tuple[int, dict[str, dict[str, Any]]] | None:
+        try:
+            data = json.loads(self._get_manifest_path(cache_dir).read_bytes())
+            if data["version"] != MANIFEST_VERSION:
+                return None
+            return data["mtime"], data["archives"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_manifest(self, cache_dir: Path) -> None:
+        mtime, archives = self._manifests[cache_dir]
+        data = {"version": MANIFEST_VERSION, "mtime": mtime, "archives": archives}
+        # The cache might be read-only, in which case the manifest
+        # is only kept in memory.
+        with suppress(OSError), atomic_open(self._get_manifest_path(cache_dir)) as f:
+            f.write(json.dumps(data).encode())
+
     def _get_cached_archives(self, cache_dir: Path) -> list[Path]:
-        archive_types = ["whl", "tar.gz", "tar.bz2", "bz2", "zip"]
         paths: list[Path] = []
-        for archive_type in archive_types:
+        for archive_type in ARCHIVE_TYPES:
             paths += cache_dir.glob(f"*.{archive_type}")
 
         return paths
@@ -137,10 +137,17 @@ def download_file(
     chunk_size: int = 1024,
     raise_accepts_ranges: bool = False,
     max_retries: int = 0,
-) -> None:
+    hash_names: Collection[str] = (),
+) -> dict[str, str]:
+    """
+    Downloads a file and returns the requested hashes of its content,
+    which are computed while downloading.
+    """
     from poetry.puzzle.provider import Indicator
 
-    downloader = Downloader(url, dest, session, max_retries=max_retries)
+    downloader = Downloader(
+        url, dest, session, max_retries=max_retries, hash_names=hash_names
+    )
 
     if raise_accepts_ranges and downloader.accepts_ranges:
         raise HTTPRangeRequestSupportedError(f"URL {url} supports range requests.")
@@ -165,6 +172,8 @@ def download_file(
                     last_percent = percent
                     update_context(f"Downloading {url} {percent:3}%")
 
+    return downloader.hashes
+
 
 class Downloader:
     def __init__(
@@ -173,9 +182,13 @@ class Downloader:
         dest: Path,
         session: Authenticator | Session | None = None,
         max_retries: int = 0,
+        hash_names: Collection[str] = (),
     ):
         self._dest = dest
         self._max_retries = max_retries
+        # The hashes are computed while downloading
+        # so that the file does not need to be read again.
+        self._hashes = {name: hashlib.new(name) for name in hash_names}
         self._session = session or get_default_authenticator()
         self._url = url
         self._response = self._get()
@@ -192,6 +205,13 @@ class Downloader:
                 total_size = int(self._response.headers["Content-Length"])
         return total_size
 
+    @property
+    def hashes(self) -> dict[str, str]:
+        """
+        The hashes of the downloaded content (see download_with_progress()).
+        """
+        return {name: h.hexdigest() for name, h in self._hashes.items()}
+
     def _get(self, start: int = 0) -> Response:
         headers = {"Accept-Encoding": "Identity"}
         if start > 0:
@@ -238,6 +258,8 @@ class Downloader:
             for chunk in self._iter_content_with_resume(chunk_size=chunk_size):
                 if chunk:
                     f.write(chunk)
+                    for h in self._hashes.values():
+                        h.update(chunk)
                     fetched_size += len(chunk)
                     yield fetched_size
 
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from collections import Counter
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+from typing import Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+_profiler: Profiler | None = None
+
+
+class Profiler:
+    """
+    Records the time spent in the phases of a dependency resolution
+    and counts events like decisions or network requests.
+
+    Phases are only recorded in the thread the profiler has been created in
+    so that they are properly nested. Events are counted in all threads.
+    """
+
+    def __init__(self) -> None:
+        self._thread = threading.get_ident()
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._end: float | None = None
+        # The opening and closing events of phases in chronological order
+        self._events: list[tuple[bool, str, str | None, float]] = []
+        self._counts: Counter[str] = Counter()
+
+    @contextmanager
+    def activate(self) -> Iterator[Profiler]:
+        global _profiler
+
+        previous = _profiler
+        _profiler = self
+        self._start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self._end = time.perf_counter()
+            _profiler = previous
+
+    @contextmanager
+    def phase(self, name: str, package: str | None = None) -> Iterator[None]:
+        if threading.get_ident() != self._thread:
+            yield
+            return
+
+        self._events.append((True, name, package, time.perf_counter()))
+        try:
+            yield
+        finally:
+            self._events.append((False, name, package, time.perf_counter()))
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += n
+
+    @property
+    def duration(self) -> float:
+        return (self._end or time.perf_counter()) - self._start
+
+    def to_json(self) -> dict[str, Any]:
+        phases: dict[str, dict[str, Any]] = {}
+        packages: dict[str, dict[str, Any]] = {}
+        # The start times of the open phases and the time spent in nested phases
+        stack: list[list[float]] = []
+        for is_opening, name, package, at in self._events:
+            if is_opening:
+                stack.append([at, 0.0])
+                continue
+
+            start, nested = stack.pop()
+            total = at - start
+            if stack:
+                stack[-1][1] += total
+
+            if package is not None:
+                stats = packages.setdefault(package, {})
+                stats[name] = stats.get(name, 0.0) + total
+
+            stats = phases.setdefault(name, {"total": 0.0, "self": 0.0, "calls": 0})
+            stats["total"] += total
+            stats["self"] += total - nested
+            stats["calls"] += 1
+
+        return {
+            "duration": self.duration,
+            "phases": phases,
+            "counts": dict(sorted(self._counts.items())),
+            "packages": dict(
+                sorted(
+                    packages.items(),
+                    key=lambda item: sum(item[1].values()),
+                    reverse=True,
+                )
+            ),
+        }
+
+    def to_speedscope(self, name: str = "poetry") -> dict[str, Any]:
+        frames: dict[str, int] = {}
+        events = []
+        for is_opening, phase, package, at in self._events:
+            frame = phase if package is None else f"{phase} ({package})"
+            events.append(
+                {
+                    "type": "O" if is_opening else "C",
+                    "frame": frames.setdefault(frame, len(frames)),
+                    "at": at - self._start,
+                }
+            )
+
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "poetry",
+            "activeProfileIndex": 0,
+            "shared": {"frames": [{"name": frame} for frame in frames]},
+            "profiles": [
+                {
+                    "type": "evented",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": self.duration,
+                    "events": events,
+                }
+            ],
+        }
+
+
+def get_profiler() -> Profiler | None:
+    return _profiler
+
+
+@contextmanager
+def profile(name: str, package: str | None = None) -> Iterator[None]:
+    """
+    Records a phase with the active profiler, if any.
+    """
+    if _profiler is None:
+        yield
+    else:
+        with _profiler.phase(name, package):
+            yield
+
+
+def count(name: str, n: int = 1) -> None:
+    """
+    Counts an event with the active profiler, if any.
+    """
+    if _profiler is not None:
+        _profiler.count(name, n)
@@ -0,0 +1,109 @@
+"""
+Benchmark of merging feature packages into their base packages.
+
+Builds a synthetic solution with many packages with extras (like boto3,
+sqlalchemy or celery with their extras) and measures how long it takes
+to merge the dependencies of the feature packages into the base packages.
+
+Usage::
+
+    python -m tests.benchmarks.feature_packages [--packages N] [--extras N]
+        [--requires N] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import sys
+import time
+
+from typing import TYPE_CHECKING
+
+from poetry.core.packages.dependency import Dependency
+from poetry.core.packages.package import Package
+
+from poetry.puzzle.solver import merge_feature_packages
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+logger = logging.getLogger(__name__)
+
+
+def build_packages(packages: int, extras: int, requires: int) -> list[Package]:
+    """
+    Returns base packages with the given number of dependencies
+    and feature packages for the given number of extras per base package.
+    Half of the dependencies of each feature package are shared
+    with the base package.
+    """
+    result = []
+    for i in range(packages):
+        name = f"package-{i}"
+        base = Package(name, "1.0")
+        for j in range(requires):
+            base.add_dependency(Dependency(f"dependency-{i}-{j}", ">=1.0"))
+        result.append(base)
+
+        for k in range(extras):
+            feature = Package(name, "1.0", features=[f"extra-{k}"])
+            feature.add_dependency(Dependency(name, "1.0"))
+            for j in range(requires):
+                dependency = (
+                    f"dependency-{i}-{j}" if j % 2 else f"dependency-{i}-{k}-{j}"
+                )
+                feature.add_dependency(Dependency(dependency, ">=1.0"))
+            result.append(feature)
+
+    return result
+
+
+def run(packages: int, extras: int, requires: int, repeat: int) -> list[float]:
+    wall_times = []
+    for _ in range(repeat):
+        solution = build_packages(packages, extras, requires)
+        start = time.perf_counter()
+        merge_feature_packages(solution)
+        wall_times.append(time.perf_counter() - start)
+
+    return wall_times
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--packages", type=int, default=500, help="The number of base packages."
+    )
+    parser.add_argument(
+        "--extras", type=int, default=8, help="The number of extras per package."
+    )
+    parser.add_argument(
+        "--requires",
+        type=int,
+        default=20,
+        help="The number of dependencies per package.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="The number of timed runs."
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    wall_times = run(args.packages, args.extras, args.requires, args.repeat)
+    logger.info(
+        "Merged %d feature packages into %d base packages: %.3fs",
+        args.packages * args.extras,
+        args.packages,
+        statistics.median(wall_times),
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""
+Records the index metadata of a resolver benchmark case from PyPI.
+
+The recorded fixture contains the requires-dist and requires-python metadata
+of the latest releases of every package which may be part of the resolution,
+so that the benchmark can be run offline and deterministically afterwards.
+
+Usage::
+
+    python -m tests.benchmarks.record <case> [--max-versions N]
+
+The root requirements and the python constraint of the case are read
+from its existing fixture, which is updated in place. To add a case,
+create a fixture with only these keys and record it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import re
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+from email.parser import HeaderParser
+from typing import TYPE_CHECKING
+from typing import Any
+from urllib.parse import urljoin
+
+import requests
+
+from packaging.requirements import InvalidRequirement
+from packaging.requirements import Requirement
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion
+from packaging.version import Version
+
+from tests.benchmarks.resolver import FIXTURES_DIR
+from tests.benchmarks.resolver import load_case
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from packaging.utils import NormalizedName
+
+
+logger = logging.getLogger(__name__)
+
+PYPI_URL = "https://pypi.org/pypi"
+EXTRA_MARKER = re.compile(r"""extra\s*==\s*["']([^"']+)["']""")
+
+
+class Recorder:
+    def __init__(self, max_versions: int, workers: int = 8) -> None:
+        self._max_versions = max_versions
+        self._session = requests.Session()
+        # Releases are fetched by a separate executor than the packages
+        # so that fetching a package never waits for a busy worker of its own.
+        self._package_executor = ThreadPoolExecutor(max_workers=4)
+        self._release_executor = ThreadPoolExecutor(max_workers=workers)
+
+    def record(
+        self, requirements: Sequence[str]
+    ) -> dict[str, dict[str, dict[str, Any]]]:
+        packages: dict[NormalizedName, dict[str, dict[str, Any]]] = {}
+        extras: dict[NormalizedName, set[str]] = {}
+        queue = [Requirement(requirement) for requirement in requirements]
+
+        while queue:
+            pending: dict[NormalizedName, set[str]] = {}
+            for requirement in queue:
+                name = canonicalize_name(requirement.name)
+                new_extras = set(requirement.extras) - extras.get(name, set())
+                if name not in packages or new_extras:
+                    pending.setdefault(name, set()).update(new_extras)
+            queue = []
+
+            unknown = [name for name in pending if name not in packages]
+            for name, releases in zip(
+                unknown, self._package_executor.map(self._releases, unknown)
+            ):
+                logger.info("Recorded %d releases of %s", len(releases), name)
+                packages[name] = releases
+
+            for name, new_extras in pending.items():
+                extras.setdefault(name, set()).update(new_extras)
+                for release in packages[name].values():
+                    queue.extend(
+                        Requirement(requirement)
+                        for requirement in _dependencies(
+                            release["requires_dist"], extras[name]
+                        )
+                    )
+
+        # Dependencies of extras that are never requested are irrelevant.
+        for name, releases in packages.items():
+            for release in releases.values():
+                release["requires_dist"] = _dependencies(
+                    release["requires_dist"], extras[name]
+                )
+
+        return {name: packages[name] for name in sorted(packages)}
+
+    def _get(self, url: str, attempts: int = 3) -> requests.Response | None:
+        for _ in range(attempts):
+            response = self._session.get(url, timeout=30)
+            if response.ok:
+                return response
+
+        return None
+
+    def _releases(self, name: str) -> dict[str, dict[str, Any]]:
+        response = self._get(f"{PYPI_URL}/{name}/json")
+        if response is None:
+            logger.warning("No releases found for %s", name)
+            return {}
+
+        versions = []
+        for version, files in response.json()["releases"].items():
+            try:
+                parsed = Version(version)
+            except InvalidVersion:
+                continue
+            if files and not parsed.is_prerelease:
+                versions.append((parsed, version, files))
+
+        versions = sorted(versions, key=lambda version: version[0])
+        versions = versions[-self._max_versions :]
+        releases = self._release_executor.map(
+            lambda version: self._release(name, version[1], version[2], response.url),
+            versions,
+        )
+
+        return {
+            version: release for (_, version, _), release in zip(versions, releases)
+        }
+
+    def _release(
+        self, name: str, version: str, files: list[dict[str, Any]], base_url: str
+    ) -> dict[str, Any]:
+        release: dict[str, Any] = {
+            "requires_python": next(
+                (f["requires_python"] for f in files if f.get("requires_python")),
+                None,
+            ),
+            "requires_dist": [],
+            "yanked": all(f["yanked"] for f in files),
+        }
+
+        # The metadata of wheels is authoritative (PEP 658), whereas the metadata
+        # of a release in the JSON API stems from the file uploaded first.
+        wheel = next(
+            (
+                f
+                for f in files
+                if f["packagetype"] == "bdist_wheel" and f.get("core-metadata")
+            ),
+            None,
+        )
+        if wheel is not None:
+            response = self._get(urljoin(base_url, wheel["url"]) + ".metadata")
+            if response is not None:
+                metadata = HeaderParser().parsestr(response.text)
+                release["requires_dist"] = metadata.get_all("Requires-Dist") or []
+                release["requires_python"] = metadata.get("Requires-Python")
+                return release
+
+        response = self._get(f"{PYPI_URL}/{name}/{version}/json")
+        if response is not None:
+            info = response.json()["info"]
+            release["requires_dist"] = info.get("requires_dist") or []
+        else:
+            logger.warning("No metadata found for %s %s", name, version)
+
+        return release
+
+
+def _dependencies(requires_dist: list[str], extras: set[str]) -> list[str]:
+    """
+    Returns the requirements which are not restricted to other extras.
+    """
+    dependencies = []
+    for requirement in requires_dist:
+        try:
+            dependency = Requirement(requirement)
+        except InvalidRequirement:
+            continue
+
+        if dependency.marker is not None:
+            required_by = set(EXTRA_MARKER.findall(str(dependency.marker)))
+            if required_by and not required_by & extras:
+                continue
+
+        dependencies.append(requirement)
+
+    return dependencies
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("case", help="The name of the benchmark case to record.")
+    parser.add_argument(
+        "--max-versions",
+        type=int,
+        help="The number of latest releases to record per package"
+        " (default: the number stored in the fixture or 30).",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    case = load_case(args.case)
+    if args.max_versions is not None:
+        case["max-versions"] = args.max_versions
+    max_versions = case.setdefault("max-versions", 30)
+    case["packages"] = Recorder(max_versions).record(case["requirements"])
+
+    path = FIXTURES_DIR / f"{args.case}.json"
+    path.write_text(json.dumps(case, indent=1, sort_keys=True) + "\n")
+    logger.info("Recorded %d packages to %s", len(case["packages"]), path)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
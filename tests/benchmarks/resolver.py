@@ -0,0 +1,382 @@
+"""
+Offline benchmarks of the dependency resolver.
+
+Every benchmark case is a fixture of recorded index metadata
+(see tests/benchmarks/record.py) that is served by a stand-in repository,
+so that the results only depend on the resolver and not on the network.
+
+Usage::
+
+    python -m tests.benchmarks.resolver [case ...] [--repeat N]
+        [--output results.json] [--baseline baseline.json] [--threshold 0.1]
+
+For every case, the median wall time, the number of decisions, backtracks
+and attempted solutions of the version solver and the peak memory
+(measured in a separate run) are reported. If a baseline is given,
+the exit code is non-zero if a case has become slower or needs more memory
+than the baseline by more than the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import hashlib
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from unittest import mock
+
+from cleo.io.null_io import NullIO
+from packaging.utils import canonicalize_name
+from poetry.core.constraints.version import Version
+from poetry.core.packages.dependency import Dependency
+from poetry.core.packages.package import Package
+from poetry.core.packages.project_package import ProjectPackage
+
+from poetry.config.config import Config
+from poetry.inspection.info import PackageInfo
+from poetry.mixology.heuristics import HEURISTICS
+from poetry.mixology.partial_solution import PartialSolution
+from poetry.puzzle.solver import Solver
+from poetry.repositories.exceptions import PackageNotFoundError
+from poetry.repositories.repository import Repository
+from poetry.repositories.repository_pool import RepositoryPool
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Sequence
+
+    from packaging.utils import NormalizedName
+    from poetry.core.constraints.version import VersionConstraint
+
+
+logger = logging.getLogger(__name__)
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+class FixtureRepository(Repository):
+    """
+    A stand-in for a package index serving the recorded metadata of a case.
+    """
+
+    def __init__(self, packages: dict[str, dict[str, dict[str, Any]]]) -> None:
+        super().__init__("benchmark")
+
+        self._releases = {
+            canonicalize_name(name): {
+                Version.parse(version): release for version, release in releases.items()
+            }
+            for name, releases in packages.items()
+        }
+
+    def _find_packages(
+        self, name: NormalizedName, constraint: VersionConstraint
+    ) -> list[Package]:
+        return [
+            Package(name, version, yanked=release["yanked"])
+            for version, release in self._releases.get(name, {}).items()
+            if constraint.allows(version)
+        ]
+
+    def package(self, name: str, version: Version) -> Package:
+        try:
+            release = self._releases[canonicalize_name(name)][version]
+        except KeyError:
+            raise PackageNotFoundError(f"Package {name} ({version}) not found.")
+
+        return PackageInfo(
+            name=name,
+            version=version.text,
+            requires_dist=release["requires_dist"],
+            requires_python=release["requires_python"],
+            yanked=release["yanked"],
+        ).to_package(name=name)
+
+
+@dataclasses.dataclass
+class Result:
+    case: str
+    wall_times: list[float]
+    decisions: int
+    backtracks: int
+    attempted_solutions: int
+    packages: int
+    solution: str
+    peak_memory: int | None = None
+
+    @property
+    def wall_time(self) -> float:
+        return statistics.median(self.wall_times)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"wall_time": self.wall_time, **dataclasses.asdict(self)}
+
+
+@dataclasses.dataclass
+class Comparison:
+    case: str
+    wall_time: float
+    peak_memory: float | None
+    solution_changed: bool
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.wall_time > 1 + threshold or (
+            self.peak_memory is not None and self.peak_memory > 1 + threshold
+        )
+
+
+class _SolverStats:
+    def __init__(self) -> None:
+        self.decisions = 0
+        self.backtracks = 0
+        self._solutions: list[PartialSolution] = []
+
+    @property
+    def attempted_solutions(self) -> int:
+        return sum(solution.attempted_solutions for solution in self._solutions)
+
+    @contextmanager
+    def record(self) -> Iterator[None]:
+        decide = PartialSolution.decide
+        backtrack = PartialSolution.backtrack
+
+        def _decide(solution: PartialSolution, package: Package) -> None:
+            if not self._solutions or self._solutions[-1] is not solution:
+                self._solutions.append(solution)
+            self.decisions += 1
+            decide(solution, package)
+
+        def _backtrack(solution: PartialSolution, decision_level: int) -> None:
+            self.backtracks += 1
+            backtrack(solution, decision_level)
+
+        with (
+            mock.patch.object(PartialSolution, "decide", _decide),
+            mock.patch.object(PartialSolution, "backtrack", _backtrack),
+        ):
+            yield
+
+
+def list_cases() -> list[str]:
+    return sorted(path.stem for path in FIXTURES_DIR.glob("*.json"))
+
+
+def load_case(name: str) -> dict[str, Any]:
+    path = FIXTURES_DIR / f"{name}.json"
+    if not path.exists():
+        raise ValueError(
+            f"Unknown benchmark case {name}. Available cases: {', '.join(list_cases())}"
+        )
+
+    case: dict[str, Any] = json.loads(path.read_text())
+    return case
+
+
+def resolve(
+    case: dict[str, Any], name: str = "case", heuristic: str | None = None
+) -> dict[str, str]:
+    """
+    Resolves the requirements of a case and returns the solution.
+    """
+    package = ProjectPackage(f"benchmark-{name}", "1.0.0")
+    package.python_versions = case["python"]
+    for requirement in case["requirements"]:
+        package.add_dependency(Dependency.create_from_pep_508(requirement))
+
+    pool = RepositoryPool([FixtureRepository(case["packages"])])
+    solver = Solver(package, pool, [], [], NullIO(), heuristic=heuristic)
+    packages = solver.solve().get_solved_packages()
+
+    return {package.name: package.version.text for package in packages}
+
+
+def run_case(
+    name: str,
+    case: dict[str, Any],
+    repeat: int = 5,
+    measure_memory: bool = True,
+    heuristic: str | None = None,
+) -> Result:
+    wall_times = []
+    for _ in range(repeat):
+        stats = _SolverStats()
+        with stats.record():
+            start = time.perf_counter()
+            solution = resolve(case, name, heuristic)
+            wall_times.append(time.perf_counter() - start)
+
+    peak_memory = None
+    if measure_memory:
+        # Tracing allocations slows down the resolution considerably,
+        # which is why the memory is measured in a run that is not timed.
+        tracemalloc.start()
+        try:
+            resolve(case, name, heuristic)
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return Result(
+        case=name,
+        wall_times=wall_times,
+        decisions=stats.decisions,
+        backtracks=stats.backtracks,
+        attempted_solutions=stats.attempted_solutions,
+        packages=len(solution),
+        solution=hashlib.sha256(
+            json.dumps(solution, sort_keys=True).encode()
+        ).hexdigest(),
+        peak_memory=peak_memory,
+    )
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any]) -> dict[str, Comparison]:
+    """
+    Compares the results of a run to a baseline and returns the ratios
+    of wall time and peak memory for every case present in both.
+    """
+    comparisons = {}
+    for name, result in results["cases"].items():
+        base = baseline["cases"].get(name)
+        if base is None:
+            continue
+
+        peak_memory = None
+        if result.get("peak_memory") and base.get("peak_memory"):
+            peak_memory = result["peak_memory"] / base["peak_memory"]
+
+        comparisons[name] = Comparison(
+            case=name,
+            wall_time=result["wall_time"] / base["wall_time"],
+            peak_memory=peak_memory,
+            solution_changed=result["solution"] != base["solution"],
+        )
+
+    return comparisons
+
+
+@contextmanager
+def _isolated_config() -> Iterator[None]:
+    # The user's configuration (e.g. the number of workers)
+    # and caches must not influence the results.
+    with tempfile.TemporaryDirectory() as cache_dir:
+        config = Config()
+        config.merge({"cache-dir": cache_dir})
+        with mock.patch.object(Config, "create", return_value=config):
+            yield
+
+
+def _format_result(result: dict[str, Any], base: dict[str, Any] | None) -> str:
+    def _delta(key: str) -> str:
+        if base is None or not base.get(key):
+            return ""
+        return f" ({result[key] / base[key] - 1:+.1%})"
+
+    line = (
+        f"{result['case']}: {result['wall_time']:.3f}s{_delta('wall_time')},"
+        f" {result['decisions']} decisions{_delta('decisions')},"
+        f" {result['backtracks']} backtracks{_delta('backtracks')},"
+        f" {result['attempted_solutions']} attempted solutions,"
+        f" {result['packages']} packages"
+    )
+    if result.get("peak_memory") is not None:
+        line += (
+            f", peak memory {result['peak_memory'] / 2**20:.1f} MiB"
+            f"{_delta('peak_memory')}"
+        )
+
+    return line
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "cases",
+        nargs="*",
+        help=f"The cases to run (default: all). Available: {', '.join(list_cases())}",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="The number of timed runs per case.",
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Do not measure the peak memory.",
+    )
+    parser.add_argument(
+        "--heuristic",
+        choices=list(HEURISTICS),
+        default="default",
+        help="The heuristic the solver uses to choose the next package.",
+    )
+    parser.add_argument("--output", type=Path, help="Write the results to this file.")
+    parser.add_argument(
+        "--baseline", type=Path, help="Compare the results to this file."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="The relative slowdown that is considered a regression.",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+    results: dict[str, Any] = {
+        "python": sys.version.split()[0],
+        "heuristic": args.heuristic,
+        "cases": {},
+    }
+    with _isolated_config():
+        for name in args.cases or list_cases():
+            result = run_case(
+                name,
+                load_case(name),
+                repeat=args.repeat,
+                measure_memory=not args.no_memory,
+                heuristic=args.heuristic,
+            )
+            results["cases"][name] = result.to_dict()
+            logger.info(
+                _format_result(
+                    results["cases"][name],
+                    baseline["cases"].get(name) if baseline else None,
+                )
+            )
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+
+    if baseline is None:
+        return 0
+
+    regressions = 0
+    for name, comparison in compare(results, baseline).items():
+        if comparison.solution_changed:
+            logger.warning("%s: the solution differs from the baseline", name)
+        if comparison.is_regression(args.threshold):
+            logger.warning("%s: regression beyond the threshold", name)
+            regressions += 1
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+Benchmark of parsing the pages of the Simple API.
+
+Builds the page of a synthetic package with many files (like the pages of
+numpy or boto3) both as HTML (PEP 503) and as JSON (PEP 691) and measures
+how long it takes to parse it and to extract the links of all versions
+(or only of the newest versions, like the solver usually does).
+
+Usage::
+
+    python -m tests.benchmarks.simple_pages [--files N] [--inspect N] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+import tracemalloc
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from packaging.utils import canonicalize_name
+
+from poetry.repositories.link_sources.html import HTMLPage
+from poetry.repositories.link_sources.json import SimpleJsonPage
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Sequence
+
+    from poetry.repositories.link_sources.base import LinkSource
+
+
+logger = logging.getLogger(__name__)
+
+NAME = "package"
+URL = f"https://example.org/simple/{NAME}/"
+# Like most packages with many files, each version has some wheels and an sdist.
+FILES_PER_VERSION = 5
+
+
+def build_files(files: int) -> list[dict[str, Any]]:
+    result = []
+    for i in range(files):
+        version = f"{i // FILES_PER_VERSION}.0"
+        wheel = i % FILES_PER_VERSION
+        if wheel:
+            filename = (
+                f"{NAME}-{version}-cp3{wheel + 8}-cp3{wheel + 8}-linux_x86_64.whl"
+            )
+        else:
+            filename = f"{NAME}-{version}.tar.gz"
+        file: dict[str, Any] = {
+            "filename": filename,
+            "url": f"https://files.example.org/packages/{filename}",
+            "hashes": {"sha256": f"{i:064x}"},
+            "requires-python": ">=3.9",
+        }
+        if wheel:
+            file["core-metadata"] = {"sha256": f"{i + files:064x}"}
+        result.append(file)
+
+    return result
+
+
+def build_html_page(files: list[dict[str, Any]]) -> str:
+    anchors = []
+    for file in files:
+        attributes = ' data-requires-python="&gt;=3.9"'
+        if metadata := file.get("core-metadata"):
+            attributes += f' data-core-metadata="sha256={metadata["sha256"]}"'
+        anchors.append(
+            f'<a href="{file["url"]}#sha256={file["hashes"]["sha256"]}"{attributes}>'
+            f"{file['filename']}</a><br/>"
+        )
+
+    return (
+        "<!DOCTYPE html>\n<html>\n<head><title>Links for package</title></head>\n"
+        "<body>\n<h1>Links for package</h1>\n" + "\n".join(anchors) + "\n</body>\n"
+        "</html>\n"
+    )
+
+
+def build_json_page(files: list[dict[str, Any]]) -> str:
+    return json.dumps({"meta": {"api-version": "1.0"}, "name": NAME, "files": files})
+
+
+def parse(page: LinkSource, inspect: int | None) -> int:
+    """
+    Returns the number of links of the newest versions of the page
+    (or of all versions if no number is given).
+    """
+    name = canonicalize_name(NAME)
+    versions = sorted(page.versions(name), reverse=True)[:inspect]
+    return sum(len(list(page.links_for_version(name, version))) for version in versions)
+
+
+def run(
+    content: str,
+    create_page: Callable[[str], LinkSource],
+    inspect: int | None,
+    repeat: int,
+) -> tuple[list[float], int, int]:
+    wall_times = []
+    links = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        links = parse(create_page(content), inspect)
+        wall_times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    parse(create_page(content), inspect)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return wall_times, links, peak_memory
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--files", type=int, default=5000, help="The number of files on the page."
+    )
+    parser.add_argument(
+        "--inspect",
+        type=int,
+        default=None,
+        help="The number of (newest) versions whose links are inspected."
+        " By default, the links of all versions are inspected.",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="The number of timed runs."
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    files = build_files(args.files)
+    pages: dict[str, tuple[str, Callable[[str], LinkSource]]] = {
+        "HTML": (build_html_page(files), lambda content: HTMLPage(URL, content)),
+        "JSON": (
+            build_json_page(files),
+            lambda content: SimpleJsonPage(URL, json.loads(content)),
+        ),
+    }
+
+    medians = {}
+    for page_format, (content, create_page) in pages.items():
+        wall_times, links, peak_memory = run(
+            content, create_page, args.inspect, args.repeat
+        )
+        medians[page_format] = statistics.median(wall_times)
+        logger.info(
+            "%s page (%d KiB), %d links inspected: %.3fs, peak memory %.1f MiB",
+            page_format,
+            len(content) // 1024,
+            links,
+            medians[page_format],
+            peak_memory / 2**20,
+        )
+
+    logger.info("JSON is %.1fx faster", medians["HTML"] / medians["JSON"])
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from poetry.core.packages.dependency import Dependency
+
+from tests.benchmarks.resolver import FixtureRepository
+from tests.benchmarks.resolver import Result
+from tests.benchmarks.resolver import compare
+from tests.benchmarks.resolver import list_cases
+from tests.benchmarks.resolver import load_case
+from tests.benchmarks.resolver import run_case
+
+
+def _release(*requires_dist: str, python: str | None = None) -> dict[str, Any]:
+    return {
+        "requires_dist": list(requires_dist),
+        "requires_python": python,
+        "yanked": False,
+    }
+
+
+def test_run_case_reports_solver_statistics() -> None:
+    case = {
+        "python": ">=3.9",
+        "requirements": ["a", "b"],
+        "packages": {
+            "a": {
+                "1.0": _release("c>=1"),
+                # requires a version of c which does not exist
+                "2.0": _release("c<1"),
+            },
+            "b": {"1.0": _release(), "2.0": _release(python=">=4")},
+            "c": {"1.0": _release()},
+        },
+    }
+
+    result = run_case("test", case, repeat=2, measure_memory=False)
+
+    assert len(result.wall_times) == 2
+    assert result.packages == 3
+    assert result.decisions >= 3
+    assert result.backtracks >= 1
+    assert result.attempted_solutions >= 2
+    assert result.peak_memory is None
+
+
+def test_run_case_measures_peak_memory() -> None:
+    case = {
+        "python": ">=3.9",
+        "requirements": ["a"],
+        "packages": {"a": {"1.0": _release()}},
+    }
+
+    result = run_case("test", case, repeat=1)
+
+    assert result.peak_memory is not None
+    assert result.peak_memory > 0
+
+
+def test_compare_detects_regressions() -> None:
+    base = Result(
+        case="test",
+        wall_times=[1.0],
+        decisions=10,
+        backtracks=1,
+        attempted_solutions=2,
+        packages=3,
+        solution="abc",
+        peak_memory=1000,
+    )
+    slower = Result(
+        case="test",
+        wall_times=[1.5],
+        decisions=10,
+        backtracks=1,
+        attempted_solutions=2,
+        packages=3,
+        solution="def",
+        peak_memory=1000,
+    )
+
+    comparisons = compare(
+        {"cases": {"test": slower.to_dict(), "new": slower.to_dict()}},
+        {"cases": {"test": base.to_dict()}},
+    )
+
+    assert list(comparisons) == ["test"]
+    comparison = comparisons["test"]
+    assert comparison.wall_time == 1.5
+    assert comparison.peak_memory == 1.0
+    assert comparison.solution_changed
+    assert comparison.is_regression(0.1)
+    assert not comparison.is_regression(0.6)
+
+
+@pytest.mark.parametrize("name", list_cases())
+def test_fixtures_are_well_formed(name: str) -> None:
+    case = load_case(name)
+
+    assert case["python"]
+    assert case["requirements"]
+    assert case["packages"]
+
+    repository = FixtureRepository(case["packages"])
+    for requirement in case["requirements"]:
+        assert repository.find_packages(Dependency.create_from_pep_508(requirement))
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from poetry.core.packages.utils.link import Link
+
+from poetry.mixology.incompatibility_cache import IncompatibilityCache
+from poetry.utils.cache import ArtifactCache
+from poetry.utils.cache import FileCache
+from poetry.utils.cache import SQLiteCache
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from cleo.testers.command_tester import CommandTester
+
+    from tests.conftest import Config
+    from tests.types import CommandTesterFactory
+
+
+@pytest.fixture
+def tester(command_tester_factory: CommandTesterFactory) -> CommandTester:
+    return command_tester_factory("cache prune")
+
+
+@pytest.fixture
+def archives(config: Config) -> list[Path]:
+    cache = ArtifactCache(cache_dir=config.artifacts_cache_directory)
+    archives = []
+    for i in range(3):
+        link = Link(f"https://files.pythonhosted.org/demo-0.{i}.0.tar.gz")
+        cache_dir = cache.get_cache_directory_for_link(link)
+        cache_dir.mkdir(parents=True)
+        archive = cache_dir / link.filename
+        archive.write_bytes(b"a" * 2**20)
+        os.utime(cache_dir, (1_000_000 + i, 1_000_000 + i))
+        archives.append(archive)
+
+    return archives
+
+
+def test_cache_prune(
+    tester: CommandTester,
+    archives: list[Path],
+    cache: FileCache[dict[str, str]],
+) -> None:
+    for path in cache.path.rglob("*"):
+        if path.is_file():
+            os.utime(path, (2_000_000, 2_000_000))
+
+    # the archives and the (small) entries of the repository cache exceed 3 MiB
+    tester.execute("--max-size 3")
+
+    # the least recently used archive is removed
+    assert [archive.exists() for archive in archives] == [False, True, True]
+    assert cache.get("cachy:0.1") is not None
+    assert tester.io.fetch_output() == (
+        "Removed 1 cache entries (1.0 MiB). The caches use 2.0 MiB now.\n"
+    )
+
+    tester.execute("--max-size 2")
+
+    assert [archive.exists() for archive in archives] == [False, False, True]
+    assert cache.get("cachy:0.1") is not None
+
+
+def test_cache_prune_uses_max_size_setting(
+    tester: CommandTester, archives: list[Path], config: Config
+) -> None:
+    config.merge({"cache": {"max-size": 1}})
+
+    tester.execute()
+
+    assert [archive.exists() for archive in archives] == [False, False, True]
+
+
+def test_cache_prune_keeps_recently_used_entries(
+    tester: CommandTester, archives: list[Path]
+) -> None:
+    os.utime(archives[0].parent)
+    os.utime(archives[1].parent)
+
+    tester.execute("--max-size 1")
+
+    assert [archive.exists() for archive in archives] == [True, True, False]
+    assert "The caches still exceed the maximum size" in tester.io.fetch_error()
+
+
+def test_cache_prune_without_max_size(
+    tester: CommandTester, archives: list[Path]
+) -> None:
+    assert tester.execute() == 1
+
+    assert "No maximum size given" in tester.io.fetch_error()
+    assert all(archive.exists() for archive in archives)
+
+
+@pytest.mark.parametrize("backend", ["file", "sqlite"])
+def test_cache_prune_keeps_solver_cache(
+    tester: CommandTester,
+    archives: list[Path],
+    config: Config,
+    backend: str,
+) -> None:
+    config.merge({"cache": {"release-backend": backend}})
+    solver_cache: FileCache[str] = FileCache(
+        path=config.repository_cache_directory / "_solver"
+    )
+    solver_cache.put("key", "value")
+    assert len(IncompatibilityCache.entries(config)) == 1
+
+    tester.execute("--max-size 100")
+
+    assert solver_cache.get("key") == "value"
+    assert not (solver_cache.path / SQLiteCache.DATABASE).exists()
+    assert all(archive.exists() for archive in archives)
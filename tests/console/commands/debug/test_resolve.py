@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import json
+
 from typing import TYPE_CHECKING
 
 import pytest
 
+from cleo.io.outputs.output import Verbosity
+
 from poetry.factory import Factory
 from tests.helpers import get_package
 
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from cleo.testers.command_tester import CommandTester
 
     from tests.helpers import TestRepository
@@ -78,3 +84,82 @@ demo     0.1.2
 """
 
     assert tester.io.fetch_output() == expected
+
+
+def test_debug_resolve_very_verbose_shows_dependency_cache_info(
+    tester: CommandTester,
+) -> None:
+    tester.execute("cachy", verbosity=Verbosity.DEBUG)
+
+    assert "Dependency cache: " in tester.io.fetch_output()
+
+
+def test_debug_resolve_profile_writes_json(
+    tester: CommandTester, tmp_path: Path
+) -> None:
+    path = tmp_path / "profile.json"
+    tester.execute(f"cachy --profile {path}")
+
+    output = tester.io.fetch_output()
+    assert f"Profile written to {path}" in output
+    assert "  - decisions: 3" in output
+
+    profile = json.loads(path.read_text(encoding="utf-8"))
+    assert set(profile["phases"]) == {
+        "propagate",
+        "choose version",
+        "complete package",
+        "metadata fetch",
+    }
+    assert profile["phases"]["complete package"]["calls"] == 3
+    assert profile["counts"] == {"decisions": 3}
+    assert set(profile["packages"]) == {"cachy", "msgpack-python", "simple-project"}
+
+
+def test_debug_resolve_profile_writes_speedscope_trace(
+    tester: CommandTester, tmp_path: Path
+) -> None:
+    path = tmp_path / "profile.json"
+    tester.execute(f"cachy --profile {path} --profile-format speedscope")
+
+    profile = json.loads(path.read_text(encoding="utf-8"))
+    frames = [frame["name"] for frame in profile["shared"]["frames"]]
+    assert "complete package (cachy)" in frames
+    (trace,) = profile["profiles"]
+    assert trace["type"] == "evented"
+    assert [event["type"] for event in trace["events"]].count("O") == len(
+        trace["events"]
+    ) // 2
+
+
+def test_debug_resolve_profile_invalid_format(
+    tester: CommandTester, tmp_path: Path
+) -> None:
+    status = tester.execute(f"cachy --profile {tmp_path / 'p'} --profile-format foo")
+
+    assert status == 1
+    assert "Invalid profile format: foo" in tester.io.fetch_error()
+
+
+def test_debug_resolve_very_verbose_shows_marker_cache_info(
+    tester: CommandTester,
+) -> None:
+    tester.execute("cachy", verbosity=Verbosity.DEBUG)
+
+    output = tester.io.fetch_output()
+    assert "Marker and constraint caches:" in output
+    assert "marker union: " in output
+
+
+@pytest.mark.parametrize("heuristic", ["default", "activity", "recent-conflicts"])
+def test_debug_resolve_heuristic(tester: CommandTester, heuristic: str) -> None:
+    tester.execute(f"cachy --heuristic {heuristic}")
+
+    assert "cachy          0.2.0" in tester.io.fetch_output()
+
+
+def test_debug_resolve_invalid_heuristic(tester: CommandTester) -> None:
+    status = tester.execute("cachy --heuristic foo")
+
+    assert status == 1
+    assert "Invalid heuristic: foo" in tester.io.fetch_error()
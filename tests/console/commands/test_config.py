@@ -56,7 +56,9 @@ def test_list_displays_default_value_if_not_set(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.max-size = null
+cache.release-backend = "file"
+cache-dir = {cache_dir}
 data-dir = {data_dir}
 installer.max-workers = null
 installer.no-binary = null
@@ -66,7 +68,15 @@ installer.re-resolve = true
 keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
+solver.conflict-cache = false
+solver.dependency-cache-size = 128
+solver.heuristic = "default"
+solver.incremental-lock = false
 solver.lazy-wheel = true
+solver.max-workers = 1
+solver.page-prefetch-workers = 8
+solver.parallel-sources = false
+solver.prefetch-workers = 4
 system-git-client = false
 virtualenvs.create = true
 virtualenvs.in-project = null
@@ -91,7 +101,9 @@ def test_list_displays_set_get_setting(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.max-size = null
+cache.release-backend = "file"
+cache-dir = {cache_dir}
 data-dir = {data_dir}
 installer.max-workers = null
 installer.no-binary = null
@@ -101,7 +113,15 @@ installer.re-resolve = true
 keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
+solver.conflict-cache = false
+solver.dependency-cache-size = 128
+solver.heuristic = "default"
+solver.incremental-lock = false
 solver.lazy-wheel = true
+solver.max-workers = 1
+solver.page-prefetch-workers = 8
+solver.parallel-sources = false
+solver.prefetch-workers = 4
 system-git-client = false
 virtualenvs.create = false
 virtualenvs.in-project = null
@@ -147,7 +167,9 @@ def test_unset_setting(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.max-size = null
+cache.release-backend = "file"
+cache-dir = {cache_dir}
 data-dir = {data_dir}
 installer.max-workers = null
 installer.no-binary = null
@@ -157,7 +179,15 @@ installer.re-resolve = true
 keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
+solver.conflict-cache = false
+solver.dependency-cache-size = 128
+solver.heuristic = "default"
+solver.incremental-lock = false
 solver.lazy-wheel = true
+solver.max-workers = 1
+solver.page-prefetch-workers = 8
+solver.parallel-sources = false
+solver.prefetch-workers = 4
 system-git-client = false
 virtualenvs.create = true
 virtualenvs.in-project = null
@@ -181,7 +211,9 @@ def test_unset_repo_setting(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.max-size = null
+cache.release-backend = "file"
+cache-dir = {cache_dir}
 data-dir = {data_dir}
 installer.max-workers = null
 installer.no-binary = null
@@ -191,7 +223,15 @@ installer.re-resolve = true
 keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
+solver.conflict-cache = false
+solver.dependency-cache-size = 128
+solver.heuristic = "default"
+solver.incremental-lock = false
 solver.lazy-wheel = true
+solver.max-workers = 1
+solver.page-prefetch-workers = 8
+solver.parallel-sources = false
+solver.prefetch-workers = 4
 system-git-client = false
 virtualenvs.create = true
 virtualenvs.in-project = null
@@ -316,7 +356,9 @@ def test_list_displays_set_get_local_setting(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.max-size = null
+cache.release-backend = "file"
+cache-dir = {cache_dir}
 data-dir = {data_dir}
 installer.max-workers = null
 installer.no-binary = null
@@ -326,7 +368,15 @@ installer.re-resolve = true
 keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
+solver.conflict-cache = false
+solver.dependency-cache-size = 128
+solver.heuristic = "default"
+solver.incremental-lock = false
 solver.lazy-wheel = true
+solver.max-workers = 1
+solver.page-prefetch-workers = 8
+solver.parallel-sources = false
+solver.prefetch-workers = 4
 system-git-client = false
 virtualenvs.create = false
 virtualenvs.in-project = null
@@ -359,7 +409,9 @@ def test_list_must_not_display_sources_from_pyproject_toml(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.max-size = null
+cache.release-backend = "file"
+cache-dir = {cache_dir}
 data-dir = {data_dir}
 installer.max-workers = null
 installer.no-binary = null
@@ -370,7 +422,15 @@ keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 repositories.foo.url = "https://foo.bar/simple/"
 requests.max-retries = 0
+solver.conflict-cache = false
+solver.dependency-cache-size = 128
+solver.heuristic = "default"
+solver.incremental-lock = false
 solver.lazy-wheel = true
+solver.max-workers = 1
+solver.page-prefetch-workers = 8
+solver.parallel-sources = false
+solver.prefetch-workers = 4
 system-git-client = false
 virtualenvs.create = true
 virtualenvs.in-project = null
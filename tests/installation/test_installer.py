@@ -3323,3 +3323,118 @@ def test_explicit_source_dependency_with_direct_origin_dependency(
                 source_reference="repo",
             )
         ]
+
+
+def _incremental_lock_data() -> dict[str, Any]:
+    lock_data = {
+        "package": [
+            {
+                "name": "A",
+                "version": "1.0",
+                "optional": False,
+                "platform": "*",
+                "python-versions": "*",
+                "checksum": [],
+                "dependencies": {"B": "^1.0"},
+            },
+            {
+                "name": "B",
+                "version": "1.0",
+                "optional": False,
+                "platform": "*",
+                "python-versions": "*",
+                "checksum": [],
+            },
+            {
+                "name": "C",
+                "version": "1.0",
+                "optional": False,
+                "platform": "*",
+                "python-versions": "*",
+                "checksum": [],
+            },
+        ],
+        "metadata": {
+            "lock-version": "2.1",
+            "python-versions": "*",
+            "content-hash": "123456789",
+            "files": {"A": [], "B": [], "C": []},
+        },
+    }
+    fix_lock_data(lock_data)
+    return lock_data
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_lock_incremental_pins_unaffected_packages(
+    installer: Installer,
+    locker: Locker,
+    repo: Repository,
+    package: ProjectPackage,
+    config: Config,
+    mocker: MockerFixture,
+    incremental: bool,
+) -> None:
+    config.merge({"solver": {"incremental-lock": incremental}})
+    locker.locked(True)
+    locker.mock_lock_data(_incremental_lock_data())
+
+    package_a = get_package("A", "1.0")
+    package_a.add_dependency(Factory.create_dependency("B", "^1.0"))
+    repo.add_package(package_a)
+    repo.add_package(get_package("A", "1.1"))
+    repo.add_package(get_package("B", "1.0"))
+    repo.add_package(get_package("B", "1.1"))
+    repo.add_package(get_package("C", "1.0"))
+    repo.add_package(get_package("C", "2.0"))
+
+    package.add_dependency(Factory.create_dependency("A", "^1.0"))
+    package.add_dependency(Factory.create_dependency("C", "^2.0"))
+
+    spy = mocker.spy(repo, "package")
+
+    installer.lock(update=False)
+    result = installer.run()
+    assert result == 0
+
+    locked = {p["name"]: p["version"] for p in locker.written_data["package"]}
+    assert locked == {"A": "1.0", "B": "1.0", "C": "2.0"}
+
+    fetched = {call.args[0] for call in spy.call_args_list}
+    if incremental:
+        assert fetched == {"C"}
+    else:
+        assert fetched == {"A", "B", "C"}
+
+
+def test_lock_incremental_falls_back_to_full_resolution_on_conflict(
+    installer: Installer,
+    locker: Locker,
+    repo: Repository,
+    package: ProjectPackage,
+    config: Config,
+) -> None:
+    config.merge({"solver": {"incremental-lock": True}})
+    locker.locked(True)
+    locker.mock_lock_data(_incremental_lock_data())
+
+    package_a = get_package("A", "1.0")
+    package_a.add_dependency(Factory.create_dependency("B", "^1.0"))
+    package_d = get_package("D", "1.0")
+    package_d.add_dependency(Factory.create_dependency("B", ">=1.1"))
+    repo.add_package(package_a)
+    repo.add_package(get_package("B", "1.0"))
+    repo.add_package(get_package("B", "1.1"))
+    repo.add_package(get_package("C", "1.0"))
+    repo.add_package(package_d)
+
+    package.add_dependency(Factory.create_dependency("A", "^1.0"))
+    package.add_dependency(Factory.create_dependency("C", "^1.0"))
+    package.add_dependency(Factory.create_dependency("D", "^1.0"))
+
+    installer.lock(update=False)
+    result = installer.run()
+    assert result == 0
+
+    locked = {p["name"]: p["version"] for p in locker.written_data["package"]}
+    assert locked == {"A": "1.0", "B": "1.1", "C": "1.0", "D": "1.0"}
@@ -16,6 +16,7 @@ if TYPE_CHECKING:
     from poetry.core.factory import DependencyConstraint
     from poetry.core.packages.project_package import ProjectPackage
 
+    from poetry.mixology.heuristics import Heuristic
     from poetry.mixology.result import SolverResult
     from poetry.repositories import Repository
     from tests.mixology.version_solver.conftest import Provider
@@ -47,8 +48,9 @@ def check_solver_result(
     error: str | None = None,
     tries: int | None = None,
     use_latest: list[NormalizedName] | None = None,
+    heuristic: Heuristic | None = None,
 ) -> SolverResult | None:
-    solver = VersionSolver(root, provider)
+    solver = VersionSolver(root, provider, heuristic)
     with provider.use_latest_for(use_latest or []):
         try:
             solution = solver.solve()
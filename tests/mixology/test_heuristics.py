@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import pytest
+
+from poetry.core.packages.dependency import Dependency
+
+from poetry.mixology.heuristics import ConflictActivityHeuristic
+from poetry.mixology.heuristics import Heuristic
+from poetry.mixology.heuristics import RecentConflictsHeuristic
+from poetry.mixology.heuristics import get_heuristic
+from poetry.mixology.incompatibility import Incompatibility
+from poetry.mixology.incompatibility_cause import ConflictCauseError
+from poetry.mixology.incompatibility_cause import RootCauseError
+from poetry.mixology.term import Term
+from poetry.mixology.version_solver import Preference
+
+
+def conflict(*names: str) -> Incompatibility:
+    cause = RootCauseError()
+    return Incompatibility(
+        [Term(Dependency(name, "1.0"), True) for name in names],
+        ConflictCauseError(Incompatibility([], cause), Incompatibility([], cause)),
+    )
+
+
+def choose(heuristic: Heuristic, *names: str) -> str:
+    # All dependencies have the same static priority.
+    comp_key = (Preference.DEFAULT, 0, False, -2)
+    return min(
+        (Dependency(name, "*") for name in names),
+        key=lambda dependency: heuristic.key(dependency, comp_key),
+    ).name
+
+
+def test_get_heuristic() -> None:
+    assert type(get_heuristic("default")) is Heuristic
+    assert isinstance(get_heuristic("activity"), ConflictActivityHeuristic)
+    assert isinstance(get_heuristic("recent-conflicts"), RecentConflictsHeuristic)
+
+    with pytest.raises(ValueError, match="Unknown heuristic: foo"):
+        get_heuristic("foo")
+
+
+def test_default_heuristic_uses_static_priority() -> None:
+    heuristic = Heuristic()
+    comp_key = (Preference.LOCKED, -1, False, -3)
+
+    heuristic.on_conflict(conflict("a", "b"))
+    heuristic.on_backtrack()
+
+    assert heuristic.key(Dependency("a", "*"), comp_key) == comp_key
+
+
+def test_activity_heuristic_prefers_packages_in_many_recent_conflicts() -> None:
+    heuristic = ConflictActivityHeuristic()
+    assert choose(heuristic, "a", "b", "c") == "a"
+
+    heuristic.on_conflict(conflict("b", "c"))
+    heuristic.on_conflict(conflict("c"))
+    heuristic.on_backtrack()
+    assert choose(heuristic, "a", "b", "c") == "c"
+
+    # recent conflicts count more than older ones
+    for _ in range(3):
+        heuristic.on_conflict(conflict("b"))
+        heuristic.on_backtrack()
+    assert choose(heuristic, "a", "b", "c") == "b"
+
+
+def test_activity_heuristic_rescales_activities() -> None:
+    heuristic = ConflictActivityHeuristic()
+    heuristic.on_conflict(conflict("a"))
+    for _ in range(10_000):
+        heuristic.on_backtrack()
+    heuristic.on_conflict(conflict("b"))
+
+    assert choose(heuristic, "a", "b") == "b"
+
+
+def test_activity_heuristic_keeps_preference_first() -> None:
+    heuristic = ConflictActivityHeuristic()
+    heuristic.on_conflict(conflict("a"))
+
+    key_a = heuristic.key(Dependency("a", "*"), (Preference.DEFAULT, 0, False, -2))
+    key_b = heuristic.key(
+        Dependency("b", "*"), (Preference.DIRECT_ORIGIN, 0, False, -2)
+    )
+
+    assert key_b < key_a
+
+
+def test_recent_conflicts_heuristic_prefers_packages_in_last_conflict() -> None:
+    heuristic = RecentConflictsHeuristic()
+
+    heuristic.on_conflict(conflict("a", "b"))
+    heuristic.on_backtrack()
+    heuristic.on_conflict(conflict("c"))
+    heuristic.on_backtrack()
+
+    assert choose(heuristic, "a", "b", "c") == "c"
+    assert choose(heuristic, "a", "b", "d") == "a"
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pytest
+
+from poetry.core.packages.dependency import Dependency
+from poetry.core.packages.package import Package
+
+from poetry.mixology.incompatibility import Incompatibility
+from poetry.mixology.incompatibility_cause import NoVersionsCauseError
+from poetry.mixology.partial_solution import PartialSolution
+from poetry.mixology.term import Term
+
+
+@pytest.fixture
+def cause() -> Incompatibility:
+    return Incompatibility(
+        [Term(Dependency("foo", ">=3.0"), True)], NoVersionsCauseError()
+    )
+
+
+def test_satisfier_only_considers_assignments_of_same_package(
+    cause: Incompatibility,
+) -> None:
+    solution = PartialSolution()
+    solution.derive(Dependency("foo", ">=1.0"), True, cause)
+    solution.derive(Dependency("bar", ">=1.0"), True, cause)
+    solution.derive(Dependency("foo", "<2.0"), True, cause)
+    solution.derive(Dependency("bar", "<2.0"), True, cause)
+
+    satisfier = solution.satisfier(Term(Dependency("foo", ">=1.0,<3.0"), True))
+    assert satisfier.index == 2
+    assert str(satisfier.constraint) == "<2.0"
+
+    satisfier = solution.satisfier(Term(Dependency("bar", ">=0.5"), True))
+    assert satisfier.index == 1
+
+
+def test_satisfier_after_backtrack(cause: Incompatibility) -> None:
+    solution = PartialSolution()
+    solution.derive(Dependency("foo", ">=1.0"), True, cause)
+    solution.decide(Package("bar", "1.0"))
+    solution.derive(Dependency("foo", "<2.0"), True, cause)
+
+    term = Term(Dependency("foo", ">=1.0,<3.0"), True)
+    assert solution.satisfier(term).index == 2
+
+    solution.backtrack(0)
+    solution.derive(Dependency("foo", "<2.5"), True, cause)
+
+    satisfier = solution.satisfier(term)
+    assert satisfier.index == 1
+    assert str(satisfier.constraint) == "<2.5"
+    assert solution.decisions == []
+
+    with pytest.raises(RuntimeError):
+        solution.satisfier(Term(Dependency("foo", ">=1.0,<2.0"), True))
+
+
+def test_generation_changes_with_assignments_of_package(
+    cause: Incompatibility,
+) -> None:
+    solution = PartialSolution()
+    assert solution.generation("foo") == 0
+
+    solution.derive(Dependency("foo", ">=1.0"), True, cause)
+    solution.decide(Package("bar", "1.0"))
+    foo_generation = solution.generation("foo")
+    bar_generation = solution.generation("bar")
+    assert foo_generation > 0
+    assert bar_generation > 0
+
+    solution.derive(Dependency("bar", "<2.0"), True, cause)
+    assert solution.generation("foo") == foo_generation
+    assert solution.generation("bar") > bar_generation
+
+    bar_generation = solution.generation("bar")
+    solution.backtrack(0)
+    assert solution.generation("foo") == foo_generation
+    assert solution.generation("bar") > bar_generation
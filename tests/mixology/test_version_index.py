@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from poetry.core.constraints.version import parse_constraint
+from poetry.core.packages.dependency import Dependency
+from poetry.core.packages.package import Package
+
+from poetry.mixology.version_index import VersionIndex
+from poetry.packages import DependencyPackage
+
+
+VERSIONS = [
+    "0.9",
+    "1.0.dev0",
+    "1.0rc1",
+    "1.0",
+    "1.0+local",
+    "1.0.post1",
+    "1.0.post1+local",
+    "1.0.1",
+    "1.5",
+    "1.5+local",
+    "2.0.dev0",
+    "2.0a1",
+    "2.0",
+    "2.0+local",
+    "2.0.post1",
+    "2.1",
+    "3.0rc1",
+    "3.0",
+]
+
+
+@pytest.fixture
+def packages() -> list[DependencyPackage]:
+    dependency = Dependency("foo", "*")
+    packages = [DependencyPackage(dependency, Package("foo", v)) for v in VERSIONS]
+    # The order of the provider is kept whatever it is.
+    random.Random(42).shuffle(packages)
+    return packages
+
+
+@pytest.mark.parametrize(
+    "constraint",
+    [
+        "*",
+        ">=1.0",
+        ">1.0",
+        ">=1.0,<2.0",
+        ">1.0,<=2.0",
+        "<2.0",
+        "<=2.0",
+        "<2.0a1",
+        "==1.0",
+        "==1.0+local",
+        "==1.5.*",
+        "~1.0",
+        "^1.0",
+        "!=1.5",
+        ">=1.0,!=1.5,!=2.0",
+        "<1.0 || >2.0",
+        "==0.9 || ==3.0",
+        ">=4.0",
+        "<0.1",
+    ],
+)
+def test_filter_is_the_same_as_checking_every_version(
+    packages: list[DependencyPackage], constraint: str
+) -> None:
+    version_constraint = parse_constraint(constraint)
+    index = VersionIndex(packages)
+
+    expected = [p for p in packages if version_constraint.allows(p.package.version)]
+
+    filtered = index.filter(version_constraint)
+    assert filtered.packages == expected
+
+    # filtered indexes can be filtered again
+    for other in ("*", ">=1.0", "<2.0", "!=1.5"):
+        other_constraint = parse_constraint(other)
+        assert filtered.filter(other_constraint).packages == [
+            p for p in expected if other_constraint.allows(p.package.version)
+        ]
+
+
+def test_filter_empty_index() -> None:
+    index = VersionIndex([])
+
+    assert index.filter(parse_constraint(">=1.0")).packages == []
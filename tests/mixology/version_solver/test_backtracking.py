@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
+
 from poetry.factory import Factory
+from poetry.mixology.heuristics import HEURISTICS
+from poetry.mixology.heuristics import get_heuristic
 from tests.mixology.helpers import add_to_repo
 from tests.mixology.helpers import check_solver_result
 
@@ -70,6 +74,39 @@ def test_backjumps_after_partial_satisfier(
     check_solver_result(root, provider, {"c": "1.0.0", "y": "2.0.0"}, tries=4)
 
 
+@pytest.mark.parametrize("heuristic", list(HEURISTICS))
+def test_backjumps_with_heuristic(
+    root: ProjectPackage, provider: Provider, repo: Repository, heuristic: str
+) -> None:
+    # The heuristic may change the number of attempts, but not the solution.
+    root.add_dependency(Factory.create_dependency("c", "*"))
+    root.add_dependency(Factory.create_dependency("y", "^2.0.0"))
+    root.add_dependency(Factory.create_dependency("z", "*"))
+
+    add_to_repo(repo, "a", "1.0.0", deps={"x": ">=1.0.0"})
+    add_to_repo(repo, "b", "1.0.0", deps={"x": "<2.0.0"})
+
+    add_to_repo(repo, "c", "1.0.0")
+    add_to_repo(repo, "c", "2.0.0", deps={"a": "*", "b": "*"})
+
+    add_to_repo(repo, "x", "0.0.0")
+    add_to_repo(repo, "x", "1.0.0", deps={"y": "1.0.0"})
+    add_to_repo(repo, "x", "2.0.0")
+
+    add_to_repo(repo, "y", "1.0.0")
+    add_to_repo(repo, "y", "2.0.0")
+
+    add_to_repo(repo, "z", "1.0.0")
+    add_to_repo(repo, "z", "2.0.0", deps={"c": "2.0.0"})
+
+    check_solver_result(
+        root,
+        provider,
+        {"c": "1.0.0", "y": "2.0.0", "z": "1.0.0"},
+        heuristic=get_heuristic(heuristic),
+    )
+
+
 def test_rolls_back_leaf_versions_first(
     root: ProjectPackage, provider: Provider, repo: Repository
 ) -> None:
@@ -4,13 +4,21 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from poetry.core.packages.dependency import Dependency
+
 from poetry.factory import Factory
+from poetry.mixology.incompatibility import Incompatibility
+from poetry.mixology.incompatibility_cause import ConflictCauseError
+from poetry.mixology.incompatibility_cause import NoVersionsCauseError
+from poetry.mixology.term import Term
+from poetry.mixology.version_solver import VersionSolver
 from tests.mixology.helpers import add_to_repo
 from tests.mixology.helpers import check_solver_result
 
 
 if TYPE_CHECKING:
     from poetry.core.packages.project_package import ProjectPackage
+    from pytest_mock import MockerFixture
 
     from poetry.repositories import Repository
     from tests.mixology.version_solver.conftest import Provider
@@ -130,3 +138,38 @@ def test_yanked_release(
         result = {"foo": expected}
         error = None
     check_solver_result(root, provider, result, error)
+
+
+def test_propagate_skips_incompatibilities_with_unchanged_watched_terms(
+    root: ProjectPackage, provider: Provider, mocker: MockerFixture
+) -> None:
+    solver = VersionSolver(root, provider)
+    foo, bar, baz = (
+        Term(Dependency(name, "*"), True) for name in ("foo", "bar", "baz")
+    )
+    # e.g. learned by conflict resolution
+    incompatibility = Incompatibility(
+        [foo, bar, baz],
+        ConflictCauseError(
+            Incompatibility([foo, bar], NoVersionsCauseError()),
+            Incompatibility([baz], NoVersionsCauseError()),
+        ),
+    )
+    solver._add_incompatibility(incompatibility)
+    spy = mocker.spy(solver, "_propagate_incompatibility")
+
+    # foo and bar are inconclusive, so that their terms are watched.
+    solver._propagate("baz")
+    assert spy.call_count == 1
+    assert solver._watched_terms[incompatibility][::2] == ("foo", "bar")
+
+    # A change of baz cannot make the incompatibility conclusive.
+    solver.solution.derive(Dependency("baz", ">=1.0"), True, incompatibility)
+    solver._propagate("baz")
+    assert spy.call_count == 1
+
+    # A change of a watched term requires to examine the incompatibility again.
+    solver.solution.derive(Dependency("foo", ">=1.0"), True, incompatibility)
+    solver._propagate("foo")
+    assert spy.call_count == 2
+    assert spy.spy_return == "bar"
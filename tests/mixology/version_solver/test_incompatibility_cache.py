@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from poetry.factory import Factory
+from poetry.mixology.incompatibility_cache import IncompatibilityCache
+from poetry.mixology.incompatibility_cause import ConflictCauseError
+from tests.mixology.helpers import add_to_repo
+from tests.mixology.helpers import check_solver_result
+
+
+if TYPE_CHECKING:
+    from poetry.core.packages.project_package import ProjectPackage
+
+    from poetry.repositories import Repository
+    from tests.conftest import Config
+    from tests.mixology.version_solver.conftest import Provider
+
+
+@pytest.fixture
+def conflict_cache(config: Config) -> None:
+    config.merge({"solver": {"conflict-cache": True}})
+
+
+@pytest.fixture
+def backjumping_repo(root: ProjectPackage, repo: Repository) -> Repository:
+    root.add_dependency(Factory.create_dependency("c", "*"))
+    root.add_dependency(Factory.create_dependency("y", "^2.0.0"))
+
+    add_to_repo(repo, "a", "1.0.0", deps={"x": ">=1.0.0"})
+    add_to_repo(repo, "b", "1.0.0", deps={"x": "<2.0.0"})
+
+    add_to_repo(repo, "c", "1.0.0")
+    add_to_repo(repo, "c", "2.0.0", deps={"a": "*", "b": "*"})
+
+    add_to_repo(repo, "x", "0.0.0")
+    add_to_repo(repo, "x", "1.0.0", deps={"y": "1.0.0"})
+    add_to_repo(repo, "x", "2.0.0")
+
+    add_to_repo(repo, "y", "1.0.0")
+    add_to_repo(repo, "y", "2.0.0")
+
+    return repo
+
+
+@pytest.mark.usefixtures("conflict_cache")
+def test_learned_incompatibilities_are_reused(
+    root: ProjectPackage, provider: Provider, backjumping_repo: Repository
+) -> None:
+    result = {"c": "1.0.0", "y": "2.0.0"}
+    check_solver_result(root, provider, result, tries=4)
+    check_solver_result(root, provider, result, tries=1)
+
+
+@pytest.mark.usefixtures("conflict_cache")
+def test_learned_incompatibilities_are_not_reused_if_versions_changed(
+    root: ProjectPackage, provider: Provider, backjumping_repo: Repository
+) -> None:
+    check_solver_result(root, provider, {"c": "1.0.0", "y": "2.0.0"}, tries=4)
+
+    add_to_repo(backjumping_repo, "x", "1.5.0")
+
+    check_solver_result(
+        root,
+        provider,
+        {"a": "1.0.0", "b": "1.0.0", "c": "2.0.0", "x": "1.5.0", "y": "2.0.0"},
+    )
+
+
+@pytest.mark.usefixtures("conflict_cache")
+def test_learned_incompatibilities_are_not_reused_for_other_projects(
+    root: ProjectPackage, provider: Provider, backjumping_repo: Repository
+) -> None:
+    check_solver_result(root, provider, {"c": "1.0.0", "y": "2.0.0"}, tries=4)
+
+    root.add_dependency(Factory.create_dependency("x", "*"))
+
+    cache = IncompatibilityCache(root, provider)
+    assert cache._get_entries() == {}
+
+
+def test_learned_incompatibilities_are_not_stored_by_default(
+    root: ProjectPackage, provider: Provider, backjumping_repo: Repository
+) -> None:
+    check_solver_result(root, provider, {"c": "1.0.0", "y": "2.0.0"}, tries=4)
+    check_solver_result(root, provider, {"c": "1.0.0", "y": "2.0.0"}, tries=4)
+
+    cache = IncompatibilityCache(root, provider)
+    assert not cache.is_enabled()
+    assert cache._get_entries() == {}
+
+
+@pytest.mark.usefixtures("conflict_cache")
+def test_learned_incompatibilities_round_trip(
+    root: ProjectPackage, provider: Provider, backjumping_repo: Repository
+) -> None:
+    check_solver_result(root, provider, {"c": "1.0.0", "y": "2.0.0"}, tries=4)
+
+    cache = IncompatibilityCache(root, provider)
+    incompatibilities = cache.load("c")
+    assert [str(i) for i in incompatibilities] == ["c (2.0.0) requires y (1.0.0)"]
+    assert isinstance(incompatibilities[0].cause, ConflictCauseError)
+    # each incompatibility is only returned once
+    assert cache.load("c") == []
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import shutil
+import threading
 
 from pathlib import Path
 from subprocess import CalledProcessError
@@ -11,6 +12,7 @@ import pytest
 
 from cleo.io.null_io import NullIO
 from packaging.utils import canonicalize_name
+from poetry.core.constraints.version import Version
 from poetry.core.packages.dependency import Dependency
 from poetry.core.packages.directory_dependency import DirectoryDependency
 from poetry.core.packages.file_dependency import FileDependency
@@ -25,6 +27,7 @@ from poetry.packages import DependencyPackage
 from poetry.puzzle.provider import IncompatibleConstraintsError
 from poetry.puzzle.provider import Provider
 from poetry.repositories.exceptions import PackageNotFoundError
+from poetry.repositories.legacy_repository import LegacyRepository
 from poetry.repositories.repository import Repository
 from poetry.repositories.repository_pool import Priority
 from poetry.repositories.repository_pool import RepositoryPool
@@ -34,10 +37,13 @@ from tests.helpers import get_dependency
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
     from pathlib import Path
 
     from pytest_mock import MockerFixture
 
+    from poetry.config.config import Config
     from tests.types import FixtureDirGetter
 
 
@@ -72,6 +78,22 @@ def provider(root: ProjectPackage, pool: RepositoryPool) -> Provider:
     return Provider(root, pool, NullIO())
 
 
+def test_is_plain_resolution(provider: Provider) -> None:
+    assert provider.is_plain_resolution()
+
+    with provider.use_environment(BaseMockEnv()):
+        assert not provider.is_plain_resolution()
+
+    with provider.use_pinned_for([canonicalize_name("foo")]):
+        assert not provider.is_plain_resolution()
+
+    provider.set_overrides({Package("foo", "1"): {"bar": Dependency("bar", "1")}})
+    assert not provider.is_plain_resolution()
+
+    provider.set_overrides({})
+    assert provider.is_plain_resolution()
+
+
 @pytest.mark.parametrize(
     "dependency, expected",
     [
@@ -889,3 +911,220 @@ def test_source_dependency_is_not_satisfied_by_incompatible_direct_origin(
     dep.source_name = repository.name
 
     assert provider.search_for(dep) == [repo_package]
+
+
+def test_complete_package_prefetches_dependencies(
+    root: ProjectPackage,
+    repository: Repository,
+    pool: RepositoryPool,
+    config: Config,
+    mocker: MockerFixture,
+) -> None:
+    config.merge({"solver": {"prefetch-workers": 2}})
+
+    package_a = Package("a", "1.0")
+    package_a.add_dependency(Factory.create_dependency("b", ">=1"))
+    package_a.add_dependency(Factory.create_dependency("c", "<2"))
+    repository.add_package(package_a)
+    repository.add_package(Package("b", "1.0"))
+    repository.add_package(Package("b", "2.0"))
+    repository.add_package(Package("c", "1.0"))
+    repository.add_package(Package("c", "2.0"))
+
+    provider = Provider(root, pool, NullIO())
+    fetched = []
+    original_package = pool.package
+
+    def package(name: str, version: Version, repository_name: str | None) -> Package:
+        fetched.append((name, version.text))
+        return original_package(name, version, repository_name=repository_name)
+
+    mocker.patch.object(pool, "package", side_effect=package, autospec=False)
+    with provider.use_prefetching():
+        provider.complete_package(
+            DependencyPackage(package_a.to_dependency(), package_a)
+        )
+        # wait for the prefetching to finish
+        assert provider._prefetch_executor is not None
+        provider._prefetch_executor.shutdown(wait=True)
+
+    assert sorted(fetched) == [("a", "1.0"), ("b", "2.0"), ("c", "1.0")]
+
+
+def test_complete_package_does_not_prefetch_if_disabled(
+    root: ProjectPackage,
+    repository: Repository,
+    pool: RepositoryPool,
+    config: Config,
+    mocker: MockerFixture,
+) -> None:
+    config.merge({"solver": {"prefetch-workers": 0}})
+
+    package_a = Package("a", "1.0")
+    package_a.add_dependency(Factory.create_dependency("b", ">=1"))
+    repository.add_package(package_a)
+    repository.add_package(Package("b", "1.0"))
+
+    provider = Provider(root, pool, NullIO())
+    spy = mocker.spy(pool, "package")
+    with provider.use_prefetching():
+        provider.complete_package(
+            DependencyPackage(package_a.to_dependency(), package_a)
+        )
+
+    assert [c.args[0] for c in spy.call_args_list] == ["a"]
+
+
+def test_use_prefetching_prefetches_metadata_of_locked_packages(
+    root: ProjectPackage,
+    config: Config,
+    mocker: MockerFixture,
+) -> None:
+    config.merge({"solver": {"prefetch-workers": 2, "page-prefetch-workers": 0}})
+    root.add_dependency(
+        Factory.create_dependency("b", {"version": "*", "source": "bar"})
+    )
+    pool = RepositoryPool(
+        [
+            LegacyRepository("foo", "https://foo.com/simple", config=config),
+            LegacyRepository("bar", "https://bar.com/simple", config=config),
+            LegacyRepository("PyPI", "https://pypi.org/simple", config=config),
+        ]
+    )
+
+    prefetched: dict[str, list[tuple[str, str]]] = {}
+
+    def prefetch_release_info(
+        repository: LegacyRepository,
+        releases: Iterable[tuple[str, Version]],
+        callback: Callable[[str, Version], None] | None = None,
+    ) -> None:
+        prefetched[repository.name] = [
+            (name, version.text) for name, version in releases
+        ]
+
+    mocker.patch.object(
+        LegacyRepository,
+        "prefetch_release_info",
+        side_effect=prefetch_release_info,
+        autospec=True,
+    )
+
+    def legacy_package(name: str, version: str, source: str) -> Package:
+        return Package(
+            name,
+            version,
+            source_type="legacy",
+            source_url=f"https://{source}.com/simple",
+            source_reference=source,
+        )
+
+    provider = Provider(
+        root,
+        pool,
+        NullIO(),
+        locked=[
+            Package("a", "1.0"),
+            legacy_package("b", "2.0", "foo"),
+            legacy_package("c", "3.0", "foo"),
+            legacy_package("d", "4.0", "baz"),
+        ],
+    )
+    with provider.use_prefetching():
+        # wait for the prefetching to finish
+        assert provider._prefetch_executor is not None
+        provider._prefetch_executor.shutdown(wait=True)
+
+    # The repository is taken from the dependency or else from the lock file.
+    # Packages from unknown repositories are not prefetched.
+    assert prefetched == {
+        "PyPI": [("a", "1.0")],
+        "foo": [("c", "3.0")],
+        "bar": [("b", "2.0")],
+    }
+
+
+def test_use_prefetching_does_not_wait_for_the_whole_batch_of_locked_packages(
+    root: ProjectPackage,
+    config: Config,
+    mocker: MockerFixture,
+) -> None:
+    config.merge({"solver": {"prefetch-workers": 2, "page-prefetch-workers": 0}})
+    pool = RepositoryPool(
+        [LegacyRepository("PyPI", "https://pypi.org/simple", config=config)]
+    )
+    slow_release_done = threading.Event()
+
+    def prefetch_release_info(
+        repository: LegacyRepository,
+        releases: Iterable[tuple[str, Version]],
+        callback: Callable[[str, Version], None],
+    ) -> None:
+        fast, slow = releases
+        callback(*fast)
+        assert slow_release_done.wait(timeout=5)
+        callback(*slow)
+
+    mocker.patch.object(
+        LegacyRepository,
+        "prefetch_release_info",
+        side_effect=prefetch_release_info,
+        autospec=True,
+    )
+    package = mocker.patch.object(pool, "package")
+    provider = Provider(
+        root, pool, NullIO(), locked=[Package("a", "1.0"), Package("b", "2.0")]
+    )
+    with provider.use_prefetching():
+        # The release info of "a" is ready while "b" is still being fetched.
+        provider._get_package_from_pool("a", Version.parse("1.0"))
+        assert not provider._prefetching["b", Version.parse("2.0"), None].is_set()
+
+        slow_release_done.set()
+
+    package.assert_called_once_with("a", Version.parse("1.0"), repository_name=None)
+
+
+def test_use_prefetching_prefetches_pages_of_known_packages(
+    root: ProjectPackage,
+    pool: RepositoryPool,
+    config: Config,
+    mocker: MockerFixture,
+) -> None:
+    config.merge({"solver": {"prefetch-workers": 0, "page-prefetch-workers": 2}})
+    root.add_dependency(Factory.create_dependency("a", ">=1"))
+    root.add_dependency(
+        Factory.create_dependency("b", {"version": "*", "source": "foo"})
+    )
+    root.add_dependency(Factory.create_dependency("c", {"path": "c"}))
+
+    prefetch = mocker.patch(
+        "poetry.repositories.page_prefetcher.PagePrefetcher.prefetch"
+    )
+    provider = Provider(root, pool, NullIO(), locked=[Package("d", "1.0")])
+    with provider.use_prefetching():
+        provider.prefetch_pages([Factory.create_dependency("e", "*")])
+
+    assert prefetch.call_args_list == [
+        mocker.call("a", None),
+        mocker.call("b", "foo"),
+        mocker.call("d", None),
+        mocker.call("e", None),
+    ]
+
+
+def test_use_prefetching_does_not_prefetch_pages_if_disabled(
+    root: ProjectPackage,
+    pool: RepositoryPool,
+    config: Config,
+    mocker: MockerFixture,
+) -> None:
+    config.merge({"solver": {"page-prefetch-workers": 0}})
+    root.add_dependency(Factory.create_dependency("a", ">=1"))
+
+    prefetcher = mocker.patch("poetry.repositories.page_prefetcher.PagePrefetcher")
+    provider = Provider(root, pool, NullIO())
+    with provider.use_prefetching():
+        pass
+
+    assert not prefetcher.called
@@ -3,7 +3,9 @@ from __future__ import annotations
 import re
 import shutil
 import sys
+import threading
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
@@ -20,6 +22,7 @@ from poetry.core.packages.package import Package
 from poetry.core.packages.vcs_dependency import VCSDependency
 from poetry.core.version.markers import parse_marker
 
+from poetry.console.exceptions import PoetryRuntimeError
 from poetry.factory import Factory
 from poetry.installation.operations import Update
 from poetry.packages import DependencyPackage
@@ -47,6 +50,7 @@ if TYPE_CHECKING:
     from poetry.puzzle.transaction import Transaction
     from poetry.repositories.legacy_repository import LegacyRepository
     from poetry.repositories.pypi_repository import PyPiRepository
+    from tests.conftest import Config
     from tests.types import FixtureDirGetter
     from tests.types import PackageFactory
 
@@ -1570,6 +1574,204 @@ def test_solver_duplicate_dependencies_different_constraints(
     )
 
 
+@pytest.mark.skipif(
+    sys.platform != "linux",
+    reason="Overrides are only solved in processes on Linux",
+)
+def test_solver_solves_overrides_in_processes(
+    package: ProjectPackage,
+    repo: Repository,
+    pool: RepositoryPool,
+    io: NullIO,
+    config: Config,
+    mocker: MockerFixture,
+) -> None:
+    package.add_dependency(Factory.create_dependency("A", "*"))
+
+    package_a = get_package("A", "1.0")
+    package_a.add_dependency(
+        Factory.create_dependency("B", {"version": "^1.0", "python": "<3.8"})
+    )
+    package_a.add_dependency(
+        Factory.create_dependency("B", {"version": "^2.0", "python": ">=3.8,<3.12"})
+    )
+    package_a.add_dependency(
+        Factory.create_dependency("B", {"version": "^3.0", "python": ">=3.12"})
+    )
+
+    package_b10 = get_package("B", "1.0")
+    package_b20 = get_package("B", "2.0")
+    package_b30 = get_package("B", "3.0")
+
+    repo.add_package(package_a)
+    repo.add_package(package_b10)
+    repo.add_package(package_b20)
+    repo.add_package(package_b30)
+
+    expected = [
+        {"job": "install", "package": package_b10},
+        {"job": "install", "package": package_b20},
+        {"job": "install", "package": package_b30},
+        {"job": "install", "package": package_a},
+    ]
+
+    serial_solver = Solver(package, pool, [], [], io)
+    serial_packages = serial_solver.solve().get_solved_packages()
+
+    config.merge({"solver": {"max-workers": 2}})
+    spy = mocker.spy(Solver, "_solve_overrides_in_processes")
+    solver = Solver(package, pool, [], [], io)
+    transaction = solver.solve()
+
+    check_solver_result(transaction, expected)
+    assert spy.call_count == 1
+    assert len(spy.spy_return) == 3
+    assert None not in spy.spy_return
+    assert solver._overrides == serial_solver._overrides
+    assert {
+        package: info.markers
+        for package, info in transaction.get_solved_packages().items()
+    } == {package: info.markers for package, info in serial_packages.items()}
+
+
+@pytest.mark.skipif(
+    sys.platform != "linux",
+    reason="Overrides are only solved in processes on Linux",
+)
+def test_solver_stops_threads_before_solving_overrides_in_processes(
+    package: ProjectPackage,
+    repo: Repository,
+    pool: RepositoryPool,
+    config: Config,
+    mocker: MockerFixture,
+) -> None:
+    package.add_dependency(Factory.create_dependency("A", "*"))
+
+    package_a = get_package("A", "1.0")
+    package_a.add_dependency(
+        Factory.create_dependency("B", {"version": "^1.0", "python": "<3.8"})
+    )
+    package_a.add_dependency(
+        Factory.create_dependency("B", {"version": "^2.0", "python": ">=3.8"})
+    )
+
+    repo.add_package(package_a)
+    repo.add_package(get_package("B", "1.0"))
+    repo.add_package(get_package("B", "2.0"))
+
+    config.merge(
+        {
+            "solver": {
+                "max-workers": 2,
+                "prefetch-workers": 2,
+                "page-prefetch-workers": 2,
+            }
+        }
+    )
+    threads_at_fork: list[str] = []
+
+    def process_pool_executor(*args: Any, **kwargs: Any) -> ProcessPoolExecutor:
+        threads_at_fork.extend(thread.name for thread in threading.enumerate())
+        assert kwargs["initargs"] == (solver,)
+        return ProcessPoolExecutor(*args, **kwargs)
+
+    mocker.patch(
+        "poetry.puzzle.solver.ProcessPoolExecutor", side_effect=process_pool_executor
+    )
+    # The progress indicator is only shown with decorated output.
+    io = BufferedIO(decorated=True)
+    solver = Solver(package, pool, [], [], io)
+    with solver._progress():
+        indicator = solver._indicator
+        assert indicator is not None
+        with solver._suspend_threads():
+            assert indicator._auto_thread is not None
+            assert not indicator._auto_thread.is_alive()
+        assert indicator._auto_thread.is_alive()
+
+    transaction = solver.solve()
+
+    check_solver_result(
+        transaction,
+        [
+            {"job": "install", "package": get_package("B", "1.0")},
+            {"job": "install", "package": get_package("B", "2.0")},
+            {"job": "install", "package": package_a},
+        ],
+    )
+    assert threads_at_fork
+    assert not [
+        name
+        for name in threads_at_fork
+        if name.startswith("poetry-") or name.endswith("(_spin)")
+    ]
+
+
+def test_solver_solves_overrides_sequentially_if_not_on_linux(
+    package: ProjectPackage,
+    repo: Repository,
+    pool: RepositoryPool,
+    io: NullIO,
+    config: Config,
+    mocker: MockerFixture,
+) -> None:
+    package.add_dependency(Factory.create_dependency("A", "*"))
+
+    package_a = get_package("A", "1.0")
+    package_a.add_dependency(
+        Factory.create_dependency("B", {"version": "^1.0", "python": "<3.8"})
+    )
+    package_a.add_dependency(
+        Factory.create_dependency("B", {"version": "^2.0", "python": ">=3.8"})
+    )
+
+    package_b10 = get_package("B", "1.0")
+    package_b20 = get_package("B", "2.0")
+
+    repo.add_package(package_a)
+    repo.add_package(package_b10)
+    repo.add_package(package_b20)
+
+    config.merge({"solver": {"max-workers": 2}})
+    mocker.patch("sys.platform", "darwin")
+    spy = mocker.spy(Solver, "_solve_overrides_in_processes")
+    solver = Solver(package, pool, [], [], io)
+    transaction = solver.solve()
+
+    check_solver_result(
+        transaction,
+        [
+            {"job": "install", "package": package_b10},
+            {"job": "install", "package": package_b20},
+            {"job": "install", "package": package_a},
+        ],
+    )
+    assert spy.call_count == 0
+
+
+@pytest.mark.parametrize("from_environment", [False, True])
+def test_solver_invalid_heuristic(
+    package: ProjectPackage,
+    pool: RepositoryPool,
+    io: NullIO,
+    config: Config,
+    monkeypatch: pytest.MonkeyPatch,
+    from_environment: bool,
+) -> None:
+    if from_environment:
+        monkeypatch.setenv("POETRY_SOLVER_HEURISTIC", "foo")
+    else:
+        config.merge({"solver": {"heuristic": "foo"}})
+
+    with pytest.raises(PoetryRuntimeError) as e:
+        Solver(package, pool, [], [], io)
+
+    assert e.value.get_text(strip=True).split("\n\n") == [
+        "Invalid value for the solver.heuristic setting: foo",
+        "Use one of default, activity, recent-conflicts.",
+    ]
+
+
 def test_solver_duplicate_dependencies_different_constraints_same_requirements(
     solver: Solver, repo: Repository, package: ProjectPackage
 ) -> None:
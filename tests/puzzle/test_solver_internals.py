@@ -17,6 +17,7 @@ from poetry.packages.transitive_package_info import TransitivePackageInfo
 from poetry.puzzle.solver import PackageNode
 from poetry.puzzle.solver import Solver
 from poetry.puzzle.solver import depth_first_search
+from poetry.puzzle.solver import merge_feature_packages
 from poetry.puzzle.solver import merge_override_packages
 
 
@@ -363,6 +364,67 @@ def test_propagate_markers_with_cycle(package: ProjectPackage, solver: Solver) -
     }
 
 
+def test_propagate_markers_with_long_cycle(
+    package: ProjectPackage, solver: Solver
+) -> None:
+    a = Package("a", "1")
+    b = Package("b", "1")
+    c = Package("c", "1")
+    d = Package("d", "1")
+    package.add_dependency(dep("a", 'sys_platform == "win32"'))
+    package.add_dependency(dep("c", 'sys_platform == "linux"'))
+    a.add_dependency(dep("b", 'python_version >= "3.9"'))
+    b.add_dependency(dep("c", 'python_version >= "3.10"'))
+    c.add_dependency(dep("a", 'implementation_name == "cpython"'))
+    c.add_dependency(dep("d"))
+
+    packages = [package, a, b, c, d]
+    result = solver._aggregate_solved_packages(packages)
+
+    assert len(result) == 5
+    assert tm(result[a]) == {
+        "main": (
+            '(sys_platform == "linux" or sys_platform == "win32")'
+            ' and implementation_name == "cpython" or sys_platform == "win32"'
+        )
+    }
+    assert tm(result[b]) == {
+        "main": (
+            '(sys_platform == "linux" and implementation_name == "cpython"'
+            ' or sys_platform == "win32") and python_version >= "3.9"'
+        )
+    }
+    assert tm(result[c]) == {
+        "main": (
+            '(sys_platform == "linux" or sys_platform == "win32")'
+            ' and python_version >= "3.10" or sys_platform == "linux"'
+        )
+    }
+    assert tm(result[d]) == tm(result[c])
+
+
+def test_merge_feature_packages() -> None:
+    a = Package("a", "1")
+    a.add_dependency(dep("b"))
+    a_foo = Package("a", "1", features=["foo"])
+    a_foo.add_dependency(dep("a"))
+    a_foo.add_dependency(dep("b"))
+    a_foo.add_dependency(dep("c", 'sys_platform == "win32"'))
+    a_bar = Package("a", "1", features=["bar"])
+    a_bar.add_dependency(dep("c", 'sys_platform == "win32"'))
+    a_bar.add_dependency(dep("c", 'sys_platform == "linux"'))
+    other_a = Package("a", "2", features=["foo"])
+    other_a.add_dependency(dep("d"))
+
+    merge_feature_packages([a_foo, a, other_a, a_bar])
+
+    assert [(d.name, str(d.marker)) for d in a.requires] == [
+        ("b", ""),
+        ("c", 'sys_platform == "win32"'),
+        ("c", 'sys_platform == "linux"'),
+    ]
+
+
 def test_merge_override_packages_restricted(package: ProjectPackage) -> None:
     """Markers of dependencies should be intersected with override markers."""
     a = Package("a", "1")
@@ -16,6 +16,7 @@ from poetry.repositories.link_sources.base import LinkSource
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from collections.abc import Iterator
 
     from pytest_mock import MockerFixture
 
@@ -99,3 +100,75 @@ def test_links_for_version(
         set(link_source.links_for_version(canonicalize_name("demo"), version))
         == expected
     )
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://example.org/demo-0.1.0.tar.gz", "demo-0.1.0.tar.gz"),
+        ("https://example.org/demo-0.1.0.tar.gz#sha256=abcd", "demo-0.1.0.tar.gz"),
+        ("https://example.org/demo-0.1.0.tar.gz?a=b#sha256=abcd", "demo-0.1.0.tar.gz"),
+        ("../../packages/demo-0.1.0.tar.gz", "demo-0.1.0.tar.gz"),
+        ("demo-0.1.0.tar.gz", "demo-0.1.0.tar.gz"),
+        ("https://example.org/demo%2B0.1.0.tar.gz", "demo+0.1.0.tar.gz"),
+        ("https://example.org/demo/", "demo"),
+    ],
+)
+def test_filename(url: str, expected: str) -> None:
+    assert LinkSource._filename(url) == expected
+    if "://" in url:
+        assert LinkSource._filename(url) == Link(url).filename
+
+
+class FileLinkSource(LinkSource):
+    def __init__(self, url: str, filenames: list[str]) -> None:
+        super().__init__(url)
+        self.filenames = filenames
+        self.created: list[str] = []
+
+    def _files(self) -> Iterator[tuple[str, str]]:
+        for filename in self.filenames:
+            yield filename, filename
+
+    def _link(self, file: str) -> Link:
+        self.created.append(file)
+        return Link(f"{self.url}/{file}")
+
+
+def test_links_are_created_lazily() -> None:
+    link_source = FileLinkSource(
+        "https://example.org",
+        [
+            "Demo-0.1.0.tar.gz",
+            "demo-0.1.0-py3-none-any.whl",
+            "demo-0.1.1.tar.gz",
+            "demo-0.1.1.exe",  # unsupported format
+            "demo-0.1.2_invalid.tar.gz",  # invalid version
+            "other-1.0.zip",
+        ],
+    )
+    demo = canonicalize_name("demo")
+
+    assert set(link_source.versions(demo)) == {
+        Version.parse("0.1.0"),
+        Version.parse("0.1.1"),
+    }
+    assert list(link_source.versions(canonicalize_name("other"))) == [
+        Version.parse("1.0")
+    ]
+    assert link_source.created == []
+
+    links = list(link_source.links_for_version(demo, Version.parse("0.1.0")))
+    assert [link.filename for link in links] == [
+        "Demo-0.1.0.tar.gz",
+        "demo-0.1.0-py3-none-any.whl",
+    ]
+    assert link_source.created == ["Demo-0.1.0.tar.gz", "demo-0.1.0-py3-none-any.whl"]
+
+    # links are only created once
+    assert list(link_source.links_for_version(demo, Version.parse("0.1.0"))) == links
+    assert list(link_source.links_for_version(demo, Version.parse("0.2.0"))) == []
+    assert len(link_source.created) == 2
+
+    assert len(list(link_source.links)) == 4
+    assert len(link_source.created) == 4
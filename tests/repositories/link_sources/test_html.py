@@ -167,3 +167,21 @@ def test_base_url(
     page = HTMLPage("https://example.org", content)
     link = next(iter(page.links))
     assert link.url == expected
+
+
+def test_parse_in_chunks(html_page_content: HTMLPageGetter) -> None:
+    anchors = "".join(
+        f'<a href="https://example.org/demo-0.{i}.tar.gz" data-yanked>'
+        f"demo-0.{i}.tar.gz</a>"
+        for i in range(10)
+    )
+    content = html_page_content(anchors)
+    chunks = [content[i : i + 7] for i in range(0, len(content), 7)]
+
+    page = HTMLPage("https://example.org", iter(chunks))
+
+    assert [link.url for link in page.links] == [
+        link.url for link in HTMLPage("https://example.org", content).links
+    ]
+    assert len(list(page.links)) == 10
+    assert all(link.yanked for link in page.links)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
 import shutil
+import threading
+import time
 
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -11,18 +14,29 @@ from zipfile import ZipFile
 import pytest
 
 from packaging.metadata import parse_email
+from packaging.utils import canonicalize_name
+from poetry.core.constraints.version import Version
 from poetry.core.packages.utils.link import Link
 
 from poetry.inspection.info import PackageInfoError
 from poetry.inspection.lazy_wheel import HTTPRangeRequestUnsupportedError
 from poetry.repositories.http_repository import HTTPRepository
+from poetry.repositories.legacy_repository import LegacyRepository
+from poetry.repositories.link_sources.json import SimpleJsonPage
+from poetry.utils.cache import FileCache
+from poetry.utils.cache import SQLiteCache
 from poetry.utils.helpers import HTTPRangeRequestSupportedError
+from poetry.utils.helpers import download_file
 
 
 if TYPE_CHECKING:
+    import httpretty
+
     from packaging.utils import NormalizedName
-    from poetry.core.constraints.version import Version
     from pytest_mock import MockerFixture
+    from pytest_mock import MockType
+
+    from poetry.config.config import Config
 
 
 class MockRepository(HTTPRepository):
@@ -85,6 +99,7 @@ def test_get_info_from_wheel(
             session=repo.session,
             raise_accepts_ranges=lazy_wheel,
             max_retries=0,
+            hash_names=(),
         )
         if lazy_wheel:
             assert repo._supports_range_requests[domain] is False
@@ -177,6 +192,239 @@ def test_get_info_from_wheel_state_sequence(mocker: MockerFixture) -> None:
     assert mock_download.call_count == 4
 
 
+@pytest.mark.parametrize("supported", [False, True])
+def test_get_info_from_wheel_remembers_range_request_support(
+    mocker: MockerFixture, supported: bool
+) -> None:
+    mock_metadata_from_wheel_url = mocker.patch(
+        "poetry.repositories.http_repository.metadata_from_wheel_url"
+    )
+    if not supported:
+        mock_metadata_from_wheel_url.side_effect = HTTPRangeRequestUnsupportedError
+    mock_download = mocker.patch("poetry.repositories.http_repository.download_file")
+    link = Link("https://foo.com/poetry_core-1.5.0-py3-none-any.whl")
+
+    with contextlib.suppress(PackageInfoError):
+        MockRepository()._get_info_from_wheel(link)
+    assert mock_metadata_from_wheel_url.call_count == 1
+
+    # another run knows from the first request on
+    # whether the domain supports range requests
+    repo = MockRepository()
+    with contextlib.suppress(PackageInfoError):
+        repo._get_info_from_wheel(link)
+
+    assert repo._supports_range_requests == {"foo.com": supported}
+    if supported:
+        assert mock_metadata_from_wheel_url.call_count == 2
+        mock_download.assert_not_called()
+    else:
+        assert mock_metadata_from_wheel_url.call_count == 1
+        assert mock_download.call_count == 2
+        assert mock_download.call_args[1]["raise_accepts_ranges"] is True
+
+
+def test_get_info_from_wheel_forgets_range_request_support_after_ttl(
+    mocker: MockerFixture,
+) -> None:
+    MockRepository()._set_supports_range_requests("foo.com", True)
+    assert MockRepository()._get_supports_range_requests("foo.com") is True
+
+    now = time.time()
+    mocker.patch(
+        "time.time",
+        return_value=now + MockRepository.RANGE_REQUESTS_CACHE_MINUTES * 60 + 1,
+    )
+
+    assert MockRepository()._get_supports_range_requests("foo.com") is None
+
+
+def test_get_info_from_wheel_invalidates_remembered_range_request_support(
+    mocker: MockerFixture,
+) -> None:
+    mock_metadata_from_wheel_url = mocker.patch(
+        "poetry.repositories.http_repository.metadata_from_wheel_url",
+        side_effect=HTTPRangeRequestUnsupportedError,
+    )
+    mock_download = mocker.patch("poetry.repositories.http_repository.download_file")
+    link = Link("https://foo.com/poetry_core-1.5.0-py3-none-any.whl")
+    MockRepository()._set_supports_range_requests("foo.com", True)
+
+    repo = MockRepository()
+    with contextlib.suppress(PackageInfoError):
+        repo._get_info_from_wheel(link)
+
+    # The range request failed, so the domain might not support them anymore.
+    assert mock_metadata_from_wheel_url.call_count == 1
+    assert mock_download.call_args[1]["raise_accepts_ranges"] is False
+    assert repo._supports_range_requests == {"foo.com": False}
+    assert MockRepository()._get_supports_range_requests("foo.com") is False
+
+    # However, if range requests have been successful in this run,
+    # a failure does not change anything.
+    repo = MockRepository()
+    repo._set_supports_range_requests("foo.com", True)
+    with contextlib.suppress(PackageInfoError):
+        repo._get_info_from_wheel(link)
+
+    assert repo._supports_range_requests == {"foo.com": True}
+    assert MockRepository()._get_supports_range_requests("foo.com") is True
+
+
+def test_range_request_support_is_not_remembered_without_cache() -> None:
+    repo = MockRepository()
+    repo._disable_cache = True
+    repo._set_supports_range_requests("foo.com", True)
+
+    assert MockRepository()._get_supports_range_requests("foo.com") is None
+
+
+METADATA = """\
+Metadata-Version: 2.1
+Name: {name}
+Version: {version}
+Requires-Dist: bar>=1.0
+"""
+
+
+def metadata_link(name: str, version: str, content: bytes | None = None) -> Link:
+    content = content or METADATA.format(name=name, version=version).encode()
+    return Link(
+        f"https://files.foo.com/{name}-{version}-py3-none-any.whl",
+        metadata=f"sha256={hashlib.sha256(content).hexdigest()}",
+    )
+
+
+def mock_metadata_requests(
+    mocker: MockerFixture, repo: HTTPRepository, latency: float = 0
+) -> tuple[MockType, list[int]]:
+    """
+    Mocks the requests of metadata files, which are served with some latency.
+    Returns the mock and a list with the maximum number of concurrent requests.
+    """
+    lock = threading.Lock()
+    active = [0]
+    max_active = [0]
+
+    def get(url: str, **kwargs: Any) -> Any:
+        name, version, _ = url.rsplit("/", 1)[-1].split("-", 2)
+        with lock:
+            active[0] += 1
+            max_active[0] = max(max_active[0], active[0])
+        time.sleep(latency)
+        with lock:
+            active[0] -= 1
+
+        return mocker.Mock(content=METADATA.format(name=name, version=version).encode())
+
+    return mocker.patch.object(repo.session, "get", side_effect=get), max_active
+
+
+def test_fetch_metadata(mocker: MockerFixture) -> None:
+    repo = MockRepository()
+    get, max_active = mock_metadata_requests(mocker, repo, latency=0.05)
+    links = [metadata_link("foo", f"{i}.0") for i in range(20)]
+    links.append(Link("https://files.foo.com/bar-1.0-py3-none-any.whl"))
+
+    repo.fetch_metadata(links)
+
+    # only links with metadata are fetched, concurrently over the pooled connections
+    assert get.call_count == 20
+    assert 1 < max_active[0] <= repo._pool_size
+
+    # the metadata is consumed when the release info is retrieved
+    info = repo._get_info_from_metadata(links[3])
+    assert info is not None
+    assert info.version == "3.0"
+    assert info.requires_dist == ["bar>=1.0"]
+    assert get.call_count == 20
+
+    assert repo._get_info_from_metadata(links[3]) is not None
+    assert get.call_count == 21
+
+
+def test_fetch_metadata_verifies_hashes(mocker: MockerFixture) -> None:
+    repo = MockRepository()
+    get, _ = mock_metadata_requests(mocker, repo)
+    links = [
+        metadata_link("foo", "1.0"),
+        metadata_link("foo", "2.0", content=b"Name: foo\nVersion: 3.0\n"),
+    ]
+
+    repo.fetch_metadata(links)
+
+    assert repo._get_info_from_metadata(links[0]) is not None
+    # metadata that does not match its hash is ignored and not fetched again
+    assert repo._get_info_from_metadata(links[1]) is None
+    assert get.call_count == 2
+
+
+@pytest.mark.parametrize("disable_cache", [False, True])
+def test_prefetch_release_info(
+    mocker: MockerFixture, config: Config, disable_cache: bool
+) -> None:
+    repo = LegacyRepository(
+        "foo", "https://foo.com/simple", config=config, disable_cache=disable_cache
+    )
+    versions = [f"{i}.0" for i in range(5)]
+    page = SimpleJsonPage(
+        "https://foo.com/simple/foo/",
+        {
+            "files": [
+                {
+                    "url": link.url,
+                    "hashes": {"sha256": "abcdef"},
+                    "core-metadata": link.metadata_hashes,
+                }
+                for link in (metadata_link("foo", version) for version in versions)
+            ]
+        },
+    )
+    mocker.patch.object(repo, "_get_page", return_value=page)
+    get, _ = mock_metadata_requests(mocker, repo)
+    name = canonicalize_name("foo")
+
+    ready: list[str] = []
+    repo.prefetch_release_info(
+        [(name, Version.parse(version)) for version in versions],
+        callback=lambda _, version: ready.append(version.text),
+    )
+
+    assert get.call_count == len(versions)
+    assert sorted(ready) == versions
+    assert (repo._release_cache.get("foo:1.0") is None) is disable_cache
+
+    package = repo.package("foo", Version.parse("1.0"))
+
+    assert package.version.text == "1.0"
+    assert [str(dependency) for dependency in package.requires] == ["bar (>=1.0)"]
+    assert get.call_count == len(versions)
+
+    # prefetched releases are not fetched again
+    ready.clear()
+    repo.prefetch_release_info(
+        [(name, Version.parse("2.0"))],
+        callback=lambda _, version: ready.append(version.text),
+    )
+    repo.package("foo", Version.parse("2.0"))
+
+    assert get.call_count == len(versions)
+    assert ready == ["2.0"]
+
+
+@pytest.mark.parametrize(
+    ("backend", "cache_class"), [("file", FileCache), ("sqlite", SQLiteCache)]
+)
+def test_release_cache_backend(
+    config: Config, backend: str, cache_class: type[FileCache[Any]]
+) -> None:
+    config.merge({"cache": {"release-backend": backend}})
+    repo = LegacyRepository("foo", "https://foo.com/simple", config=config)
+
+    assert type(repo._release_cache) is cache_class
+    assert repo._release_cache.path == config.repository_cache_directory / "foo"
+
+
 @pytest.mark.parametrize(
     "mock_hashes",
     [
@@ -186,16 +434,18 @@ def test_get_info_from_wheel_state_sequence(mocker: MockerFixture) -> None:
     ],
 )
 def test_calculate_sha256(
-    mocker: MockerFixture, mock_hashes: dict[str, Any] | None
+    http: type[httpretty.httpretty],
+    mocker: MockerFixture,
+    mock_hashes: dict[str, Any] | None,
 ) -> None:
     filename = "poetry_core-1.5.0-py3-none-any.whl"
     filepath = MockRepository.DIST_FIXTURES / filename
     mock_download = mocker.patch(
-        "poetry.repositories.http_repository.download_file",
-        side_effect=lambda _, dest, *args, **kwargs: shutil.copy(filepath, dest),
+        "poetry.repositories.http_repository.download_file", wraps=download_file
     )
     domain = "foo.com"
     link = Link(f"https://{domain}/{filename}", hashes=mock_hashes)
+    http.register_uri(http.GET, link.url, body=filepath.read_bytes())
     repo = MockRepository()
 
     calculated_hash = repo.calculate_sha256(link)
@@ -208,7 +458,7 @@ def test_calculate_sha256(
 
 
 def test_calculate_sha256_defaults_to_sha256_on_md5_errors(
-    mocker: MockerFixture,
+    http: type[httpretty.httpretty], mocker: MockerFixture
 ) -> None:
     raised_value_error = False
 
@@ -222,8 +472,7 @@ def test_calculate_sha256_defaults_to_sha256_on_md5_errors(
     filename = "poetry_core-1.5.0-py3-none-any.whl"
     filepath = MockRepository.DIST_FIXTURES / filename
     mock_download = mocker.patch(
-        "poetry.repositories.http_repository.download_file",
-        side_effect=lambda _, dest, *args, **kwargs: shutil.copy(filepath, dest),
+        "poetry.repositories.http_repository.download_file", wraps=download_file
     )
     mock_hashlib_md5 = mocker.patch("hashlib.md5", side_effect=mock_hashlib_md5_error)
 
@@ -232,6 +481,7 @@ def test_calculate_sha256_defaults_to_sha256_on_md5_errors(
         f"https://{domain}/{filename}",
         hashes={"md5": "be7589b4902793e66d7d979bd8581591"},
     )
+    http.register_uri(http.GET, link.url, body=filepath.read_bytes())
     repo = MockRepository()
 
     calculated_hash = repo.calculate_sha256(link)
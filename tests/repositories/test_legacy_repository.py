@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import base64
+import json
 import re
 
 from typing import TYPE_CHECKING
+from typing import Any
 
 import pytest
 import requests
@@ -17,9 +19,13 @@ from poetry.factory import Factory
 from poetry.repositories.exceptions import PackageNotFoundError
 from poetry.repositories.exceptions import RepositoryError
 from poetry.repositories.legacy_repository import LegacyRepository
+from poetry.repositories.link_sources.html import HTMLPage
+from poetry.repositories.link_sources.json import SimpleJsonPage
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     import httpretty
 
     from pytest import MonkeyPatch
@@ -582,7 +588,11 @@ def test_get_redirected_response_url(
     redirect_url = "http://legacy.redirect.bar"
 
     def get_mock(
-        url: str, raise_for_status: bool = True, timeout: int = 5
+        url: str,
+        raise_for_status: bool = True,
+        timeout: int = 5,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
     ) -> requests.Response:
         response = requests.Response()
         response.status_code = 200
@@ -632,3 +642,152 @@ def test_authenticator_with_implicit_repository_configuration(
 
     basic_auth = base64.b64encode(b"foo:bar").decode()
     assert request.headers["Authorization"] == f"Basic {basic_auth}"
+
+
+JSON_PAGE = {
+    "meta": {"api-version": "1.0"},
+    "name": "foo",
+    "files": [
+        {
+            "filename": "foo-1.0-py3-none-any.whl",
+            "url": "../../packages/foo-1.0-py3-none-any.whl",
+            "hashes": {"sha256": "a1"},
+            "requires-python": ">=3.8",
+            "core-metadata": {"sha256": "b2"},
+        },
+        {
+            "filename": "foo-1.0.tar.gz",
+            "url": "https://files.foo.bar/foo-1.0.tar.gz",
+            "hashes": {"sha256": "c3"},
+        },
+        {
+            "filename": "foo-2.0.tar.gz",
+            "url": "https://files.foo.bar/foo-2.0.tar.gz",
+            "hashes": {"sha256": "d4"},
+            "yanked": "broken",
+        },
+    ],
+}
+
+
+def test_get_page_prefers_json(http: type[httpretty.httpretty]) -> None:
+    http.register_uri(
+        http.GET,
+        "https://legacy.foo.bar/simple/foo/",
+        body=json.dumps(JSON_PAGE),
+        content_type="application/vnd.pypi.simple.v1+json",
+    )
+    repo = LegacyRepository("legacy", "https://legacy.foo.bar/simple")
+
+    page = repo.get_page("foo")
+
+    assert (
+        http.last_request()
+        .headers["Accept"]
+        .startswith("application/vnd.pypi.simple.v1+json,")
+    )
+    assert isinstance(page, SimpleJsonPage)
+    assert [str(v) for v in page.versions(canonicalize_name("foo"))] == ["1.0", "2.0"]
+    wheel, sdist = page.links_for_version(
+        canonicalize_name("foo"), Version.parse("1.0")
+    )
+    assert wheel.url == "https://legacy.foo.bar/packages/foo-1.0-py3-none-any.whl"
+    assert wheel.hashes == {"sha256": "a1"}
+    assert wheel.requires_python == ">=3.8"
+    assert wheel.metadata_hashes == {"sha256": "b2"}
+    assert sdist.hashes == {"sha256": "c3"}
+    assert page.yanked(canonicalize_name("foo"), Version.parse("2.0")) == "broken"
+
+    packages = repo.find_packages(Factory.create_dependency("foo", "*"))
+    assert [str(p.version) for p in packages] == ["1.0"]
+    packages = repo.find_packages(Factory.create_dependency("foo", "2.0"))
+    assert [(str(p.version), p.yanked) for p in packages] == [("2.0", True)]
+
+
+def test_get_page_falls_back_to_html(http: type[httpretty.httpretty]) -> None:
+    http.register_uri(
+        http.GET,
+        "https://legacy.foo.bar/simple/foo/",
+        body='<a href="https://files.foo.bar/foo-1.0.tar.gz#sha256=c3">foo</a>',
+        content_type="text/html",
+    )
+    repo = LegacyRepository("legacy", "https://legacy.foo.bar/simple")
+
+    page = repo.get_page("foo")
+
+    assert isinstance(page, HTMLPage)
+    links = list(page.links)
+    assert [link.hashes for link in links] == [{"sha256": "c3"}]
+
+
+def test_get_page_invalid_json_raises(http: type[httpretty.httpretty]) -> None:
+    http.register_uri(
+        http.GET,
+        "https://legacy.foo.bar/simple/foo/",
+        body="<html></html>",
+        content_type="application/vnd.pypi.simple.v1+json",
+    )
+    repo = LegacyRepository("legacy", "https://legacy.foo.bar/simple")
+
+    with pytest.raises(RepositoryError, match=r"Invalid JSON page for package \[foo\]"):
+        repo.get_page("foo")
+
+
+def test_get_page_streams_and_closes_html_response(
+    http: type[httpretty.httpretty], mocker: MockerFixture
+) -> None:
+    http.register_uri(
+        http.GET,
+        "https://legacy.foo.bar/simple/foo/",
+        body='<a href="https://files.foo.bar/foo-1.0.tar.gz#sha256=c3">foo</a>',
+        content_type="text/html; charset=utf-8",
+    )
+    repo = LegacyRepository("legacy", "https://legacy.foo.bar/simple")
+    get = mocker.spy(repo.session, "get")
+    iter_content = mocker.spy(requests.Response, "iter_content")
+
+    page = repo.get_page("foo")
+
+    assert get.call_args.kwargs["stream"] is True
+    assert iter_content.call_count == 1
+    assert get.spy_return.raw.closed
+    assert isinstance(page, HTMLPage)
+    assert [link.hashes for link in page.links] == [{"sha256": "c3"}]
+
+
+@pytest.mark.parametrize("failures", [1, 6])
+def test_get_page_retries_reading_the_page(
+    http: type[httpretty.httpretty], mocker: MockerFixture, failures: int
+) -> None:
+    http.register_uri(
+        http.GET,
+        "https://legacy.foo.bar/simple/foo/",
+        body='<a href="https://files.foo.bar/foo-1.0.tar.gz#sha256=c3">foo</a>',
+        content_type="text/html; charset=utf-8",
+    )
+    repo = LegacyRepository("legacy", "https://legacy.foo.bar/simple")
+    get = mocker.spy(repo.session, "get")
+    iter_content = requests.Response.iter_content
+    calls = 0
+
+    def broken_iter_content(
+        response: requests.Response, *args: Any, **kwargs: Any
+    ) -> Iterator[str]:
+        nonlocal calls
+        calls += 1
+        if calls <= failures:
+            raise requests.exceptions.ChunkedEncodingError("connection broken")
+        yield from iter_content(response, *args, **kwargs)
+
+    mocker.patch.object(requests.Response, "iter_content", broken_iter_content)
+
+    if failures > 5:
+        with pytest.raises(
+            RepositoryError, match=r"Failed to read the page of package \[foo\]"
+        ):
+            repo.get_page("foo")
+        assert get.call_count == 6
+    else:
+        page = repo.get_page("foo")
+        assert [link.hashes for link in page.links] == [{"sha256": "c3"}]
+        assert get.call_count == 2
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from packaging.utils import canonicalize_name
+
+from poetry.repositories.exceptions import PackageNotFoundError
+from poetry.repositories.legacy_repository import LegacyRepository
+from poetry.repositories.link_sources.html import HTMLPage
+from poetry.repositories.page_prefetcher import PagePrefetcher
+from poetry.repositories.repository_pool import Priority
+from poetry.repositories.repository_pool import RepositoryPool
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from packaging.utils import NormalizedName
+    from pytest_mock import MockerFixture
+
+    from poetry.config.config import Config
+
+    RepositoryFactory = Callable[..., tuple[LegacyRepository, "Index"]]
+
+
+PAGE = """\
+<!DOCTYPE html>
+<html>
+  <body>
+    <a href="../../packages/{name}-1.0.tar.gz">{name}-1.0.tar.gz</a>
+  </body>
+</html>
+"""
+
+
+class Index:
+    """
+    A simple index that serves the pages of the given packages with some latency
+    and records the requests and the maximum number of concurrent requests.
+    """
+
+    def __init__(self, name: str, packages: set[str], latency: float) -> None:
+        self.url = f"https://{name}.example.org/simple"
+        self.packages = packages
+        self.latency = latency
+        self.requests: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def get_page(self, name: NormalizedName) -> HTMLPage:
+        with self.lock:
+            self.requests.append(name)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+        time.sleep(self.latency)
+
+        with self.lock:
+            self.active -= 1
+
+        if name not in self.packages:
+            raise PackageNotFoundError(f"Package [{name}] not found.")
+
+        return HTMLPage(f"{self.url}/{name}/", PAGE.format(name=name))
+
+
+@pytest.fixture
+def create_repository(mocker: MockerFixture, config: Config) -> RepositoryFactory:
+    def create(
+        name: str, packages: set[str], latency: float = 0.05
+    ) -> tuple[LegacyRepository, Index]:
+        index = Index(name, packages, latency)
+        repository = LegacyRepository(
+            name, index.url, config=config, disable_cache=True
+        )
+        mocker.patch.object(repository, "_get_page", side_effect=index.get_page)
+        return repository, index
+
+    return create
+
+
+def test_prefetch_fetches_pages_concurrently(
+    create_repository: RepositoryFactory,
+) -> None:
+    names = [f"package-{i}" for i in range(12)]
+    repository, index = create_repository("foo", set(names))
+    pool = RepositoryPool([repository])
+
+    prefetcher = PagePrefetcher(pool, max_workers=4)
+    for name in names:
+        prefetcher.prefetch(name)
+        # pages are only requested once
+        prefetcher.prefetch(name)
+    prefetcher.shutdown(cancel_pending=False)
+
+    assert sorted(index.requests) == sorted(names)
+    assert 1 < index.max_active <= 4
+
+    # the pages are cached
+    for name in map(canonicalize_name, names):
+        assert list(repository.get_page(name).versions(name))
+    assert len(index.requests) == len(names)
+
+
+def test_prefetch_respects_priorities(
+    create_repository: RepositoryFactory,
+) -> None:
+    primary, primary_index = create_repository("primary", {"a"})
+    supplemental, supplemental_index = create_repository("supplemental", {"a", "b"})
+    explicit, explicit_index = create_repository("explicit", {"a", "b", "c"})
+
+    pool = RepositoryPool()
+    pool.add_repository(primary)
+    pool.add_repository(supplemental, priority=Priority.SUPPLEMENTAL)
+    pool.add_repository(explicit, priority=Priority.EXPLICIT)
+
+    prefetcher = PagePrefetcher(pool, max_workers=4)
+    prefetcher.prefetch("a")
+    prefetcher.prefetch("b")
+    prefetcher.prefetch("c", "explicit")
+    prefetcher.shutdown(cancel_pending=False)
+
+    assert sorted(primary_index.requests) == ["a", "b"]
+    # supplemental repositories are only queried
+    # if the package is not found in a primary repository
+    assert supplemental_index.requests == ["b"]
+    # explicit repositories are only queried if requested
+    assert explicit_index.requests == ["c"]
+
+
+def test_get_page_waits_for_page_being_fetched(
+    create_repository: RepositoryFactory,
+) -> None:
+    repository, index = create_repository("foo", {"a"}, latency=0.2)
+
+    threads = [
+        threading.Thread(target=repository.get_page, args=(canonicalize_name("a"),))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert index.requests == ["a"]
+
+
+def test_get_page_does_not_cache_errors(
+    create_repository: RepositoryFactory,
+) -> None:
+    repository, index = create_repository("foo", set())
+    name = canonicalize_name("a")
+
+    with pytest.raises(PackageNotFoundError):
+        repository.get_page(name)
+    index.packages.add("a")
+
+    assert list(repository.get_page(name).versions(name))
+    assert index.requests == ["a", "a"]
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import os
+import threading
+import time
+
+from typing import TYPE_CHECKING
+
 import pytest
 
 from poetry.core.constraints.version import Version
@@ -13,6 +19,14 @@ from tests.helpers import get_dependency
 from tests.helpers import get_package
 
 
+if TYPE_CHECKING:
+    from poetry.core.packages.dependency import Dependency
+    from poetry.core.packages.package import Package
+    from pytest_mock import MockerFixture
+
+    from poetry.config.config import Config
+
+
 def test_pool() -> None:
     pool = RepositoryPool()
 
@@ -250,6 +264,169 @@ def test_pool_find_packages_in_specified_repository() -> None:
     assert returned_packages_unavailable == []
 
 
+class SlowRepository(Repository):
+    def __init__(
+        self,
+        name: str,
+        packages: list[Package],
+        latency: float,
+        calls: list[str],
+        broken: bool = False,
+        barrier: threading.Barrier | None = None,
+    ) -> None:
+        super().__init__(name, packages)
+        self._latency = latency
+        self._calls = calls
+        self._broken = broken
+        self._barrier = barrier
+
+    def find_packages(self, dependency: Dependency) -> list[Package]:
+        self._calls.append(self.name)
+        if self._barrier is not None:
+            # Only passes if all repositories sharing the barrier
+            # are queried at the same time.
+            self._barrier.wait(timeout=5)
+        time.sleep(self._latency)
+        if self._broken:
+            raise RuntimeError(f"{self.name} is broken")
+        return super().find_packages(dependency)
+
+
+@pytest.mark.parametrize(
+    ("constraint", "expected", "queried_supplemental"),
+    [
+        # found in the primary repositories
+        ("^1.0.0", ["1.1.1", "1.2.0"], False),
+        # only found in the supplemental repositories
+        (">=2.0.0", ["2.5.0"], True),
+        ("2.6.0", ["2.6.0"], True),
+        ("3.0.0", [], True),
+    ],
+)
+def test_pool_find_packages_concurrently(
+    config: Config, constraint: str, expected: list[str], queried_supplemental: bool
+) -> None:
+    config.merge({"solver": {"parallel-sources": True}})
+
+    def create_pool(concurrent: bool) -> RepositoryPool:
+        primary_barrier = threading.Barrier(2) if concurrent else None
+        supplemental_barrier = threading.Barrier(2) if concurrent else None
+        # The repositories answer in the reverse order of their priority.
+        repositories: list[Repository] = [
+            SlowRepository(
+                name, [get_package("foo", version)], latency, calls, barrier=barrier
+            )
+            for name, version, latency, barrier in (
+                ("repo1", "1.1.1", 0.03, primary_barrier),
+                ("repo2", "1.2.0", 0.02, primary_barrier),
+                ("supplemental1", "2.5.0", 0.01, supplemental_barrier),
+                ("supplemental2", "2.6.0", 0.0, supplemental_barrier),
+            )
+        ]
+        pool = RepositoryPool(repositories[:2], config=config)
+        for repository in repositories[2:]:
+            pool.add_repository(repository, priority=Priority.SUPPLEMENTAL)
+        return pool
+
+    calls: list[str] = []
+    packages = create_pool(concurrent=True).find_packages(
+        get_dependency("foo", constraint)
+    )
+    concurrent_calls = calls.copy()
+
+    # The sequential lookup returns the same packages in the same order.
+    config.merge({"solver": {"parallel-sources": False}})
+    sequential_packages = create_pool(concurrent=False).find_packages(
+        get_dependency("foo", constraint)
+    )
+
+    assert [p.version.text for p in packages] == expected
+    assert packages == sequential_packages
+    # The supplemental repositories are only queried (at the same time)
+    # if the primary repositories (queried at the same time) do not provide
+    # any packages.
+    assert sorted(concurrent_calls[:2]) == ["repo1", "repo2"]
+    if queried_supplemental:
+        assert sorted(concurrent_calls[2:]) == ["supplemental1", "supplemental2"]
+    else:
+        assert len(concurrent_calls) == 2
+
+
+def test_pool_find_packages_concurrently_reuses_executor(
+    config: Config, mocker: MockerFixture
+) -> None:
+    config.merge({"solver": {"parallel-sources": True}})
+    calls: list[str] = []
+    pool = RepositoryPool(
+        [
+            SlowRepository("repo1", [get_package("foo", "1.0")], 0.0, calls),
+            SlowRepository("repo2", [get_package("foo", "2.0")], 0.0, calls),
+        ],
+        config=config,
+    )
+
+    pool.find_packages(get_dependency("foo"))
+    executor = pool._get_executor()
+    pool.find_packages(get_dependency("foo"))
+
+    assert pool._get_executor() is executor
+
+    # a forked process does not use the executor of its parent process
+    mocker.patch("os.getpid", return_value=os.getpid() + 1)
+    assert pool._get_executor() is not executor
+
+
+def test_pool_find_packages_concurrently_raises_errors_in_priority_order(
+    config: Config,
+) -> None:
+    config.merge({"solver": {"parallel-sources": True}})
+    calls: list[str] = []
+    pool = RepositoryPool(
+        [
+            SlowRepository("repo1", [], 0.1, calls, broken=True),
+            SlowRepository("repo2", [], 0.0, calls, broken=True),
+        ],
+        config=config,
+    )
+    broken_supplemental = SlowRepository("supplemental", [], 0.0, calls, broken=True)
+    pool.add_repository(broken_supplemental, priority=Priority.SUPPLEMENTAL)
+
+    with pytest.raises(RuntimeError, match="repo1 is broken"):
+        pool.find_packages(get_dependency("foo"))
+
+    # Errors of supplemental repositories that are not needed are ignored.
+    pool = RepositoryPool(
+        [SlowRepository("repo", [get_package("foo", "1.0")], 0.1, calls)],
+        config=config,
+    )
+    pool.add_repository(broken_supplemental, priority=Priority.SUPPLEMENTAL)
+
+    assert len(pool.find_packages(get_dependency("foo"))) == 1
+
+
+def test_pool_find_packages_concurrently_only_queries_explicit_source(
+    config: Config,
+) -> None:
+    config.merge({"solver": {"parallel-sources": True}})
+    calls: list[str] = []
+    package = get_package("foo", "1.0")
+    pool = RepositoryPool(
+        [
+            SlowRepository("repo1", [package], 0.0, calls),
+            SlowRepository("repo2", [package], 0.0, calls),
+        ],
+        config=config,
+    )
+    pool.add_repository(
+        SlowRepository("explicit", [package], 0.0, calls), priority=Priority.EXPLICIT
+    )
+    dependency = get_dependency("foo")
+    dependency.source_name = "explicit"
+
+    assert pool.find_packages(dependency) == [package]
+    assert calls == ["explicit"]
+
+
 def test_search_no_legacy_repositories() -> None:
     package_foo1 = get_package("foo", "1.0.0")
     package_foo2 = get_package("foo", "2.0.0")
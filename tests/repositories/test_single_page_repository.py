@@ -13,6 +13,8 @@ from poetry.repositories.single_page_repository import SinglePageRepository
 
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from packaging.utils import NormalizedName
 
 
@@ -36,8 +38,13 @@ class MockSinglePageRepository(SinglePageRepository):
             return HTMLPage(self._url, f.read())
 
     def _download(
-        self, url: str, dest: Path, *, raise_accepts_ranges: bool = False
-    ) -> None:
+        self,
+        url: str,
+        dest: Path,
+        *,
+        raise_accepts_ranges: bool = False,
+        hash_names: Collection[str] = (),
+    ) -> dict[str, str]:
         raise RuntimeError("Tests are not configured for downloads")
 
 
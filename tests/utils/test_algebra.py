@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+
+from poetry.core.constraints.version import parse_constraint
+from poetry.core.version.markers import parse_marker
+
+from poetry.utils import algebra
+from poetry.utils.algebra import LRUCache
+
+
+@pytest.fixture(autouse=True)
+def clear_caches() -> None:
+    algebra.clear()
+
+
+def test_lru_cache_is_bounded() -> None:
+    cache: LRUCache[int, int] = LRUCache("test", maxsize=2)
+
+    assert cache.get(1, lambda: 10) == 10
+    assert cache.get(2, lambda: 20) == 20
+    # 1 becomes the most recently used entry so that 2 is evicted
+    assert cache.get(1, lambda: 11) == 10
+    assert cache.get(3, lambda: 30) == 30
+
+    assert len(cache) == 2
+    assert cache.get(2, lambda: 21) == 21
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_marker_operations_are_memoized() -> None:
+    a = parse_marker('sys_platform == "linux"')
+    b = parse_marker('python_version >= "3.10"')
+
+    union = algebra.marker_union(a, b)
+    assert union == a.union(b)
+    assert algebra.marker_union(parse_marker(str(a)), parse_marker(str(b))) is union
+    assert algebra.marker_intersect(a, b) == a.intersect(b)
+    assert algebra.marker_invert(a) == a.invert()
+
+    hits, misses, size = algebra.cache_info()["marker union"]
+    assert (hits, misses, size) == (1, 1, 1)
+
+
+def test_resulting_markers_are_interned() -> None:
+    a = parse_marker('sys_platform == "linux"')
+    b = parse_marker('python_version >= "3.10"')
+
+    intersection = algebra.marker_intersect(a.union(b), a)
+    union = algebra.marker_union(a.intersect(b), a)
+
+    assert intersection == a
+    assert union is intersection
+
+
+def test_constraint_operations_are_memoized_by_identity() -> None:
+    constraint = parse_constraint(">=1.0")
+    equal_constraint = parse_constraint(">=1.0.0")
+    other = parse_constraint("<2.0")
+
+    intersection = algebra.constraint_intersect(constraint, other)
+    assert str(intersection) == ">=1.0,<2.0"
+    assert algebra.constraint_intersect(constraint, other) is intersection
+    assert str(algebra.constraint_intersect(equal_constraint, other)) == ">=1.0.0,<2.0"
+    assert str(algebra.constraint_union(constraint, other)) == "*"
+    assert str(algebra.constraint_difference(constraint, other)) == ">=2.0"
+
+    hits, misses, _ = algebra.cache_info()["constraint operations"]
+    assert (hits, misses) == (1, 4)
+
+
+def test_format_cache_info() -> None:
+    a = parse_marker('sys_platform == "linux"')
+    algebra.marker_invert(a)
+    algebra.marker_invert(a)
+
+    assert (
+        "marker inversion: 1 hits, 1 misses (50% hit rate, 1 cached)"
+        in algebra.format_cache_info().splitlines()
+    )
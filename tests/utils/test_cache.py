@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import concurrent.futures
+import hashlib
+import os
 import shutil
+import time
 import traceback
 
 from pathlib import Path
@@ -14,8 +17,12 @@ from packaging.tags import Tag
 from poetry.core.packages.utils.link import Link
 
 from poetry.utils.cache import ArtifactCache
+from poetry.utils.cache import CacheEntry
 from poetry.utils.cache import FileCache
+from poetry.utils.cache import SQLiteCache
+from poetry.utils.cache import prune
 from poetry.utils.env import MockEnv
+from poetry.utils.helpers import get_file_hash
 
 
 if TYPE_CHECKING:
@@ -46,8 +53,11 @@ def test_cache_validates(repository_cache_dir: Path) -> None:
     assert str(e.value) == "FileCache.hash_type is unknown value: 'unknown'."
 
 
-def test_cache_get_put_has(repository_cache_dir: Path) -> None:
-    cache: FileCache[Any] = FileCache(repository_cache_dir / "cache")
+@pytest.mark.parametrize("cache_class", [FileCache, SQLiteCache])
+def test_cache_get_put_has(
+    repository_cache_dir: Path, cache_class: type[FileCache[Any]]
+) -> None:
+    cache: FileCache[Any] = cache_class(repository_cache_dir / "cache")
     cache.put("key1", "value")
     cache.put("key2", {"a": ["json-encoded", "value"]})
 
@@ -58,8 +68,11 @@ def test_cache_get_put_has(repository_cache_dir: Path) -> None:
     assert not cache.has("key3")
 
 
-def test_cache_forget(repository_cache_dir: Path) -> None:
-    cache: FileCache[Any] = FileCache(repository_cache_dir / "cache")
+@pytest.mark.parametrize("cache_class", [FileCache, SQLiteCache])
+def test_cache_forget(
+    repository_cache_dir: Path, cache_class: type[FileCache[Any]]
+) -> None:
+    cache: FileCache[Any] = cache_class(repository_cache_dir / "cache")
     cache.put("key1", "value")
     cache.put("key2", "value")
 
@@ -72,8 +85,11 @@ def test_cache_forget(repository_cache_dir: Path) -> None:
     assert cache.has("key2")
 
 
-def test_cache_flush(repository_cache_dir: Path) -> None:
-    cache: FileCache[Any] = FileCache(repository_cache_dir / "cache")
+@pytest.mark.parametrize("cache_class", [FileCache, SQLiteCache])
+def test_cache_flush(
+    repository_cache_dir: Path, cache_class: type[FileCache[Any]]
+) -> None:
+    cache: FileCache[Any] = cache_class(repository_cache_dir / "cache")
     cache.put("key1", "value")
     cache.put("key2", "value")
 
@@ -86,8 +102,13 @@ def test_cache_flush(repository_cache_dir: Path) -> None:
     assert not cache.has("key2")
 
 
-def test_cache_remember(repository_cache_dir: Path, mocker: MockerFixture) -> None:
-    cache: FileCache[Any] = FileCache(repository_cache_dir / "cache")
+@pytest.mark.parametrize("cache_class", [FileCache, SQLiteCache])
+def test_cache_remember(
+    repository_cache_dir: Path,
+    mocker: MockerFixture,
+    cache_class: type[FileCache[Any]],
+) -> None:
+    cache: FileCache[Any] = cache_class(repository_cache_dir / "cache")
 
     method = mocker.Mock(return_value="value2")
     cache.put("key1", "value1")
@@ -98,10 +119,13 @@ def test_cache_remember(repository_cache_dir: Path, mocker: MockerFixture) -> No
     method.assert_called()
 
 
+@pytest.mark.parametrize("cache_class", [FileCache, SQLiteCache])
 def test_cache_get_limited_minutes(
-    repository_cache_dir: Path, mocker: MockerFixture
+    repository_cache_dir: Path,
+    mocker: MockerFixture,
+    cache_class: type[FileCache[Any]],
 ) -> None:
-    cache: FileCache[Any] = FileCache(repository_cache_dir / "cache")
+    cache: FileCache[Any] = cache_class(repository_cache_dir / "cache")
 
     start_time = 1111111111
 
@@ -177,6 +201,90 @@ def test_detect_corrupted_cache_key_file(
     assert poetry_file_cache.get("key1") is None
 
 
+@pytest.mark.parametrize("cache_class", [FileCache, SQLiteCache])
+def test_cache_get_many(
+    repository_cache_dir: Path, cache_class: type[FileCache[Any]]
+) -> None:
+    cache: FileCache[Any] = cache_class(repository_cache_dir / "cache")
+    for i in range(1200):
+        cache.put(f"key{i}", {"value": i})
+
+    values = cache.get_many(f"key{i}" for i in range(0, 1300, 2))
+
+    assert values == {f"key{i}": {"value": i} for i in range(0, 1200, 2)}
+
+
+def test_sqlite_cache_stores_items_in_one_file(repository_cache_dir: Path) -> None:
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+    cache.put("key1", "value1")
+    cache.put("key2", "value2")
+
+    assert [path.name for path in cache.path.iterdir() if path.is_dir()] == []
+    assert SQLiteCache(repository_cache_dir / "cache").get("key1") == "value1"
+
+
+def test_sqlite_cache_migrates_file_cache(repository_cache_dir: Path) -> None:
+    file_cache: FileCache[Any] = FileCache(repository_cache_dir / "cache")
+    file_cache.put("key1", "value1")
+    file_cache.put("key2", {"a": "value2"}, minutes=5)
+    file_cache.put("key3", "value3")
+    file_cache._path("key3").write_text("corrupt", encoding="utf-8")
+    # other caches in the same directory are not migrated
+    other_cache: FileCache[Any] = FileCache(repository_cache_dir / "cache" / "_other")
+    other_cache.put("key4", "value4")
+
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+
+    assert cache.get("key1") == "value1"
+    assert cache.get("key2") == {"a": "value2"}
+    assert cache.get("key3") is None
+    assert not file_cache._path("key1").exists()
+    assert other_cache.get("key4") == "value4"
+    assert sorted(path.name for path in cache.path.iterdir() if path.is_dir()) == [
+        "_other"
+    ]
+
+
+def test_sqlite_cache_detects_corrupt_entries(repository_cache_dir: Path) -> None:
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+    cache.put("key1", "value")
+    cache._connection.execute(
+        "UPDATE cache SET data = 'corrupt' WHERE key = ?", (cache._hash("key1"),)
+    )
+
+    assert cache.get("key1") is None
+    assert cache._connection.execute("SELECT count(*) FROM cache").fetchone() == (0,)
+
+
+def test_sqlite_cache_is_thread_safe(repository_cache_dir: Path) -> None:
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+
+    def put_and_get(i: int) -> Any:
+        cache.put(f"key{i}", i)
+        return cache.get(f"key{i}")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(put_and_get, range(100))) == list(range(100))
+
+    assert len(cache.get_many(f"key{i}" for i in range(100))) == 100
+
+
+def test_sqlite_cache_reconnects_after_fork(
+    repository_cache_dir: Path, mocker: MockerFixture
+) -> None:
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+    cache.put("key1", "value1")
+    connection = cache._connection
+
+    # simulate a forked process
+    mocker.patch("os.getpid", return_value=os.getpid() + 1)
+
+    assert cache.get("key1") == "value1"
+    assert cache._connection is not connection
+    # the connection of the parent process is not closed
+    assert connection.execute("SELECT 1").fetchone() == (1,)
+
+
 def test_get_cache_directory_for_link(tmp_path: Path) -> None:
     cache = ArtifactCache(cache_dir=tmp_path)
     directory = cache.get_cache_directory_for_link(
@@ -231,9 +339,9 @@ def test_get_cached_archives(fixture_dir: FixtureDirGetter) -> None:
             "https://files.pythonhosted.org/demo-0.1.0.tar.gz",
             True,
             [
-                Path("/cache/demo-0.1.0-py2.py3-none-any"),
-                Path("/cache/demo-0.1.0-cp38-cp38-macosx_10_15_x86_64.whl"),
-                Path("/cache/demo-0.1.0-cp37-cp37-macosx_10_15_x86_64.whl"),
+                "demo-0.1.0-py2.py3-none-any",
+                "demo-0.1.0-cp38-cp38-macosx_10_15_x86_64.whl",
+                "demo-0.1.0-cp37-cp37-macosx_10_15_x86_64.whl",
             ],
         ),
         (
@@ -244,10 +352,10 @@ def test_get_cached_archives(fixture_dir: FixtureDirGetter) -> None:
     ],
 )
 def test_get_not_found_cached_archive_for_link(
-    mocker: MockerFixture,
+    tmp_path: Path,
     link: str,
     strict: bool,
-    available_packages: list[Path],
+    available_packages: list[str],
 ) -> None:
     env = MockEnv(
         version_info=(3, 8, 3),
@@ -257,13 +365,11 @@ def test_get_not_found_cached_archive_for_link(
             Tag("py3", "none", "any"),
         ],
     )
-    cache = ArtifactCache(cache_dir=Path())
-
-    mocker.patch.object(
-        cache,
-        "_get_cached_archives",
-        return_value=available_packages,
-    )
+    cache = ArtifactCache(cache_dir=tmp_path)
+    cache_dir = cache.get_cache_directory_for_link(Link(link))
+    cache_dir.mkdir(parents=True)
+    for filename in available_packages:
+        (cache_dir / filename).touch()
 
     archive = cache.get_cached_archive_for_link(Link(link), strict=strict, env=env)
 
@@ -275,28 +381,28 @@ def test_get_not_found_cached_archive_for_link(
     [
         (
             "https://files.pythonhosted.org/demo-0.1.0.tar.gz",
-            "/cache/demo-0.1.0-cp38-cp38-macosx_10_15_x86_64.whl",
+            "demo-0.1.0-cp38-cp38-macosx_10_15_x86_64.whl",
             False,
         ),
         (
             "https://example.com/demo-0.1.0-cp38-cp38-macosx_10_15_x86_64.whl",
-            "/cache/demo-0.1.0-cp38-cp38-macosx_10_15_x86_64.whl",
+            "demo-0.1.0-cp38-cp38-macosx_10_15_x86_64.whl",
             False,
         ),
         (
             "https://files.pythonhosted.org/demo-0.1.0.tar.gz",
-            "/cache/demo-0.1.0.tar.gz",
+            "demo-0.1.0.tar.gz",
             True,
         ),
         (
             "https://example.com/demo-0.1.0-cp38-cp38-macosx_10_15_x86_64.whl",
-            "/cache/demo-0.1.0-cp38-cp38-macosx_10_15_x86_64.whl",
+            "demo-0.1.0-cp38-cp38-macosx_10_15_x86_64.whl",
             True,
         ),
     ],
 )
 def test_get_found_cached_archive_for_link(
-    mocker: MockerFixture,
+    tmp_path: Path,
     link: str,
     cached: str,
     strict: bool,
@@ -309,22 +415,20 @@ def test_get_found_cached_archive_for_link(
             Tag("py3", "none", "any"),
         ],
     )
-    cache = ArtifactCache(cache_dir=Path())
-
-    mocker.patch.object(
-        cache,
-        "_get_cached_archives",
-        return_value=[
-            Path("/cache/demo-0.1.0-py2.py3-none-any"),
-            Path("/cache/demo-0.1.0.tar.gz"),
-            Path("/cache/demo-0.1.0-cp38-cp38-macosx_10_15_x86_64.whl"),
-            Path("/cache/demo-0.1.0-cp37-cp37-macosx_10_15_x86_64.whl"),
-        ],
-    )
+    cache = ArtifactCache(cache_dir=tmp_path)
+    cache_dir = cache.get_cache_directory_for_link(Link(link))
+    cache_dir.mkdir(parents=True)
+    for filename in [
+        "demo-0.1.0-py2.py3-none-any",
+        "demo-0.1.0.tar.gz",
+        "demo-0.1.0-cp38-cp38-macosx_10_15_x86_64.whl",
+        "demo-0.1.0-cp37-cp37-macosx_10_15_x86_64.whl",
+    ]:
+        (cache_dir / filename).touch()
 
     archive = cache.get_cached_archive_for_link(Link(link), strict=strict, env=env)
 
-    assert Path(cached) == archive
+    assert archive == cache_dir / cached
 
 
 def test_get_cached_archive_for_link_no_race_condition(
@@ -367,3 +471,308 @@ def test_get_cached_archive_for_git() -> None:
     cache = ArtifactCache(cache_dir=Path())
     archive = cache.get_cached_archive_for_git("url", "ref", "subdirectory", MockEnv())
     assert archive is None
+
+
+def test_prune(mocker: MockerFixture) -> None:
+    now = 1_000_000
+    mocker.patch("time.time", return_value=now)
+    removed: list[str] = []
+    entries = [
+        CacheEntry(now - 5000, 10, lambda: removed.append("old")),
+        CacheEntry(now - 4000, 20, lambda: removed.append("older-than-new")),
+        CacheEntry(now - 6000, 30, lambda: removed.append("oldest")),
+        CacheEntry(now - 60, 40, lambda: removed.append("recent")),
+    ]
+
+    pruned = prune(entries, 50)
+
+    # the least recently used entries are removed first
+    assert removed == ["oldest", "old", "older-than-new"]
+    assert pruned == [entries[2], entries[0], entries[1]]
+
+    # recently used entries are kept even if the size is exceeded
+    removed.clear()
+    assert prune(entries[3:], 10) == []
+    assert prune(entries[3:], 10, keep_recent=30) == [entries[3]]
+    assert removed == ["recent"]
+
+
+@pytest.mark.parametrize("cache_class", [FileCache, SQLiteCache])
+def test_cache_entries(
+    repository_cache_dir: Path, cache_class: type[FileCache[Any]]
+) -> None:
+    cache: FileCache[Any] = cache_class(repository_cache_dir / "cache")
+    cache.put("key1", "value1")
+    cache.put("key2", "value2")
+
+    entries = cache.entries()
+
+    assert len(entries) == 2
+    assert all(entry.size > len("value1") for entry in entries)
+
+    for entry in entries:
+        entry.remove()
+
+    assert cache.get("key1") is None
+    assert cache.get("key2") is None
+
+
+def test_file_cache_get_updates_access_time(repository_cache_dir: Path) -> None:
+    cache: FileCache[Any] = FileCache(repository_cache_dir / "cache")
+    cache.put("key1", "value1")
+    os.utime(cache._path("key1"), (1_000_000, 1_000_000))
+
+    assert cache.entries()[0].accessed == 1_000_000
+
+    cache.get("key1")
+
+    assert cache.entries()[0].accessed > 1_000_000
+
+
+def test_sqlite_cache_get_updates_access_time(
+    repository_cache_dir: Path, mocker: MockerFixture
+) -> None:
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+    start_time = 1_000_000
+    time_mock = mocker.patch("time.time", return_value=start_time)
+    cache.put("key1", "value1")
+    cache.put("key2", "value2")
+
+    def accessed() -> list[float]:
+        return sorted(entry.accessed for entry in cache.entries())
+
+    # the access time is only updated if it is outdated
+    time_mock.return_value = start_time + 60
+    cache.get("key1")
+    assert accessed() == [start_time, start_time]
+
+    time_mock.return_value = start_time + SQLiteCache.ACCESS_RESOLUTION + 1
+    cache.get("key1")
+    assert accessed() == [start_time, time_mock.return_value]
+
+    cache.get_many(["key1", "key2"])
+    assert accessed() == [time_mock.return_value, time_mock.return_value]
+
+
+def test_artifact_cache_entries(tmp_path: Path) -> None:
+    cache = ArtifactCache(cache_dir=tmp_path)
+    link = Link("https://files.pythonhosted.org/demo-0.1.0.tar.gz")
+    cache_dir = cache.get_cache_directory_for_link(link)
+    cache_dir.mkdir(parents=True)
+    (cache_dir / link.filename).write_bytes(b"a" * 100)
+    (cache_dir / "demo-0.1.0-py3-none-any.whl").write_bytes(b"a" * 50)
+    os.utime(cache_dir, (1_000_000, 1_000_000))
+
+    entries = cache.entries()
+
+    assert [(entry.accessed, entry.size) for entry in entries] == [(1_000_000, 150)]
+
+    # using an archive updates the access time
+    assert cache.get_cached_archive_for_link(link, strict=True) is not None
+    assert cache.entries()[0].accessed > 1_000_000
+
+    entries[0].remove()
+
+    assert not cache_dir.exists()
+    assert not cache._get_manifest_path(cache_dir).exists()
+    assert cache.entries() == []
+
+
+def test_artifact_cache_manifest(tmp_path: Path, mocker: MockerFixture) -> None:
+    env = MockEnv(supported_tags=[Tag("cp38", "cp38", "linux_x86_64")])
+    cache = ArtifactCache(cache_dir=tmp_path)
+    link = Link("https://files.pythonhosted.org/demo-0.1.0.tar.gz")
+    cache_dir = cache.get_cache_directory_for_link(link)
+    cache_dir.mkdir(parents=True)
+    (cache_dir / link.filename).touch()
+    spy = mocker.spy(ArtifactCache, "_get_cached_archives")
+
+    assert cache.get_cached_archive_for_link(link, strict=True) is not None
+    assert cache.get_cached_archive_for_link(link, strict=False, env=env) == (
+        cache_dir / link.filename
+    )
+    # the manifest is persisted and used by other instances
+    other_cache = ArtifactCache(cache_dir=tmp_path)
+    assert other_cache.get_cached_archive_for_link(link, strict=True) is not None
+    assert spy.call_count == 1
+    assert cache._get_manifest_path(cache_dir).exists()
+
+    # the manifest is rebuilt if the directory has been modified
+    wheel = cache_dir / "demo-0.1.0-cp38-cp38-linux_x86_64.whl"
+    wheel.touch()
+    os.utime(cache_dir, ns=(0, cache_dir.stat().st_mtime_ns + 1))
+
+    assert cache.get_cached_archive_for_link(link, strict=False, env=env) == wheel
+    assert other_cache.get_cached_archive_for_link(link, strict=False, env=env) == (
+        wheel
+    )
+    assert spy.call_count == 2
+
+
+def test_artifact_cache_get_file_hash(tmp_path: Path, mocker: MockerFixture) -> None:
+    cache = ArtifactCache(cache_dir=tmp_path)
+    link = Link("https://files.pythonhosted.org/demo-0.1.0.tar.gz")
+    cache_dir = cache.get_cache_directory_for_link(link)
+    cache_dir.mkdir(parents=True)
+    archive = cache_dir / link.filename
+    archive.write_bytes(b"demo")
+    spy = mocker.patch("poetry.utils.cache.get_file_hash", wraps=get_file_hash)
+
+    expected = hashlib.sha256(b"demo").hexdigest()
+    assert cache.get_file_hash(archive) == expected
+    assert cache.get_file_hash(archive) == expected
+    assert ArtifactCache(cache_dir=tmp_path).get_file_hash(archive) == expected
+    assert spy.call_count == 1
+
+    # the hash is computed again if the archive has been replaced
+    archive.write_bytes(b"other")
+    os.utime(archive, ns=(0, archive.stat().st_mtime_ns + 1))
+
+    assert cache.get_file_hash(archive) == hashlib.sha256(b"other").hexdigest()
+    assert spy.call_count == 2
+
+
+def test_artifact_cache_stores_identical_archives_once(tmp_path: Path) -> None:
+    cache = ArtifactCache(cache_dir=tmp_path)
+    links = [
+        Link(f"https://{host}/demo-0.1.0-py3-none-any.whl")
+        for host in ("mirror1.example.org", "mirror2.example.org")
+    ]
+
+    def download(_: str, dest: Path) -> None:
+        dest.write_bytes(b"a" * 100)
+
+    archives = [
+        cache.get_cached_archive_for_link(link, strict=True, download_func=download)
+        for link in links
+    ]
+
+    assert archives[0] != archives[1]
+    assert archives[0].samefile(archives[1])
+    stored_archive = cache._get_store_path(hashlib.sha256(b"a" * 100).hexdigest())
+    assert stored_archive.samefile(archives[0])
+    # the hash is recorded and does not need to be computed again
+    assert cache.get_file_hash(archives[1]) == stored_archive.name
+
+    # the size of the stored archive is shared by both directories
+    entries = cache.entries()
+    manifest_sizes = [
+        cache._get_manifest_path(archive.parent).stat().st_size for archive in archives
+    ]
+    assert sorted(entry.size for entry in entries) == sorted(
+        50 + size for size in manifest_sizes
+    )
+
+    entries[0].remove()
+    assert stored_archive.exists()
+
+    entries[1].remove()
+    assert not stored_archive.exists()
+    assert cache.entries() == []
+
+
+def test_artifact_cache_entries_include_unused_stored_archives(
+    tmp_path: Path,
+) -> None:
+    cache = ArtifactCache(cache_dir=tmp_path)
+    stored_archive = cache._get_store_path(hashlib.sha256(b"a").hexdigest())
+    stored_archive.parent.mkdir(parents=True)
+    stored_archive.write_bytes(b"a")
+
+    entries = cache.entries()
+
+    assert [entry.size for entry in entries] == [1]
+
+    entries[0].remove()
+
+    assert not stored_archive.exists()
+
+
+def test_artifact_cache_records_hashes_of_download(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    cache = ArtifactCache(cache_dir=tmp_path)
+    link = Link("https://files.pythonhosted.org/demo-0.1.0.tar.gz")
+    content = b"demo"
+    hashes = {
+        "sha256": hashlib.sha256(content).hexdigest(),
+        "md5": hashlib.md5(content).hexdigest(),
+    }
+
+    def download(_: str, dest: Path) -> dict[str, str]:
+        dest.write_bytes(content)
+        return hashes
+
+    spy = mocker.patch("poetry.utils.cache.get_file_hash", wraps=get_file_hash)
+
+    archive = cache.get_cached_archive_for_link(
+        link, strict=True, download_func=download
+    )
+
+    assert cache._get_store_path(hashes["sha256"]).samefile(archive)
+    # the hashes computed while downloading are used
+    assert cache.get_file_hash(archive) == hashes["sha256"]
+    assert cache.get_file_hash(archive, "md5") == hashes["md5"]
+    assert spy.call_count == 0
+
+
+def test_artifact_cache_replaces_corrupt_stored_archive(tmp_path: Path) -> None:
+    cache = ArtifactCache(cache_dir=tmp_path)
+    link = Link("https://files.pythonhosted.org/demo-0.1.0-py3-none-any.whl")
+    content = b"a" * 100
+    file_hash = hashlib.sha256(content).hexdigest()
+    stored_archive = cache._get_store_path(file_hash)
+    stored_archive.parent.mkdir(parents=True)
+    # same size, different content
+    stored_archive.write_bytes(b"b" * 100)
+
+    def download(_: str, dest: Path) -> dict[str, str]:
+        dest.write_bytes(content)
+        return {"sha256": file_hash}
+
+    archive = cache.get_cached_archive_for_link(
+        link, strict=True, download_func=download
+    )
+
+    assert archive.read_bytes() == content
+    assert stored_archive.samefile(archive)
+    assert cache.get_file_hash(archive) == file_hash
+
+
+def test_artifact_cache_get_file_hash_detects_rewritten_archive(
+    tmp_path: Path,
+) -> None:
+    cache = ArtifactCache(cache_dir=tmp_path)
+    link = Link("https://files.pythonhosted.org/demo-0.1.0.tar.gz")
+    cache_dir = cache.get_cache_directory_for_link(link)
+    cache_dir.mkdir(parents=True)
+    archive = cache_dir / link.filename
+    archive.write_bytes(b"demo")
+    assert cache.get_file_hash(archive) == hashlib.sha256(b"demo").hexdigest()
+
+    # rewritten in place within the same tick of the modification time
+    stat = archive.stat()
+    time.sleep(0.01)
+    archive.write_bytes(b"omed")
+    os.utime(archive, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    assert cache.get_file_hash(archive) == hashlib.sha256(b"omed").hexdigest()
+
+
+def test_artifact_cache_get_file_hash_with_coarse_timestamps(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    cache = ArtifactCache(cache_dir=tmp_path)
+    link = Link("https://files.pythonhosted.org/demo-0.1.0.tar.gz")
+    cache_dir = cache.get_cache_directory_for_link(link)
+    cache_dir.mkdir(parents=True)
+    archive = cache_dir / link.filename
+    archive.write_bytes(b"demo")
+    mocker.patch("poetry.utils.cache._has_coarse_timestamps", return_value=True)
+    spy = mocker.patch("poetry.utils.cache.get_file_hash", wraps=get_file_hash)
+
+    expected = hashlib.sha256(b"demo").hexdigest()
+    assert cache.get_file_hash(archive) == expected
+    assert cache.get_file_hash(archive) == expected
+    # the recorded hash is not trusted
+    assert spy.call_count == 2
@@ -144,10 +144,11 @@ def test_download_file(
     http.register_uri(http.GET, url, body=file_path.read_bytes())
     dest = tmp_path / "demo-0.1.0.tar.gz"
 
-    download_file(url, dest)
+    hashes = download_file(url, dest, hash_names=["sha256", "md5"])
 
     expect_sha_256 = "9fa123ad707a5c6c944743bf3e11a0e80d86cb518d3cf25320866ca3ef43e2ad"
     assert get_file_hash(dest) == expect_sha_256
+    assert hashes == {"sha256": expect_sha_256, "md5": get_file_hash(dest, "md5")}
     assert http.last_request().headers["Accept-Encoding"] == "Identity"
 
 
@@ -175,10 +176,14 @@ def test_download_file_recover_from_error(
     http.register_uri(http.GET, url, body=handle_request)
     dest = tmp_path / "demo-0.1.0.tar.gz"
 
-    download_file(url, dest, chunk_size=file_length // 2, max_retries=1)
+    hashes = download_file(
+        url, dest, chunk_size=file_length // 2, max_retries=1, hash_names=["sha256"]
+    )
 
     expect_sha_256 = "9fa123ad707a5c6c944743bf3e11a0e80d86cb518d3cf25320866ca3ef43e2ad"
     assert get_file_hash(dest) == expect_sha_256
+    # the hash of a resumed download is computed correctly
+    assert hashes == {"sha256": expect_sha_256}
     assert http.last_request().headers["Accept-Encoding"] == "Identity"
     assert http.last_request().headers["Range"] == f"bytes={file_length // 2}-"
 
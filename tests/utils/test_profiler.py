@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import threading
+
+from typing import TYPE_CHECKING
+
+from poetry.utils import profiler
+from poetry.utils.profiler import Profiler
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_profile_and_count_without_active_profiler() -> None:
+    assert profiler.get_profiler() is None
+
+    with profiler.profile("phase"):
+        profiler.count("event")
+
+
+def test_profiler_records_phases_and_counts(mocker: MockerFixture) -> None:
+    times = iter(range(100))
+    mocker.patch("time.perf_counter", side_effect=lambda: float(next(times)))
+
+    p = Profiler()
+    with p.activate():
+        assert profiler.get_profiler() is p
+        with profiler.profile("outer"):
+            with profiler.profile("inner", "foo"):
+                profiler.count("event")
+            with profiler.profile("inner", "bar"):
+                profiler.count("event")
+            with profiler.profile("inner", "foo"):
+                pass
+
+    assert profiler.get_profiler() is None
+    assert p.to_json() == {
+        "duration": 9.0,
+        "phases": {
+            "inner": {"total": 3.0, "self": 3.0, "calls": 3},
+            "outer": {"total": 7.0, "self": 4.0, "calls": 1},
+        },
+        "counts": {"event": 2},
+        "packages": {"foo": {"inner": 2.0}, "bar": {"inner": 1.0}},
+    }
+
+
+def test_profiler_speedscope_trace(mocker: MockerFixture) -> None:
+    times = iter(range(100))
+    mocker.patch("time.perf_counter", side_effect=lambda: float(next(times)))
+
+    p = Profiler()
+    with p.activate(), profiler.profile("outer"), profiler.profile("inner", "foo"):
+        pass
+
+    trace = p.to_speedscope("test")
+
+    assert trace["shared"] == {"frames": [{"name": "outer"}, {"name": "inner (foo)"}]}
+    assert trace["profiles"] == [
+        {
+            "type": "evented",
+            "name": "test",
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": 5.0,
+            "events": [
+                {"type": "O", "frame": 0, "at": 1.0},
+                {"type": "O", "frame": 1, "at": 2.0},
+                {"type": "C", "frame": 1, "at": 3.0},
+                {"type": "C", "frame": 0, "at": 4.0},
+            ],
+        }
+    ]
+
+
+def test_profiler_only_records_phases_of_its_thread() -> None:
+    p = Profiler()
+
+    def target() -> None:
+        with profiler.profile("phase"):
+            profiler.count("event")
+
+    with p.activate():
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+
+    result = p.to_json()
+    assert result["phases"] == {}
+    assert result["counts"] == {"event": 1}